@@ -3,6 +3,7 @@
 Supports ``python -m resa_pro.cli`` as an alternative to the ``resa`` entry point.
 """
 
+from resa_pro.cli._console import get_console
 from resa_pro.cli.main import cli, main
 
-__all__ = ["cli", "main"]
+__all__ = ["cli", "get_console", "main"]
@@ -0,0 +1,68 @@
+"""Shared Rich console and machine-readable output for CLI commands."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_DEFAULT_CONSOLE: Console | None = None
+
+
+def get_console() -> Console:
+    """Return the process-wide default console, creating it on first use.
+
+    Terminal detection and colour-system probing happen once instead of
+    in every command that runs without a console in ``ctx.obj``.
+    """
+    global _DEFAULT_CONSOLE
+    if _DEFAULT_CONSOLE is None:
+        from rich.console import Console
+
+        _DEFAULT_CONSOLE = Console()
+    return _DEFAULT_CONSOLE
+
+
+def _to_builtin(obj: Any) -> Any:
+    """JSON fallback for numpy arrays and scalars (anything with ``tolist``)."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode *data* as JSON bytes, with orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(data, indent=2 if indent else None, default=_to_builtin).encode()
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=_to_builtin, option=option)
+
+
+def emit_json(data: Any) -> None:
+    """Write *data* to stdout as a single JSON document, bypassing Rich.
+
+    Used by the root ``--json`` flag.  Numpy arrays and scalars are
+    accepted; orjson is used when installed.
+    """
+    import click
+
+    click.echo(_dumps(data))
+
+
+def write_json(data: Any, path: str | Path) -> None:
+    """Write *data* to *path* as indented JSON for ``--output`` files.
+
+    The document is encoded in one call (orjson when installed) and
+    written as bytes, instead of ``json.dump`` streaming many small
+    chunks through a text file.
+    """
+    Path(path).write_bytes(_dumps(data, indent=True))
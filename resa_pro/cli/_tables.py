@@ -0,0 +1,105 @@
+"""Shared Rich table builders for CLI commands."""
+
+from __future__ import annotations
+
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions, RenderResult
+    from rich.table import Table
+    from rich.text import Text
+
+
+class PlainTable:
+    """Lightweight stand-in for a parameter table when stdout is not a terminal.
+
+    Collects rows like :class:`rich.table.Table` but renders them as a title
+    line followed by tab-separated rows, skipping Rich's layout and
+    box-drawing passes.  Intended for piping CLI output into other tools.
+    """
+
+    def __init__(self, title: str, headers: tuple[str, str, str]) -> None:
+        self.title = title
+        self.headers = headers
+        self.rows: list[tuple[Any, ...]] = []
+
+    def add_row(self, *cells: Any) -> None:
+        """Append a row; blank separator rows are dropped on render."""
+        self.rows.append(cells)
+
+    def to_text(self) -> str:
+        """Return the tab-separated representation of the table."""
+        lines = [self.title, "\t".join(self.headers)]
+        for row in self.rows:
+            cells = [_plain_cell(c) for c in row]
+            if any(cells):
+                lines.append("\t".join(cells))
+        return "\n".join(lines) + "\n"
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        from rich.segment import Segment
+
+        yield Segment(self.to_text())
+
+
+def _plain_cell(cell: Any) -> str:
+    """Strip Rich markup/styling from a table cell."""
+    if hasattr(cell, "plain"):
+        return str(cell.plain)
+    text = str(cell)
+    if "[" in text:
+        from rich.markup import render
+
+        return render(text).plain
+    return text
+
+
+@cache
+def styled_text(label: str, style: str = "bold") -> Text:
+    """Return a cached, pre-styled :class:`rich.text.Text` cell.
+
+    Passing ``Text`` objects to ``add_row`` / ``print`` skips Rich's markup
+    parser, and caching them means repeated section headers and status
+    labels are only built once per process.  Treat the result as read-only.
+
+    Args:
+        label: Cell text (no markup).
+        style: Rich style string applied to the whole label.
+
+    Returns:
+        Shared ``Text`` instance.
+    """
+    from rich.text import Text
+
+    return Text(label, style=style)
+
+
+def make_param_table(
+    title: str,
+    headers: tuple[str, str, str] = ("Parameter", "Value", "Unit"),
+) -> Table | PlainTable:
+    """Create the standard three-column Parameter / Value / Unit table.
+
+    When stdout is not a terminal a :class:`PlainTable` is returned
+    instead, which prints the same rows as tab-separated text.
+
+    Args:
+        title: Table title.
+        headers: Column headers, in label / value / unit order.
+
+    Returns:
+        Empty table with the label, value and unit columns configured.
+    """
+    if not sys.stdout.isatty():
+        return PlainTable(title, headers)
+
+    from rich.table import Table
+
+    label, value, unit = headers
+    table = Table(title=title)
+    table.add_column(label, style="cyan")
+    table.add_column(value, style="green", justify="right", no_wrap=True)
+    table.add_column(unit, style="dim", no_wrap=True)
+    return table
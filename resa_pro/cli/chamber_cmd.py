@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from math import degrees
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from resa_pro.core.chamber import size_chamber_from_thrust, size_chamber_from_dimensions
-from resa_pro.core.config import DesignState, ProjectMeta, save_design_json
+from resa_pro.cli._console import emit_json, get_console
+from resa_pro.cli._tables import make_param_table
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# (label, unit, formatter) rows of the chamber results table
+_CHAMBER_ROWS = (
+    ("Throat Diameter", "mm", lambda g: f"{g.throat_diameter * 1e3:.2f}"),
+    ("Throat Area", "cm²", lambda g: f"{g.throat_area * 1e4:.4f}"),
+    ("Chamber Diameter", "mm", lambda g: f"{g.chamber_diameter * 1e3:.2f}"),
+    ("Chamber Length", "mm", lambda g: f"{g.chamber_length * 1e3:.2f}"),
+    ("Contraction Ratio", "—", lambda g: f"{g.contraction_ratio:.2f}"),
+    ("L*", "m", lambda g: f"{g.l_star:.3f}"),
+    ("Chamber Volume", "cm³", lambda g: f"{g.chamber_volume * 1e6:.2f}"),
+    ("Convergent Length", "mm", lambda g: f"{g.convergent_length * 1e3:.2f}"),
+)
 
 
 @click.command("chamber")
@@ -60,7 +73,10 @@ def chamber(
     output: str | None,
 ) -> None:
     """Size a combustion chamber from thrust/Pc or direct dimensions."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.chamber import size_chamber_from_dimensions, size_chamber_from_thrust
+    from resa_pro.core.config import DesignState, ProjectMeta, save_design_json
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     if throat_diameter is not None:
         # Direct sizing mode
@@ -69,7 +85,7 @@ def chamber(
             contraction_ratio=cr,
             l_star=l_star,
         )
-        console.print(f"\n[bold]RESA Pro — Chamber Sizing (direct)[/bold]\n")
+        heading = "Chamber Sizing (direct)"
     elif thrust is not None and pc is not None:
         geom = size_chamber_from_thrust(
             thrust=thrust,
@@ -80,33 +96,44 @@ def chamber(
             l_star=l_star,
             contraction_ratio=cr,
         )
-        console.print(f"\n[bold]RESA Pro — Chamber Sizing[/bold]\n")
+        heading = "Chamber Sizing"
     else:
         console.print(
             "[red]Error:[/red] Provide either --thrust and --pc, or --throat-diameter."
         )
         raise SystemExit(1)
 
+    chamber_data = {
+        "throat_diameter": geom.throat_diameter,
+        "throat_area": geom.throat_area,
+        "chamber_diameter": geom.chamber_diameter,
+        "chamber_length": geom.chamber_length,
+        "contraction_ratio": geom.contraction_ratio,
+        "l_star": geom.l_star,
+        "chamber_volume": geom.chamber_volume,
+        "convergent_length": geom.convergent_length,
+        "convergent_half_angle_deg": degrees(geom.convergent_half_angle),
+        "throat_upstream_radius": geom.throat_upstream_radius,
+        "throat_downstream_radius": geom.throat_downstream_radius,
+        "mass_flow": geom.mass_flow,
+    }
+
     # Display results
-    table = Table(title="Chamber Design Results")
-    table.add_column("Parameter", style="cyan")
-    table.add_column("Value", style="green", justify="right")
-    table.add_column("Unit", style="dim")
+    json_out = ctx.obj.get("json_out")
+    if json_out:
+        emit_json({"chamber": chamber_data, "mixture_ratio": geom.mixture_ratio})
+    elif not ctx.obj.get("quiet"):
+        console.print(f"\n[bold]RESA Pro — {heading}[/bold]\n")
+        table = make_param_table("Chamber Design Results")
 
-    table.add_row("Throat Diameter", f"{geom.throat_diameter * 1e3:.2f}", "mm")
-    table.add_row("Throat Area", f"{geom.throat_area * 1e4:.4f}", "cm²")
-    table.add_row("Chamber Diameter", f"{geom.chamber_diameter * 1e3:.2f}", "mm")
-    table.add_row("Chamber Length", f"{geom.chamber_length * 1e3:.2f}", "mm")
-    table.add_row("Contraction Ratio", f"{geom.contraction_ratio:.2f}", "—")
-    table.add_row("L*", f"{geom.l_star:.3f}", "m")
-    table.add_row("Chamber Volume", f"{geom.chamber_volume * 1e6:.2f}", "cm³")
-    table.add_row("Convergent Length", f"{geom.convergent_length * 1e3:.2f}", "mm")
-    if geom.mass_flow > 0:
-        table.add_row("Mass Flow Rate", f"{geom.mass_flow:.4f}", "kg/s")
-    if geom.mixture_ratio > 0:
-        table.add_row("Mixture Ratio (O/F)", f"{geom.mixture_ratio:.2f}", "—")
+        for label, unit, fmt in _CHAMBER_ROWS:
+            table.add_row(label, fmt(geom), unit)
+        if geom.mass_flow > 0:
+            table.add_row("Mass Flow Rate", f"{geom.mass_flow:.4f}", "kg/s")
+        if geom.mixture_ratio > 0:
+            table.add_row("Mixture Ratio (O/F)", f"{geom.mixture_ratio:.2f}", "—")
 
-    console.print(table)
+        console.print(table)
 
     # Save to file
     if output:
@@ -117,22 +144,8 @@ def chamber(
             mixture_ratio=mr or geom.mixture_ratio,
             chamber_pressure=pc or 0.0,
             thrust=thrust or 0.0,
-            chamber={
-                "throat_diameter": geom.throat_diameter,
-                "throat_area": geom.throat_area,
-                "chamber_diameter": geom.chamber_diameter,
-                "chamber_length": geom.chamber_length,
-                "contraction_ratio": geom.contraction_ratio,
-                "l_star": geom.l_star,
-                "chamber_volume": geom.chamber_volume,
-                "convergent_length": geom.convergent_length,
-                "convergent_half_angle_deg": geom.convergent_half_angle * 180 / 3.14159,
-                "throat_upstream_radius": geom.throat_upstream_radius,
-                "throat_downstream_radius": geom.throat_downstream_radius,
-                "mass_flow": geom.mass_flow,
-                "contour_x": geom.contour_x.tolist(),
-                "contour_y": geom.contour_y.tolist(),
-            },
+            chamber={**chamber_data, "contour_x": geom.contour_x, "contour_y": geom.contour_y},
         )
         save_design_json(state, output)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
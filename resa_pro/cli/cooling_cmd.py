@@ -2,13 +2,44 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
-from rich.table import Table
 
-from resa_pro.core.config import DesignState, load_design_json, save_design_json
-from resa_pro.core.cooling import analyze_regen_cooling
-from resa_pro.core.thermo import lookup_combustion
+from resa_pro.cli._console import emit_json, get_console
+from resa_pro.cli._tables import make_param_table
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Coolant properties (simplified constant-property values)
+_COOLANT_PROPS = MappingProxyType({
+    "ethanol": MappingProxyType({"cp": 2440.0, "rho": 789.0, "mu": 1.2e-3, "k": 0.17}),
+    "water": MappingProxyType({"cp": 4186.0, "rho": 998.0, "mu": 1.0e-3, "k": 0.60}),
+    "rp1": MappingProxyType({"cp": 2010.0, "rho": 810.0, "mu": 1.6e-3, "k": 0.12}),
+    "methane": MappingProxyType({"cp": 3480.0, "rho": 422.0, "mu": 1.2e-4, "k": 0.19}),
+})
+
+# Wall thermal conductivity [W/(m·K)]
+_WALL_K = MappingProxyType({
+    "copper": 350.0,
+    "steel": 16.0,
+    "inconel": 11.4,
+})
+
+# Approximate gas-side wall temperature limits [K]
+_MATERIAL_LIMITS = MappingProxyType({"copper": 800, "steel": 1100, "inconel": 1250})
+
+# (label, unit, formatter) rows of the cooling summary taken from the analysis result
+_COOLING_RESULT_ROWS = (
+    ("Coolant Outlet Temp", "K", lambda r: f"{r.coolant_outlet_temperature:.1f}"),
+    ("", "", lambda r: ""),
+    ("Max Wall Temp (gas side)", "K", lambda r: f"{r.max_wall_temperature:.0f}"),
+    ("Max Heat Flux", "MW/m²", lambda r: f"{r.max_heat_flux / 1e6:.2f}"),
+    ("Total Heat Load", "kW", lambda r: f"{r.total_heat_load / 1e3:.2f}"),
+    ("Total Pressure Drop", "bar", lambda r: f"{r.total_pressure_drop / 1e5:.2f}"),
+)
 
 
 @click.command("cooling")
@@ -82,14 +113,15 @@ def cooling(
     output: str | None,
 ) -> None:
     """Analyze regenerative cooling for a chamber design."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.config import load_design_json
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     state = load_design_json(design)
 
     # Extract chamber contour
-    contour_x = state.chamber.get("contour_x")
-    contour_y = state.chamber.get("contour_y")
-    if contour_x is None or contour_y is None:
+    contour = state.contour("chamber")
+    if contour is None:
         # Try to re-generate from dimensions
         console.print(
             "[red]Error:[/red] Design file does not contain chamber contour data.\n"
@@ -97,10 +129,11 @@ def cooling(
         )
         raise SystemExit(1)
 
-    import numpy as np
+    from resa_pro.core.config import save_design_json
+    from resa_pro.core.cooling import analyze_regen_cooling
+    from resa_pro.core.thermo import lookup_combustion
 
-    contour_x = np.asarray(contour_x)
-    contour_y = np.asarray(contour_y)
+    contour_x, contour_y = contour
     throat_radius = state.chamber.get("throat_diameter", 0.0) / 2.0
 
     if throat_radius <= 0:
@@ -114,21 +147,7 @@ def cooling(
         console.print(f"[red]Error:[/red] {e}")
         raise SystemExit(1)
 
-    # Coolant properties (simplified constant-property values)
-    _COOLANT_PROPS = {
-        "ethanol": {"cp": 2440.0, "rho": 789.0, "mu": 1.2e-3, "k": 0.17},
-        "water": {"cp": 4186.0, "rho": 998.0, "mu": 1.0e-3, "k": 0.60},
-        "rp1": {"cp": 2010.0, "rho": 810.0, "mu": 1.6e-3, "k": 0.12},
-        "methane": {"cp": 3480.0, "rho": 422.0, "mu": 1.2e-4, "k": 0.19},
-    }
     props = _COOLANT_PROPS[coolant.lower()]
-
-    # Wall thermal conductivity
-    _WALL_K = {
-        "copper": 350.0,
-        "steel": 16.0,
-        "inconel": 11.4,
-    }
     k_wall = _WALL_K[wall_material.lower()]
 
     # Coolant mass flow = fraction of fuel flow
@@ -162,59 +181,62 @@ def cooling(
         wall_thickness=wall_thickness * 1e-3,
     )
 
-    console.print("\n[bold]RESA Pro — Regenerative Cooling Analysis[/bold]\n")
-
-    table = Table(title="Cooling Summary")
-    table.add_column("Parameter", style="cyan")
-    table.add_column("Value", style="green", justify="right")
-    table.add_column("Unit", style="dim")
-
-    table.add_row("Coolant", coolant.capitalize(), "—")
-    table.add_row("Wall Material", wall_material.capitalize(), "—")
-    table.add_row("Coolant Mass Flow", f"{coolant_mdot:.4f}", "kg/s")
-    table.add_row("Coolant Inlet Temp", f"{coolant_inlet_temp:.1f}", "K")
-    table.add_row("Coolant Outlet Temp", f"{result.coolant_outlet_temperature:.1f}", "K")
-    table.add_row("", "", "")
-    table.add_row("Max Wall Temp (gas side)", f"{result.max_wall_temperature:.0f}", "K")
-    table.add_row("Max Heat Flux", f"{result.max_heat_flux / 1e6:.2f}", "MW/m²")
-    table.add_row("Total Heat Load", f"{result.total_heat_load / 1e3:.2f}", "kW")
-    table.add_row("Total Pressure Drop", f"{result.total_pressure_drop / 1e5:.2f}", "bar")
-    table.add_row("", "", "")
-    table.add_row("Channel Width", f"{channel_width:.1f}", "mm")
-    table.add_row("Channel Height", f"{channel_height:.1f}", "mm")
-    table.add_row("Wall Thickness", f"{wall_thickness:.1f}", "mm")
-    table.add_row("Wall Conductivity", f"{k_wall:.1f}", "W/(m·K)")
-
-    console.print(table)
-
-    # Warning for high wall temperatures
-    _MATERIAL_LIMITS = {"copper": 800, "steel": 1100, "inconel": 1250}
+    cooling_data = {
+        "coolant": coolant,
+        "wall_material": wall_material,
+        "coolant_mass_flow": coolant_mdot,
+        "coolant_inlet_temp": coolant_inlet_temp,
+        "coolant_outlet_temp": result.coolant_outlet_temperature,
+        "max_wall_temperature": result.max_wall_temperature,
+        "max_heat_flux": result.max_heat_flux,
+        "total_heat_load": result.total_heat_load,
+        "total_pressure_drop": result.total_pressure_drop,
+        "channel_width": channel_width * 1e-3,
+        "channel_height": channel_height * 1e-3,
+        "wall_thickness": wall_thickness * 1e-3,
+        "wall_conductivity": k_wall,
+    }
     limit = _MATERIAL_LIMITS.get(wall_material.lower(), 1000)
-    if result.max_wall_temperature > limit:
-        console.print(
-            f"\n[red]WARNING:[/red] Peak wall temperature ({result.max_wall_temperature:.0f} K) "
-            f"exceeds {wall_material} limit (~{limit} K)."
-        )
-    else:
-        console.print(
-            f"\n[green]OK:[/green] Peak wall temperature within {wall_material} limits."
-        )
+
+    json_out = ctx.obj.get("json_out")
+    quiet = ctx.obj.get("quiet")
+    if json_out:
+        emit_json({**cooling_data, "wall_temperature_limit": limit})
+    elif not quiet:
+        console.print("\n[bold]RESA Pro — Regenerative Cooling Analysis[/bold]\n")
+
+        table = make_param_table("Cooling Summary")
+
+        table.add_row("Coolant", coolant.capitalize(), "—")
+        table.add_row("Wall Material", wall_material.capitalize(), "—")
+        table.add_row("Coolant Mass Flow", f"{coolant_mdot:.4f}", "kg/s")
+        table.add_row("Coolant Inlet Temp", f"{coolant_inlet_temp:.1f}", "K")
+        for label, unit, fmt in _COOLING_RESULT_ROWS:
+            table.add_row(label, fmt(result), unit)
+        table.add_row("", "", "")
+        table.add_row("Channel Width", f"{channel_width:.1f}", "mm")
+        table.add_row("Channel Height", f"{channel_height:.1f}", "mm")
+        table.add_row("Wall Thickness", f"{wall_thickness:.1f}", "mm")
+        table.add_row("Wall Conductivity", f"{k_wall:.1f}", "W/(m·K)")
+
+        console.print(table)
+
+    # Warning for high wall temperatures, shown even with --quiet (the JSON
+    # document carries the limit instead)
+    if not json_out:
+        if result.max_wall_temperature > limit:
+            console.print(
+                f"\n[red]WARNING:[/red] Peak wall temperature "
+                f"({result.max_wall_temperature:.0f} K) exceeds {wall_material} limit "
+                f"(~{limit} K)."
+            )
+        elif not quiet:
+            console.print(
+                f"\n[green]OK:[/green] Peak wall temperature within {wall_material} limits."
+            )
 
     if output:
-        state.cooling = {
-            "coolant": coolant,
-            "wall_material": wall_material,
-            "coolant_mass_flow": coolant_mdot,
-            "coolant_inlet_temp": coolant_inlet_temp,
-            "coolant_outlet_temp": result.coolant_outlet_temperature,
-            "max_wall_temperature": result.max_wall_temperature,
-            "max_heat_flux": result.max_heat_flux,
-            "total_heat_load": result.total_heat_load,
-            "total_pressure_drop": result.total_pressure_drop,
-            "channel_width": channel_width * 1e-3,
-            "channel_height": channel_height * 1e-3,
-            "wall_thickness": wall_thickness * 1e-3,
-            "wall_conductivity": k_wall,
-        }
+        state.cooling = cooling_data
         save_design_json(state, output)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
@@ -2,12 +2,67 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
-from rich.table import Table
 
-from resa_pro.core.config import DesignState, save_design_json
-from resa_pro.cycle.solver import CycleDefinition, CycleType, solve_cycle
+from resa_pro.cli._console import emit_json, get_console
+from resa_pro.cli._tables import make_param_table
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from resa_pro.cycle.solver import CyclePerformance
+
+# (label, unit, formatter) rows of the cycle result tables
+_PERF_ROWS = (
+    ("Cycle Type", "—", lambda r: r.cycle_type.replace("_", " ").title()),
+    ("Thrust", "N", lambda r: f"{r.thrust:.0f}"),
+    ("Chamber Pressure", "bar", lambda r: f"{r.chamber_pressure / 1e5:.1f}"),
+    ("Total Mass Flow", "kg/s", lambda r: f"{r.total_mass_flow:.3f}"),
+    ("Mixture Ratio (O/F)", "—", lambda r: f"{r.mixture_ratio:.2f}"),
+    ("Isp (delivered)", "s", lambda r: f"{r.Isp_delivered:.1f}"),
+    ("c*", "m/s", lambda r: f"{r.c_star:.0f}"),
+)
+_TURBOPUMP_ROWS = (
+    ("Total Pump Power", "kW", lambda r: f"{r.pump_power_total / 1e3:.2f}"),
+    ("Turbine Power", "kW", lambda r: f"{r.turbine_power_total / 1e3:.2f}"),
+    ("Power Balance Error", "W", lambda r: f"{r.power_balance_error:.1f}"),
+)
+_TANK_ROWS = (
+    ("Oxidizer Tank", "bar", lambda r: f"{r.tank_pressure_ox / 1e5:.1f}"),
+    ("Fuel Tank", "bar", lambda r: f"{r.tank_pressure_fuel / 1e5:.1f}"),
+)
+
+
+def _print_results(console: Console, cycle_type: str, result: CyclePerformance) -> None:
+    """Render the cycle performance, turbopump and tank pressure tables."""
+    console.print(f"\n[bold]RESA Pro — Cycle Analysis ({cycle_type})[/bold]\n")
+
+    # System performance table
+    perf_table = make_param_table("System Performance")
+
+    for label, unit, fmt in _PERF_ROWS:
+        perf_table.add_row(label, fmt(result), unit)
+
+    console.print(perf_table)
+
+    # Turbopump table (if applicable)
+    if result.pump_power_total > 0 or result.turbine_power_total > 0:
+        tp_table = make_param_table("Turbopump Power Balance")
+
+        for label, unit, fmt in _TURBOPUMP_ROWS:
+            tp_table.add_row(label, fmt(result), unit)
+
+        console.print(tp_table)
+
+    # Tank pressures
+    tank_table = make_param_table("Tank Pressures")
+
+    for label, unit, fmt in _TANK_ROWS:
+        tank_table.add_row(label, fmt(result), unit)
+
+    console.print(tank_table)
 
 
 @click.group("cycle")
@@ -54,7 +109,10 @@ def analyze_cmd(
     output: str | None,
 ) -> None:
     """Analyze an engine cycle architecture."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.config import DesignState, save_design_json
+    from resa_pro.cycle.solver import CycleDefinition, CycleType, solve_cycle
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     type_map = {
         "pressure-fed": CycleType.PRESSURE_FED,
@@ -79,63 +137,30 @@ def analyze_cmd(
 
     result = solve_cycle(defn)
 
-    console.print(f"\n[bold]RESA Pro — Cycle Analysis ({cycle_type})[/bold]\n")
-
-    # System performance table
-    perf_table = Table(title="System Performance")
-    perf_table.add_column("Parameter", style="cyan")
-    perf_table.add_column("Value", style="green", justify="right")
-    perf_table.add_column("Unit", style="dim")
-
-    perf_table.add_row("Cycle Type", result.cycle_type.replace("_", " ").title(), "—")
-    perf_table.add_row("Thrust", f"{result.thrust:.0f}", "N")
-    perf_table.add_row("Chamber Pressure", f"{result.chamber_pressure / 1e5:.1f}", "bar")
-    perf_table.add_row("Total Mass Flow", f"{result.total_mass_flow:.3f}", "kg/s")
-    perf_table.add_row("Mixture Ratio (O/F)", f"{result.mixture_ratio:.2f}", "—")
-    perf_table.add_row("Isp (delivered)", f"{result.Isp_delivered:.1f}", "s")
-    perf_table.add_row("c*", f"{result.c_star:.0f}", "m/s")
-
-    console.print(perf_table)
-
-    # Turbopump table (if applicable)
-    if result.pump_power_total > 0 or result.turbine_power_total > 0:
-        tp_table = Table(title="Turbopump Power Balance")
-        tp_table.add_column("Parameter", style="cyan")
-        tp_table.add_column("Value", style="green", justify="right")
-        tp_table.add_column("Unit", style="dim")
-
-        tp_table.add_row("Total Pump Power", f"{result.pump_power_total / 1e3:.2f}", "kW")
-        tp_table.add_row("Turbine Power", f"{result.turbine_power_total / 1e3:.2f}", "kW")
-        tp_table.add_row("Power Balance Error", f"{result.power_balance_error:.1f}", "W")
-
-        console.print(tp_table)
-
-    # Tank pressures
-    tank_table = Table(title="Tank Pressures")
-    tank_table.add_column("Parameter", style="cyan")
-    tank_table.add_column("Value", style="green", justify="right")
-    tank_table.add_column("Unit", style="dim")
-
-    tank_table.add_row("Oxidizer Tank", f"{result.tank_pressure_ox / 1e5:.1f}", "bar")
-    tank_table.add_row("Fuel Tank", f"{result.tank_pressure_fuel / 1e5:.1f}", "bar")
+    cycle_data = {
+        "cycle_type": result.cycle_type,
+        "thrust": result.thrust,
+        "chamber_pressure": result.chamber_pressure,
+        "total_mass_flow": result.total_mass_flow,
+        "mixture_ratio": result.mixture_ratio,
+        "Isp_delivered": result.Isp_delivered,
+        "c_star": result.c_star,
+        "pump_power_total": result.pump_power_total,
+        "turbine_power_total": result.turbine_power_total,
+        "power_balance_error": result.power_balance_error,
+        "tank_pressure_ox": result.tank_pressure_ox,
+        "tank_pressure_fuel": result.tank_pressure_fuel,
+    }
 
-    console.print(tank_table)
+    json_out = ctx.obj.get("json_out")
+    if json_out:
+        emit_json(cycle_data)
+    elif not ctx.obj.get("quiet"):
+        _print_results(console, cycle_type, result)
 
     if output:
         state = DesignState()
-        state.performance["cycle"] = {
-            "cycle_type": result.cycle_type,
-            "thrust": result.thrust,
-            "chamber_pressure": result.chamber_pressure,
-            "total_mass_flow": result.total_mass_flow,
-            "mixture_ratio": result.mixture_ratio,
-            "Isp_delivered": result.Isp_delivered,
-            "c_star": result.c_star,
-            "pump_power_total": result.pump_power_total,
-            "turbine_power_total": result.turbine_power_total,
-            "power_balance_error": result.power_balance_error,
-            "tank_pressure_ox": result.tank_pressure_ox,
-            "tank_pressure_fuel": result.tank_pressure_fuel,
-        }
+        state.performance["cycle"] = cycle_data
         save_design_json(state, output)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
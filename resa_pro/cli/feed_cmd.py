@@ -2,17 +2,48 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
-from rich.table import Table
-
-from resa_pro.core.config import DesignState, load_design_json, save_design_json
-from resa_pro.core.feed_system import (
-    compute_pressure_budget,
-    feed_line_pressure_drop,
-    size_pressurant_blowdown,
-    size_pressurant_regulated,
-    size_tank,
+
+from resa_pro.cli._console import emit_json, get_console
+from resa_pro.cli._tables import make_param_table, styled_text
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Pressurant gas properties: ratio of specific heats and molar mass [kg/mol]
+_GAS_PROPS = MappingProxyType({
+    "nitrogen": MappingProxyType({"gamma": 1.4, "M": 0.028}),
+    "helium": MappingProxyType({"gamma": 1.667, "M": 0.004}),
+})
+
+# (label, unit, formatter) rows of the feed system result tables
+_TANK_ROWS = (
+    ("Propellant Mass", "kg", lambda r: f"{r.propellant_mass:.2f}"),
+    ("Propellant Volume", "L", lambda r: f"{r.propellant_volume * 1e3:.2f}"),
+    ("Total Volume", "L", lambda r: f"{r.total_volume * 1e3:.2f}"),
+    ("Tank MEOP", "bar", lambda r: f"{r.tank_pressure / 1e5:.1f}"),
+    ("Inner Diameter", "mm", lambda r: f"{r.inner_diameter * 1e3:.1f}"),
+    ("Cylinder Length", "mm", lambda r: f"{r.cylinder_length * 1e3:.1f}"),
+    ("Wall Thickness", "mm", lambda r: f"{r.wall_thickness * 1e3:.2f}"),
+    ("Tank Mass (structure)", "kg", lambda r: f"{r.tank_mass:.3f}"),
+)
+_PRESSURANT_ROWS = (
+    ("Pressurant Mass", "kg", lambda r: f"{r.pressurant_mass:.3f}"),
+    ("Bottle Volume", "L", lambda r: f"{r.bottle_volume * 1e3:.2f}"),
+    ("Initial Pressure", "bar", lambda r: f"{r.bottle_pressure_initial / 1e5:.1f}"),
+    ("Final Pressure", "bar", lambda r: f"{r.bottle_pressure_final / 1e5:.1f}"),
+    ("Blowdown Ratio", "—", lambda r: f"{r.blowdown_ratio:.1f}"),
+)
+_BUDGET_ROWS = (
+    ("Chamber Pressure", "bar", lambda r: f"{r.chamber_pressure / 1e5:.1f}"),
+    ("Injector ΔP", "bar", lambda r: f"{r.injector_dp / 1e5:.2f}"),
+    ("Feed Line ΔP", "bar", lambda r: f"{r.feed_line_dp / 1e5:.2f}"),
+    ("Cooling ΔP", "bar", lambda r: f"{r.cooling_dp / 1e5:.2f}"),
+    ("Valve ΔP", "bar", lambda r: f"{r.valve_dp / 1e5:.2f}"),
+    ("Margin", "bar", lambda r: f"{r.margin / 1e5:.2f}"),
 )
 
 
@@ -78,7 +109,10 @@ def tank_cmd(
     output: str | None,
 ) -> None:
     """Size a propellant tank."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.config import DesignState, save_design_json
+    from resa_pro.core.feed_system import size_tank
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     result = size_tank(
         propellant_mass=mass,
@@ -92,41 +126,39 @@ def tank_cmd(
         propellant_name=name,
     )
 
-    console.print("\n[bold]RESA Pro — Tank Sizing[/bold]\n")
+    tank_data = {
+        "propellant": name,
+        "propellant_mass": mass,
+        "propellant_volume": result.propellant_volume,
+        "total_volume": result.total_volume,
+        "tank_pressure": pressure,
+        "inner_diameter": diameter,
+        "cylinder_length": result.cylinder_length,
+        "wall_thickness": result.wall_thickness,
+        "tank_mass": result.tank_mass,
+    }
 
-    table = Table(title="Tank Design")
-    table.add_column("Parameter", style="cyan")
-    table.add_column("Value", style="green", justify="right")
-    table.add_column("Unit", style="dim")
+    json_out = ctx.obj.get("json_out")
+    if json_out:
+        emit_json(tank_data)
+    elif not ctx.obj.get("quiet"):
+        console.print("\n[bold]RESA Pro — Tank Sizing[/bold]\n")
 
-    if name:
-        table.add_row("Propellant", name, "—")
-    table.add_row("Propellant Mass", f"{mass:.2f}", "kg")
-    table.add_row("Propellant Volume", f"{result.propellant_volume * 1e3:.2f}", "L")
-    table.add_row("Total Volume", f"{result.total_volume * 1e3:.2f}", "L")
-    table.add_row("Tank MEOP", f"{pressure / 1e5:.1f}", "bar")
-    table.add_row("Inner Diameter", f"{diameter * 1e3:.1f}", "mm")
-    table.add_row("Cylinder Length", f"{result.cylinder_length * 1e3:.1f}", "mm")
-    table.add_row("Wall Thickness", f"{result.wall_thickness * 1e3:.2f}", "mm")
-    table.add_row("Tank Mass (structure)", f"{result.tank_mass:.3f}", "kg")
+        table = make_param_table("Tank Design")
 
-    console.print(table)
+        if name:
+            table.add_row("Propellant", name, "—")
+        for label, unit, fmt in _TANK_ROWS:
+            table.add_row(label, fmt(result), unit)
+
+        console.print(table)
 
     if output:
         state = DesignState()
-        state.feed_system["tank"] = {
-            "propellant": name,
-            "propellant_mass": mass,
-            "propellant_volume": result.propellant_volume,
-            "total_volume": result.total_volume,
-            "tank_pressure": pressure,
-            "inner_diameter": diameter,
-            "cylinder_length": result.cylinder_length,
-            "wall_thickness": result.wall_thickness,
-            "tank_mass": result.tank_mass,
-        }
+        state.feed_system["tank"] = tank_data
         save_design_json(state, output)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
 
 
 @feed.command("pressurant")
@@ -173,15 +205,14 @@ def pressurant_cmd(
     output: str | None,
 ) -> None:
     """Size the pressurisation system."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.config import DesignState, save_design_json
+    from resa_pro.core.feed_system import size_pressurant_blowdown, size_pressurant_regulated
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     # Convert litres to m³
     V = tank_volume * 1e-3
 
-    _GAS_PROPS = {
-        "nitrogen": {"gamma": 1.4, "M": 0.028},
-        "helium": {"gamma": 1.667, "M": 0.004},
-    }
     gp = _GAS_PROPS[gas.lower()]
 
     if mode.lower() == "blowdown":
@@ -202,36 +233,37 @@ def pressurant_cmd(
             gas_name=gas,
         )
 
-    console.print(f"\n[bold]RESA Pro — Pressurant Sizing ({mode})[/bold]\n")
+    pressurant_data = {
+        "gas": gas,
+        "mode": mode,
+        "pressurant_mass": result.pressurant_mass,
+        "bottle_volume": result.bottle_volume,
+        "bottle_pressure_initial": result.bottle_pressure_initial,
+        "bottle_pressure_final": result.bottle_pressure_final,
+        "blowdown_ratio": result.blowdown_ratio,
+    }
 
-    table = Table(title="Pressurant System")
-    table.add_column("Parameter", style="cyan")
-    table.add_column("Value", style="green", justify="right")
-    table.add_column("Unit", style="dim")
+    json_out = ctx.obj.get("json_out")
+    if json_out:
+        emit_json(pressurant_data)
+    elif not ctx.obj.get("quiet"):
+        console.print(f"\n[bold]RESA Pro — Pressurant Sizing ({mode})[/bold]\n")
 
-    table.add_row("Gas", gas.capitalize(), "—")
-    table.add_row("Mode", mode.capitalize(), "—")
-    table.add_row("Pressurant Mass", f"{result.pressurant_mass:.3f}", "kg")
-    table.add_row("Bottle Volume", f"{result.bottle_volume * 1e3:.2f}", "L")
-    table.add_row("Initial Pressure", f"{result.bottle_pressure_initial / 1e5:.1f}", "bar")
-    table.add_row("Final Pressure", f"{result.bottle_pressure_final / 1e5:.1f}", "bar")
-    table.add_row("Blowdown Ratio", f"{result.blowdown_ratio:.1f}", "—")
+        table = make_param_table("Pressurant System")
 
-    console.print(table)
+        table.add_row("Gas", gas.capitalize(), "—")
+        table.add_row("Mode", mode.capitalize(), "—")
+        for label, unit, fmt in _PRESSURANT_ROWS:
+            table.add_row(label, fmt(result), unit)
+
+        console.print(table)
 
     if output:
         state = DesignState()
-        state.feed_system["pressurant"] = {
-            "gas": gas,
-            "mode": mode,
-            "pressurant_mass": result.pressurant_mass,
-            "bottle_volume": result.bottle_volume,
-            "bottle_pressure_initial": result.bottle_pressure_initial,
-            "bottle_pressure_final": result.bottle_pressure_final,
-            "blowdown_ratio": result.blowdown_ratio,
-        }
+        state.feed_system["pressurant"] = pressurant_data
         save_design_json(state, output)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
 
 
 @feed.command("budget")
@@ -264,7 +296,9 @@ def budget_cmd(
     margin: float,
 ) -> None:
     """Compute the system pressure budget."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.feed_system import compute_pressure_budget
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     result = compute_pressure_budget(
         chamber_pressure=pc,
@@ -275,20 +309,33 @@ def budget_cmd(
         margin_fraction=margin,
     )
 
+    if ctx.obj.get("json_out"):
+        emit_json({
+            "chamber_pressure": result.chamber_pressure,
+            "injector_dp": result.injector_dp,
+            "feed_line_dp": result.feed_line_dp,
+            "cooling_dp": result.cooling_dp,
+            "valve_dp": result.valve_dp,
+            "margin": result.margin,
+            "required_tank_pressure": result.required_tank_pressure,
+        })
+        return
+    if ctx.obj.get("quiet"):
+        return
+
+    from rich.text import Text
+
     console.print("\n[bold]RESA Pro — Pressure Budget[/bold]\n")
 
-    table = Table(title="Pressure Budget")
-    table.add_column("Item", style="cyan")
-    table.add_column("Pressure", style="green", justify="right")
-    table.add_column("Unit", style="dim")
-
-    table.add_row("Chamber Pressure", f"{pc / 1e5:.1f}", "bar")
-    table.add_row("Injector ΔP", f"{injector_dp / 1e5:.2f}", "bar")
-    table.add_row("Feed Line ΔP", f"{feed_line_dp / 1e5:.2f}", "bar")
-    table.add_row("Cooling ΔP", f"{cooling_dp / 1e5:.2f}", "bar")
-    table.add_row("Valve ΔP", f"{valve_dp / 1e5:.2f}", "bar")
-    table.add_row("Margin", f"{result.margin / 1e5:.2f}", "bar")
+    table = make_param_table("Pressure Budget", headers=("Item", "Pressure", "Unit"))
+
+    for label, unit, fmt in _BUDGET_ROWS:
+        table.add_row(label, fmt(result), unit)
     table.add_row("", "", "")
-    table.add_row("[bold]Required Tank Pressure[/bold]", f"[bold]{result.required_tank_pressure / 1e5:.1f}[/bold]", "bar")
+    table.add_row(
+        styled_text("Required Tank Pressure"),
+        Text(f"{result.required_tank_pressure / 1e5:.1f}", style="bold"),
+        "bar",
+    )
 
     console.print(table)
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
 
-from resa_pro.core.config import load_design_json
+from resa_pro.cli._console import emit_json, get_console
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 @click.command("export-stl")
@@ -46,51 +50,65 @@ def export_stl(
     stl_format: str,
 ) -> None:
     """Export a 3D STL model from chamber + nozzle contours."""
-    import numpy as np
-
+    from resa_pro.core.config import load_design_json
     from resa_pro.geometry3d.engine import (
         combine_contours,
         export_stl_ascii,
-        export_stl_binary,
+        revolve_and_write_stl_binary,
         revolve_contour,
     )
 
-    console: Console = ctx.obj.get("console", Console())
+    console: Console = ctx.obj.get("console") or get_console()
+    json_out = ctx.obj.get("json_out")
+    quiet = json_out or ctx.obj.get("quiet")
 
     state = load_design_json(design)
 
     # Get contours
-    ch_x = state.chamber.get("contour_x")
-    ch_y = state.chamber.get("contour_y")
-    nz_x = state.nozzle.get("contour_x")
-    nz_y = state.nozzle.get("contour_y")
+    chamber_contour = state.contour("chamber")
+    nozzle_contour = state.contour("nozzle")
 
-    if ch_x is None or ch_y is None:
+    if chamber_contour is None:
         console.print("[red]Error:[/red] Design file missing chamber contour data.")
         raise SystemExit(1)
 
-    ch_x = np.asarray(ch_x)
-    ch_y = np.asarray(ch_y)
+    ch_x, ch_y = chamber_contour
 
-    if nz_x is not None and nz_y is not None:
-        nz_x = np.asarray(nz_x)
-        nz_y = np.asarray(nz_y)
-        x, y = combine_contours(ch_x, ch_y, nz_x, nz_y)
-        console.print("[dim]Combined chamber + nozzle contour[/dim]")
+    if nozzle_contour is not None:
+        x, y = combine_contours(ch_x, ch_y, *nozzle_contour)
+        note = "Combined chamber + nozzle contour"
     else:
         x, y = ch_x, ch_y
-        console.print("[dim]Chamber contour only (no nozzle data)[/dim]")
-
-    mesh = revolve_contour(x, y, n_circumferential=segments)
+        note = "Chamber contour only (no nozzle data)"
+    if not quiet:
+        console.print(f"[dim]{note}[/dim]")
 
     if stl_format.lower() == "ascii":
+        mesh = revolve_contour(x, y, n_circumferential=segments)
         export_stl_ascii(mesh, output)
+        n_vertices, n_faces = mesh.n_vertices, mesh.n_faces
     else:
-        export_stl_binary(mesh, output)
+        # Stream triangles straight to disk without building the full mesh
+        with open(output, "wb") as fh:
+            n_vertices, n_faces = revolve_and_write_stl_binary(
+                x, y, fh, n_circumferential=segments
+            )
+
+    if json_out:
+        emit_json({
+            "output": output,
+            "format": stl_format.lower(),
+            "includes_nozzle": nozzle_contour is not None,
+            "n_vertices": n_vertices,
+            "n_faces": n_faces,
+        })
+        return
+    if quiet:
+        return
 
     console.print(
         f"\n[bold]RESA Pro — STL Export[/bold]\n\n"
-        f"  Vertices:  {mesh.n_vertices}\n"
-        f"  Faces:     {mesh.n_faces}\n"
+        f"  Vertices:  {n_vertices}\n"
+        f"  Faces:     {n_faces}\n"
         f"  Saved to:  {output}\n"
     )
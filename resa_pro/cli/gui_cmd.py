@@ -6,8 +6,11 @@ import click
 
 
 @click.command("gui")
-def gui() -> None:
+@click.pass_context
+def gui(ctx: click.Context) -> None:
     """Launch the RESA Pro desktop application."""
+    if ctx.obj and ctx.obj.get("json_out"):
+        raise click.UsageError("--json is not supported by the gui command.")
     try:
         from resa_pro.ui.app import run
 
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-import json
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
 
-from resa_pro.core.config import load_design_json
-from resa_pro.core.fluids import list_propellants, get_propellant_info
-from resa_pro.core.materials import list_materials, get_material_info
+from resa_pro.cli._console import emit_json, get_console
+from resa_pro.cli._tables import styled_text
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 @click.group("info")
@@ -26,40 +25,58 @@ def info(ctx: click.Context) -> None:
 @click.pass_context
 def info_design(ctx: click.Context, path: str) -> None:
     """Display summary of a design file."""
-    console: Console = ctx.obj.get("console", Console())
+    from rich.text import Text
+    from rich.tree import Tree
+
+    from resa_pro.core.config import load_design_json
+
+    console: Console = ctx.obj.get("console") or get_console()
     state = load_design_json(path)
 
-    tree = Tree(f"[bold]{state.meta.name}[/bold]")
-    meta = tree.add("[cyan]Metadata[/cyan]")
-    meta.add(f"Author: {state.meta.author or '—'}")
-    meta.add(f"Version: {state.meta.version}")
-    meta.add(f"Modified: {state.meta.modified or '—'}")
-
-    op = tree.add("[cyan]Operating Point[/cyan]")
-    op.add(f"Oxidizer: {state.oxidizer}")
-    op.add(f"Fuel: {state.fuel}")
-    op.add(f"Mixture Ratio: {state.mixture_ratio}")
-    op.add(f"Chamber Pressure: {state.chamber_pressure / 1e5:.1f} bar")
-    op.add(f"Thrust: {state.thrust:.0f} N")
-
-    if state.chamber:
-        ch = tree.add("[cyan]Chamber[/cyan]")
-        for k, v in state.chamber.items():
-            if k.startswith("contour"):
-                continue  # skip arrays
-            ch.add(f"{k}: {v}")
-
-    if state.nozzle:
-        nz = tree.add("[cyan]Nozzle[/cyan]")
-        for k, v in state.nozzle.items():
-            if k.startswith("contour"):
-                continue
-            nz.add(f"{k}: {v}")
-
-    if state.performance:
-        perf = tree.add("[cyan]Performance[/cyan]")
-        for k, v in state.performance.items():
-            perf.add(f"{k}: {v}")
+    if ctx.obj.get("json_out"):
+        from dataclasses import asdict
+
+        data = asdict(state)
+        for key in ("_array_data", "_contour_cache"):
+            data.pop(key, None)
+        for section in ("chamber", "nozzle"):
+            data[section] = {k: v for k, v in data[section].items() if not k.startswith("contour")}
+        emit_json(data)
+        return
+    if ctx.obj.get("quiet"):
+        return
+
+    sections: list[tuple[str, list[tuple[str, object]]]] = [
+        ("Metadata", [
+            ("Author", state.meta.author or "—"),
+            ("Version", state.meta.version),
+            ("Modified", state.meta.modified or "—"),
+        ]),
+        ("Operating Point", [
+            ("Oxidizer", state.oxidizer),
+            ("Fuel", state.fuel),
+            ("Mixture Ratio", state.mixture_ratio),
+            ("Chamber Pressure", f"{state.chamber_pressure / 1e5:.1f} bar"),
+            ("Thrust", f"{state.thrust:.0f} N"),
+        ]),
+    ]
+    for title, data in (
+        ("Chamber", state.chamber),
+        ("Nozzle", state.nozzle),
+        ("Performance", state.performance),
+    ):
+        if data:
+            # Contour arrays are skipped; they are not useful as text
+            rows = [(k, v) for k, v in data.items() if not k.startswith("contour")]
+            sections.append((title, rows))
+
+    # Text nodes throughout: no markup parsing, and values containing "["
+    # are shown verbatim
+    tree = Tree(Text(state.meta.name, style="bold"))
+    for title, items in sections:
+        branch = tree.add(styled_text(title, "cyan"))
+        for label, value in items:
+            branch.add(Text.assemble((f"{label}: ", "dim"), str(value)))
 
     console.print(tree)
 
@@ -68,21 +85,31 @@ def info_design(ctx: click.Context, path: str) -> None:
 @click.pass_context
 def info_propellants(ctx: click.Context) -> None:
     """List available propellants."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.fluids import get_propellant_info, list_propellants
+
+    if ctx.obj.get("json_out"):
+        emit_json({name: get_propellant_info(name) for name in list_propellants()})
+        return
+    if ctx.obj.get("quiet"):
+        return
+
+    from rich.table import Table
+    from rich.text import Text
+
+    console: Console = ctx.obj.get("console") or get_console()
     table = Table(title="Available Propellants")
     table.add_column("Name", style="cyan")
     table.add_column("Formula", style="green")
     table.add_column("Type", style="yellow")
     table.add_column("CoolProp Name", style="dim")
 
-    for name in list_propellants():
-        info = get_propellant_info(name)
-        table.add_row(
-            name,
-            info.get("formula", "—"),
-            info.get("type", "—"),
-            info.get("coolprop_name", "—"),
-        )
+    # Plain Text cells skip markup parsing (and keep formulas like "[CH2]" intact)
+    rows = [
+        (name, info.get("formula", "—"), info.get("type", "—"), info.get("coolprop_name", "—"))
+        for name, info in ((n, get_propellant_info(n)) for n in list_propellants())
+    ]
+    for row in rows:
+        table.add_row(*map(Text, row))
     console.print(table)
 
 
@@ -90,21 +117,29 @@ def info_propellants(ctx: click.Context) -> None:
 @click.pass_context
 def info_materials(ctx: click.Context) -> None:
     """List available materials."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.materials import get_material_info, list_materials
+
+    if ctx.obj.get("json_out"):
+        emit_json({mat_id: get_material_info(mat_id) for mat_id in list_materials()})
+        return
+    if ctx.obj.get("quiet"):
+        return
+
+    from rich.table import Table
+    from rich.text import Text
+
+    console: Console = ctx.obj.get("console") or get_console()
     table = Table(title="Available Materials")
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="green")
     table.add_column("Category", style="yellow")
-    table.add_column("Density [kg/m³]", justify="right")
-    table.add_column("Melting Pt [K]", justify="right")
-
-    for mat_id in list_materials():
-        info = get_material_info(mat_id)
-        table.add_row(
-            mat_id,
-            info["name"],
-            info["category"],
-            str(info["density"]),
-            str(info["melting_point"]),
-        )
+    table.add_column(Text("Density [kg/m³]"), justify="right")
+    table.add_column(Text("Melting Pt [K]"), justify="right")
+
+    rows = [
+        (mat_id, info["name"], info["category"], str(info["density"]), str(info["melting_point"]))
+        for mat_id, info in ((m, get_material_info(m)) for m in list_materials())
+    ]
+    for row in rows:
+        table.add_row(*map(Text, row))
     console.print(table)
@@ -2,17 +2,73 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
-from rich.table import Table
 
-from resa_pro.core.config import DesignState, load_design_json, save_design_json
-from resa_pro.core.injector import (
-    check_chugging_stability,
-    design_injector,
+from resa_pro.cli._console import emit_json, get_console
+from resa_pro.cli._tables import make_param_table, styled_text
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+    from resa_pro.core.config import DesignState
+    from resa_pro.core.injector import InjectorDesign
+
+
+# Row definitions: (label, unit, formatter)
+_OX_ROWS = (
+    ("Mass Flow (ox)", "kg/s", lambda r: f"{r.mass_flow_oxidizer:.4f}"),
+    ("Pressure Drop", "bar", lambda r: f"{r.dp_oxidizer / 1e5:.2f}"),
+    ("ΔP/Pc", "%", lambda r: f"{r.dp_fraction_ox * 100:.1f}"),
+    ("Number of Elements", "—", lambda r: f"{r.n_elements_ox}"),
+    ("Orifice Diameter", "mm", lambda r: f"{r.element_ox.diameter * 1e3:.3f}"),
+    ("Injection Velocity", "m/s", lambda r: f"{r.element_ox.velocity:.1f}"),
+    ("Manifold Pressure", "bar", lambda r: f"{r.manifold_pressure_ox / 1e5:.2f}"),
+)
+
+_FUEL_ROWS = (
+    ("Mass Flow (fuel)", "kg/s", lambda r: f"{r.mass_flow_fuel:.4f}"),
+    ("Pressure Drop", "bar", lambda r: f"{r.dp_fuel / 1e5:.2f}"),
+    ("ΔP/Pc", "%", lambda r: f"{r.dp_fraction_fuel * 100:.1f}"),
+    ("Number of Elements", "—", lambda r: f"{r.n_elements_fuel}"),
+    ("Orifice Diameter", "mm", lambda r: f"{r.element_fuel.diameter * 1e3:.3f}"),
+    ("Injection Velocity", "m/s", lambda r: f"{r.element_fuel.velocity:.1f}"),
+    ("Manifold Pressure", "bar", lambda r: f"{r.manifold_pressure_fuel / 1e5:.2f}"),
 )
 
 
+def _stability_label(stable: bool) -> Text:
+    return styled_text("STABLE", "green") if stable else styled_text("UNSTABLE", "red")
+
+
+def _print_results(console: Console, result: InjectorDesign) -> None:
+    """Render the oxidizer/fuel tables and stability summary."""
+    from rich.text import Text
+
+    from resa_pro.core.injector import check_chugging_stability
+
+    console.print("\n[bold]RESA Pro — Injector Design[/bold]\n")
+
+    for title, rows in (("Oxidizer Side", _OX_ROWS), ("Fuel Side", _FUEL_ROWS)):
+        table = make_param_table(title)
+        for label, unit, fmt in rows:
+            table.add_row(label, fmt(result), unit)
+        console.print(table)
+
+    # Stability check
+    stable_ox = bool(check_chugging_stability(result.dp_fraction_ox)["stable"])
+    stable_fuel = bool(check_chugging_stability(result.dp_fraction_fuel)["stable"])
+    status_ox = _stability_label(stable_ox)
+    status_fuel = _stability_label(stable_fuel)
+
+    console.print(
+        Text.assemble("\nChugging stability:  Ox: ", status_ox, "  |  Fuel: ", status_fuel)
+    )
+    console.print(f"Momentum ratio: {result.momentum_ratio:.2f}")
+
+
 @click.command("injector")
 @click.option(
     "--design",
@@ -66,7 +122,10 @@ def injector(
     output: str | None,
 ) -> None:
     """Design an injector from mass flow, mixture ratio, and chamber pressure."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.config import DesignState, load_design_json, save_design_json
+    from resa_pro.core.injector import design_injector
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     state: DesignState | None = None
     if design:
@@ -94,48 +153,30 @@ def injector(
         n_elements_fuel=n_fuel,
     )
 
-    console.print("\n[bold]RESA Pro — Injector Design[/bold]\n")
-
-    # Oxidizer table
-    table_ox = Table(title="Oxidizer Side")
-    table_ox.add_column("Parameter", style="cyan")
-    table_ox.add_column("Value", style="green", justify="right")
-    table_ox.add_column("Unit", style="dim")
-
-    table_ox.add_row("Mass Flow (ox)", f"{result.mass_flow_oxidizer:.4f}", "kg/s")
-    table_ox.add_row("Pressure Drop", f"{result.dp_oxidizer / 1e5:.2f}", "bar")
-    table_ox.add_row("ΔP/Pc", f"{result.dp_fraction_ox * 100:.1f}", "%")
-    table_ox.add_row("Number of Elements", f"{result.n_elements_ox}", "—")
-    table_ox.add_row("Orifice Diameter", f"{result.element_ox.diameter * 1e3:.3f}", "mm")
-    table_ox.add_row("Injection Velocity", f"{result.element_ox.velocity:.1f}", "m/s")
-    table_ox.add_row("Manifold Pressure", f"{result.manifold_pressure_ox / 1e5:.2f}", "bar")
-
-    console.print(table_ox)
-
-    # Fuel table
-    table_fuel = Table(title="Fuel Side")
-    table_fuel.add_column("Parameter", style="cyan")
-    table_fuel.add_column("Value", style="green", justify="right")
-    table_fuel.add_column("Unit", style="dim")
-
-    table_fuel.add_row("Mass Flow (fuel)", f"{result.mass_flow_fuel:.4f}", "kg/s")
-    table_fuel.add_row("Pressure Drop", f"{result.dp_fuel / 1e5:.2f}", "bar")
-    table_fuel.add_row("ΔP/Pc", f"{result.dp_fraction_fuel * 100:.1f}", "%")
-    table_fuel.add_row("Number of Elements", f"{result.n_elements_fuel}", "—")
-    table_fuel.add_row("Orifice Diameter", f"{result.element_fuel.diameter * 1e3:.3f}", "mm")
-    table_fuel.add_row("Injection Velocity", f"{result.element_fuel.velocity:.1f}", "m/s")
-    table_fuel.add_row("Manifold Pressure", f"{result.manifold_pressure_fuel / 1e5:.2f}", "bar")
-
-    console.print(table_fuel)
-
-    # Stability check
-    stab_ox = check_chugging_stability(result.dp_fraction_ox)
-    stab_fuel = check_chugging_stability(result.dp_fraction_fuel)
-    status_ox = "[green]STABLE[/green]" if stab_ox["stable"] else "[red]UNSTABLE[/red]"
-    status_fuel = "[green]STABLE[/green]" if stab_fuel["stable"] else "[red]UNSTABLE[/red]"
-
-    console.print(f"\nChugging stability:  Ox: {status_ox}  |  Fuel: {status_fuel}")
-    console.print(f"Momentum ratio: {result.momentum_ratio:.2f}")
+    summary = {
+        "mass_flow_oxidizer": result.mass_flow_oxidizer,
+        "mass_flow_fuel": result.mass_flow_fuel,
+        "mixture_ratio": result.mixture_ratio,
+        "dp_oxidizer": result.dp_oxidizer,
+        "dp_fuel": result.dp_fuel,
+        "dp_fraction_ox": result.dp_fraction_ox,
+        "dp_fraction_fuel": result.dp_fraction_fuel,
+        "n_elements_ox": result.n_elements_ox,
+        "element_diameter_ox": result.element_ox.diameter,
+        "cd_ox": result.element_ox.cd,
+        "n_elements_fuel": result.n_elements_fuel,
+        "element_diameter_fuel": result.element_fuel.diameter,
+        "cd_fuel": result.element_fuel.cd,
+        "manifold_pressure_ox": result.manifold_pressure_ox,
+        "manifold_pressure_fuel": result.manifold_pressure_fuel,
+        "momentum_ratio": result.momentum_ratio,
+    }
+
+    json_out = ctx.obj.get("json_out")
+    if json_out:
+        emit_json(summary)
+    elif not ctx.obj.get("quiet"):
+        _print_results(console, result)
 
     if output:
         if state is None:
@@ -143,23 +184,7 @@ def injector(
                 mixture_ratio=mr,
                 chamber_pressure=pc,
             )
-        state.feed_system["injector"] = {
-            "mass_flow_oxidizer": result.mass_flow_oxidizer,
-            "mass_flow_fuel": result.mass_flow_fuel,
-            "mixture_ratio": result.mixture_ratio,
-            "dp_oxidizer": result.dp_oxidizer,
-            "dp_fuel": result.dp_fuel,
-            "dp_fraction_ox": result.dp_fraction_ox,
-            "dp_fraction_fuel": result.dp_fraction_fuel,
-            "n_elements_ox": result.n_elements_ox,
-            "element_diameter_ox": result.element_ox.diameter,
-            "cd_ox": result.element_ox.cd,
-            "n_elements_fuel": result.n_elements_fuel,
-            "element_diameter_fuel": result.element_fuel.diameter,
-            "cd_fuel": result.element_fuel.cd,
-            "manifold_pressure_ox": result.manifold_pressure_ox,
-            "manifold_pressure_fuel": result.manifold_pressure_fuel,
-            "momentum_ratio": result.momentum_ratio,
-        }
+        state.feed_system["injector"] = summary
         save_design_json(state, output)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
@@ -5,53 +5,76 @@ Entry point for the ``resa`` CLI tool.
 
 from __future__ import annotations
 
+import importlib
+
 import click
-from rich.console import Console
 
 from resa_pro import __app_name__, __version__
 
-console = Console()
+# Sub-command name -> "module:attribute".  Modules are only imported when the
+# command is actually resolved, so ``resa chamber`` never pays for importing
+# the cooling, cycle or optimisation stacks.
+_LAZY_COMMANDS: dict[str, str] = {
+    "chamber": "resa_pro.cli.chamber_cmd:chamber",
+    "cooling": "resa_pro.cli.cooling_cmd:cooling",
+    "cycle": "resa_pro.cli.cycle_cmd:cycle",
+    "export-stl": "resa_pro.cli.geometry_cmd:export_stl",
+    "feed": "resa_pro.cli.feed_cmd:feed",
+    "gui": "resa_pro.cli.gui_cmd:gui",
+    "info": "resa_pro.cli.info_cmd:info",
+    "injector": "resa_pro.cli.injector_cmd:injector",
+    "nozzle": "resa_pro.cli.nozzle_cmd:nozzle",
+    "optimize": "resa_pro.cli.optimize_cmd:optimize",
+    "report": "resa_pro.cli.report_cmd:report",
+    "uq": "resa_pro.cli.uq_cmd:uq",
+    "warmup": "resa_pro.cli.warmup_cmd:warmup",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports sub-command modules on first use."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=_LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name=__app_name__)
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Skip result tables (for scripted runs that only need --output files).",
+)
+@click.option(
+    "--json",
+    "json_out",
+    is_flag=True,
+    help="Print results as JSON on stdout instead of Rich tables.",
+)
 @click.pass_context
-def cli(ctx: click.Context) -> None:
+def cli(ctx: click.Context, quiet: bool, json_out: bool) -> None:
     """RESA Pro — Rocket Engine Sizing and Analysis.
 
     A comprehensive tool for rocket engine design, analysis, and
     optimisation.
     """
     ctx.ensure_object(dict)
-    ctx.obj["console"] = console
-
-
-# Import and register sub-command groups
-from resa_pro.cli.chamber_cmd import chamber  # noqa: E402
-from resa_pro.cli.nozzle_cmd import nozzle  # noqa: E402
-from resa_pro.cli.info_cmd import info  # noqa: E402
-from resa_pro.cli.injector_cmd import injector  # noqa: E402
-from resa_pro.cli.cooling_cmd import cooling  # noqa: E402
-from resa_pro.cli.feed_cmd import feed  # noqa: E402
-from resa_pro.cli.geometry_cmd import export_stl  # noqa: E402
-from resa_pro.cli.report_cmd import report  # noqa: E402
-from resa_pro.cli.cycle_cmd import cycle  # noqa: E402
-from resa_pro.cli.optimize_cmd import optimize  # noqa: E402
-from resa_pro.cli.uq_cmd import uq  # noqa: E402
-from resa_pro.cli.gui_cmd import gui  # noqa: E402
-
-cli.add_command(chamber)
-cli.add_command(nozzle)
-cli.add_command(info)
-cli.add_command(injector)
-cli.add_command(cooling)
-cli.add_command(feed)
-cli.add_command(export_stl)
-cli.add_command(report)
-cli.add_command(cycle)
-cli.add_command(optimize)
-cli.add_command(uq)
-cli.add_command(gui)
+    # No console is created here; commands fall back to the shared
+    # get_console() instance only when they actually run
+    ctx.obj["quiet"] = quiet
+    ctx.obj["json_out"] = json_out
 
 
 def main() -> None:
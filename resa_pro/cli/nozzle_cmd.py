@@ -2,23 +2,58 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import numpy as np
-from rich.console import Console
-from rich.table import Table
-
-from resa_pro.core.config import DesignState, load_design_json, save_design_json
-from resa_pro.core.nozzle import (
-    NozzleMethod,
-    conical_nozzle,
-    compute_nozzle_efficiency,
-    parabolic_nozzle,
-)
-from resa_pro.core.thermo import compute_nozzle_performance, lookup_combustion
-from resa_pro.utils.constants import RAD_TO_DEG
+
+from resa_pro.cli._console import emit_json, get_console
+from resa_pro.cli._tables import make_param_table, styled_text
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from resa_pro.core.config import DesignState
+    from resa_pro.core.nozzle import NozzleContour
+    from resa_pro.core.thermo import NozzlePerformance
+
+
+def _print_results(
+    console: Console,
+    method: str,
+    expansion_ratio: float,
+    throat_radius: float,
+    contour: NozzleContour,
+    perf: NozzlePerformance | None,
+) -> None:
+    """Render the nozzle geometry and performance table."""
+    from resa_pro.utils.constants import RAD_TO_DEG
+
+    table = make_param_table("Nozzle Design Results")
+
+    table.add_row("Method", method.capitalize(), "—")
+    table.add_row("Expansion Ratio", f"{expansion_ratio:.1f}", "—")
+    table.add_row("Throat Radius", f"{throat_radius * 1e3:.2f}", "mm")
+    table.add_row("Exit Radius", f"{contour.exit_radius * 1e3:.2f}", "mm")
+    table.add_row("Nozzle Length", f"{contour.length * 1e3:.2f}", "mm")
+    table.add_row("Divergence Efficiency", f"{contour.divergence_efficiency:.4f}", "—")
+
+    if method.lower() == "conical":
+        table.add_row("Half-Angle", f"{contour.half_angle * RAD_TO_DEG:.1f}", "deg")
+    else:
+        table.add_row("θ Initial", f"{contour.theta_initial * RAD_TO_DEG:.1f}", "deg")
+        table.add_row("θ Exit", f"{contour.theta_exit * RAD_TO_DEG:.1f}", "deg")
+
+    if perf:
+        table.add_row("", "", "")
+        table.add_row(styled_text("Performance"), "", "")
+        table.add_row("c*", f"{perf.c_star:.1f}", "m/s")
+        table.add_row("CF (vacuum)", f"{perf.CF_vac:.4f}", "—")
+        table.add_row("CF (sea level)", f"{perf.CF_sl:.4f}", "—")
+        table.add_row("Isp (vacuum)", f"{perf.Isp_vac:.1f}", "s")
+        table.add_row("Isp (sea level)", f"{perf.Isp_sl:.1f}", "s")
+        table.add_row("Exit Mach", f"{perf.exit_mach:.2f}", "—")
+
+    console.print(table)
 
 
 @click.command("nozzle")
@@ -62,7 +97,11 @@ def nozzle(
     output: str | None,
 ) -> None:
     """Design a nozzle contour and compute performance."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.config import DesignState, load_design_json, save_design_json
+    from resa_pro.core.nozzle import conical_nozzle, parabolic_nozzle
+    from resa_pro.core.thermo import compute_nozzle_performance, lookup_combustion
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     # Load throat radius from design file or CLI
     state: DesignState | None = None
@@ -84,8 +123,6 @@ def nozzle(
     else:
         contour = parabolic_nozzle(Rt, expansion_ratio, fractional_length=frac_length)
 
-    console.print(f"\n[bold]RESA Pro — Nozzle Design ({method})[/bold]\n")
-
     # Performance (if we have propellant info)
     perf = None
     if state and state.chamber_pressure > 0:
@@ -101,59 +138,37 @@ def nozzle(
         except KeyError:
             pass
 
-    # Display results
-    table = Table(title="Nozzle Design Results")
-    table.add_column("Parameter", style="cyan")
-    table.add_column("Value", style="green", justify="right")
-    table.add_column("Unit", style="dim")
-
-    table.add_row("Method", method.capitalize(), "—")
-    table.add_row("Expansion Ratio", f"{expansion_ratio:.1f}", "—")
-    table.add_row("Throat Radius", f"{Rt * 1e3:.2f}", "mm")
-    table.add_row("Exit Radius", f"{contour.exit_radius * 1e3:.2f}", "mm")
-    table.add_row("Nozzle Length", f"{contour.length * 1e3:.2f}", "mm")
-    table.add_row("Divergence Efficiency", f"{contour.divergence_efficiency:.4f}", "—")
-
-    if method.lower() == "conical":
-        table.add_row("Half-Angle", f"{contour.half_angle * RAD_TO_DEG:.1f}", "deg")
-    else:
-        table.add_row("θ Initial", f"{contour.theta_initial * RAD_TO_DEG:.1f}", "deg")
-        table.add_row("θ Exit", f"{contour.theta_exit * RAD_TO_DEG:.1f}", "deg")
-
-    if perf:
-        table.add_row("", "", "")
-        table.add_row("[bold]Performance[/bold]", "", "")
-        table.add_row("c*", f"{perf.c_star:.1f}", "m/s")
-        table.add_row("CF (vacuum)", f"{perf.CF_vac:.4f}", "—")
-        table.add_row("CF (sea level)", f"{perf.CF_sl:.4f}", "—")
-        table.add_row("Isp (vacuum)", f"{perf.Isp_vac:.1f}", "s")
-        table.add_row("Isp (sea level)", f"{perf.Isp_sl:.1f}", "s")
-        table.add_row("Exit Mach", f"{perf.exit_mach:.2f}", "—")
-
-    console.print(table)
+    nozzle_data = {
+        "method": method,
+        "expansion_ratio": expansion_ratio,
+        "throat_radius": Rt,
+        "exit_radius": contour.exit_radius,
+        "length": contour.length,
+        "divergence_efficiency": contour.divergence_efficiency,
+    }
+    perf_data = {
+        "c_star": perf.c_star,
+        "CF_vac": perf.CF_vac,
+        "CF_sl": perf.CF_sl,
+        "Isp_vac": perf.Isp_vac,
+        "Isp_sl": perf.Isp_sl,
+        "exit_mach": perf.exit_mach,
+    } if perf else {}
+
+    json_out = ctx.obj.get("json_out")
+    if json_out:
+        emit_json({"nozzle": nozzle_data, "performance": perf_data})
+    elif not ctx.obj.get("quiet"):
+        console.print(f"\n[bold]RESA Pro — Nozzle Design ({method})[/bold]\n")
+        _print_results(console, method, expansion_ratio, Rt, contour, perf)
 
     # Save
     if output:
         if state is None:
             state = DesignState()
-        state.nozzle = {
-            "method": method,
-            "expansion_ratio": expansion_ratio,
-            "throat_radius": Rt,
-            "exit_radius": contour.exit_radius,
-            "length": contour.length,
-            "divergence_efficiency": contour.divergence_efficiency,
-            "contour_x": contour.x.tolist(),
-            "contour_y": contour.y.tolist(),
-        }
-        if perf:
-            state.performance = {
-                "c_star": perf.c_star,
-                "CF_vac": perf.CF_vac,
-                "CF_sl": perf.CF_sl,
-                "Isp_vac": perf.Isp_vac,
-                "Isp_sl": perf.Isp_sl,
-                "exit_mach": perf.exit_mach,
-            }
+        state.nozzle = {**nozzle_data, "contour_x": contour.x, "contour_y": contour.y}
+        if perf_data:
+            state.performance = perf_data
         save_design_json(state, output)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
@@ -2,52 +2,79 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+from functools import partial
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
-
-from resa_pro.core.thermo import compute_nozzle_performance, lookup_combustion
-from resa_pro.optimization.optimizer import (
-    Constraint,
-    DesignOptimizer,
-    DesignVariable,
-    Objective,
-)
-
 
-def _default_engine_eval(params: dict[str, float]) -> dict[str, float]:
+from resa_pro.cli._console import emit_json, get_console, write_json
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from resa_pro.optimization.optimizer import DesignPoint, Objective
+
+
+def _engine_performance(
+    pc: float, eps: float, mr: float, oxidizer: str, fuel: str
+) -> dict[str, float]:
+    """Nozzle performance for one operating point, taking plain positional values."""
+    from resa_pro.core.thermo import compute_nozzle_performance, lookup_combustion
+
+    comb = lookup_combustion(oxidizer, fuel, mixture_ratio=mr)
+    perf = compute_nozzle_performance(
+        gamma=comb.gamma,
+        molar_mass=comb.molar_mass,
+        Tc=comb.chamber_temperature,
+        expansion_ratio=eps,
+        pc=pc,
+    )
+    return {
+        "Isp_vac": perf.Isp_vac,
+        "Isp_sl": perf.Isp_sl,
+        "CF_vac": perf.CF_vac,
+        "c_star": perf.c_star,
+        "exit_mach": perf.exit_mach,
+        "pe_pc": perf.pe_pc,
+    }
+
+
+def _default_engine_eval(
+    params: dict[str, float],
+    *,
+    oxidizer: str = "n2o",
+    fuel: str = "ethanol",
+) -> dict[str, float]:
     """Default evaluation function for engine-level optimisation.
 
     Varies chamber pressure and expansion ratio, computes performance.
+    Commands bind the propellant pair once with
+    ``partial(_default_engine_eval, oxidizer=..., fuel=...)``, which also
+    keeps the evaluator picklable for worker processes.
+
+    Errors are not caught here: a propellant pair missing from the table
+    aborts the run instead of scoring every point as zero.  Keeping the
+    parameters inside the design-variable bounds is the optimizer's job.
     """
-    pc = params.get("chamber_pressure", 2e6)
-    eps = params.get("expansion_ratio", 10.0)
-    mr = params.get("mixture_ratio", 4.0)
+    return _engine_performance(
+        params.get("chamber_pressure", 2e6),
+        params.get("expansion_ratio", 10.0),
+        params.get("mixture_ratio", 4.0),
+        oxidizer,
+        fuel,
+    )
 
-    ox = params.get("_oxidizer", "n2o")
-    fuel = params.get("_fuel", "ethanol")
+
+def _check_propellants(console: Console, oxidizer: str, fuel: str) -> None:
+    """Exit with an error if the propellant pair has no combustion data."""
+    from resa_pro.core.thermo import lookup_combustion
 
     try:
-        comb = lookup_combustion(str(ox), str(fuel), mixture_ratio=mr)
-        perf = compute_nozzle_performance(
-            gamma=comb.gamma,
-            molar_mass=comb.molar_mass,
-            Tc=comb.chamber_temperature,
-            expansion_ratio=eps,
-            pc=pc,
-        )
-        return {
-            "Isp_vac": perf.Isp_vac,
-            "Isp_sl": perf.Isp_sl,
-            "CF_vac": perf.CF_vac,
-            "c_star": perf.c_star,
-            "exit_mach": perf.exit_mach,
-            "pe_pc": perf.pe_pc,
-        }
-    except Exception:
-        return {"Isp_vac": 0.0, "Isp_sl": 0.0, "CF_vac": 0.0, "c_star": 0.0}
+        lookup_combustion(oxidizer, fuel)
+    except KeyError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise SystemExit(1)
 
 
 @click.group("optimize")
@@ -57,6 +84,28 @@ def optimize(ctx: click.Context) -> None:
     pass
 
 
+def _print_best_point(console: Console, best: DesignPoint) -> None:
+    """Render the optimal design point as a table."""
+    from rich.table import Table
+
+    table = Table(title="Optimal Design Point")
+    table.add_column("Parameter", style="cyan")
+    table.add_column("Value", style="green", justify="right")
+
+    for name, val in best.variables.items():
+        if name.startswith("_"):
+            continue
+        if "pressure" in name:
+            table.add_row(name, f"{val / 1e5:.2f} bar")
+        else:
+            table.add_row(name, f"{val:.2f}")
+
+    for name, val in best.objectives.items():
+        table.add_row(f"[bold]{name}[/bold]", f"[bold]{val:.2f} s[/bold]")
+
+    console.print(table)
+
+
 @optimize.command("isp")
 @click.option("--oxidizer", default="n2o", show_default=True, help="Oxidizer name.")
 @click.option("--fuel", default="ethanol", show_default=True, help="Fuel name.")
@@ -73,6 +122,13 @@ def optimize(ctx: click.Context) -> None:
 )
 @click.option("--max-iter", type=int, default=100, show_default=True, help="Maximum iterations.")
 @click.option("--seed", type=int, default=42, show_default=True, help="Random seed.")
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Processes for differential-evolution generations (-1 = all CPUs).",
+)
 @click.pass_context
 def optimize_isp(
     ctx: click.Context,
@@ -85,44 +141,63 @@ def optimize_isp(
     method: str,
     max_iter: int,
     seed: int,
+    workers: int,
 ) -> None:
     """Optimise expansion ratio and chamber pressure for maximum Isp."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.optimization.optimizer import DesignOptimizer, DesignVariable, Objective
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     opt = DesignOptimizer()
     opt.add_variable(DesignVariable("chamber_pressure", pc_min, pc_max, unit="Pa"))
     opt.add_variable(DesignVariable("expansion_ratio", eps_min, eps_max))
     opt.add_objective(Objective("Isp_vac", "Isp_vac", direction="maximize"))
 
-    def eval_func(params: dict[str, float]) -> dict[str, float]:
-        params["_oxidizer"] = oxidizer
-        params["_fuel"] = fuel
-        return _default_engine_eval(params)
-
-    result = opt.optimize(eval_func, method=method, max_iter=max_iter, seed=seed)
+    _check_propellants(console, oxidizer, fuel)
+    eval_func = partial(_default_engine_eval, oxidizer=oxidizer, fuel=fuel)
+
+    result = opt.optimize(eval_func, method=method, max_iter=max_iter, seed=seed, workers=workers)
+
+    if ctx.obj.get("json_out"):
+        best = result.best
+        emit_json({
+            "best": None if best is None else {
+                "variables": best.variables,
+                "objectives": best.objectives,
+                "feasible": best.feasible,
+            },
+            "n_evaluations": result.n_evaluations,
+            "converged": bool(result.converged),
+        })
+    elif result.best is None:
+        console.print("[red]Optimisation failed — no feasible point found[/red]")
+    elif not ctx.obj.get("quiet"):
+        console.print("\n[bold]RESA Pro — Isp Optimisation[/bold]\n")
+        _print_best_point(console, result.best)
+        console.print(
+            f"\n[dim]Evaluations: {result.n_evaluations} | Converged: {result.converged}[/dim]"
+        )
 
-    console.print("\n[bold]RESA Pro — Isp Optimisation[/bold]\n")
 
-    if result.best is not None:
-        table = Table(title="Optimal Design Point")
-        table.add_column("Parameter", style="cyan")
-        table.add_column("Value", style="green", justify="right")
+def _print_sensitivities(
+    console: Console, sens: dict[str, dict[str, float]], objectives: list[Objective]
+) -> None:
+    """Render the normalised sensitivities as a variable × objective table."""
+    from rich.table import Table
 
-        for name, val in result.best.variables.items():
-            if name.startswith("_"):
-                continue
-            if "pressure" in name:
-                table.add_row(name, f"{val / 1e5:.2f} bar")
-            else:
-                table.add_row(name, f"{val:.2f}")
+    table = Table(title="Normalised Sensitivities (Δf/f)/(Δx/x_range)")
+    table.add_column("Variable", style="cyan")
+    for obj in objectives:
+        table.add_column(obj.name, style="green", justify="right")
 
-        for name, val in result.best.objectives.items():
-            table.add_row(f"[bold]{name}[/bold]", f"[bold]{val:.2f} s[/bold]")
+    for var_name, obj_sens in sens.items():
+        row = [var_name]
+        for obj in objectives:
+            val = obj_sens.get(obj.name, 0.0)
+            row.append(f"{val:+.4f}")
+        table.add_row(*row)
 
-        console.print(table)
-        console.print(f"\n[dim]Evaluations: {result.n_evaluations} | Converged: {result.converged}[/dim]")
-    else:
-        console.print("[red]Optimisation failed — no feasible point found[/red]")
+    console.print(table)
 
 
 @optimize.command("sensitivity")
@@ -141,7 +216,14 @@ def sensitivity_cmd(
     perturbation: float,
 ) -> None:
     """Run one-at-a-time sensitivity analysis."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.optimization.optimizer import DesignOptimizer, DesignVariable, Objective
+
+    console: Console = ctx.obj.get("console") or get_console()
+
+    if not 1e6 <= pc <= 5e6:
+        raise click.BadParameter("must lie within the 1e6–5e6 Pa design range", param_hint="--pc")
+    if not 3.0 <= eps <= 50.0:
+        raise click.BadParameter("must lie within the 3–50 design range", param_hint="--eps")
 
     opt = DesignOptimizer()
     opt.add_variable(DesignVariable("chamber_pressure", 1e6, 5e6, initial=pc, unit="Pa"))
@@ -149,26 +231,35 @@ def sensitivity_cmd(
     opt.add_objective(Objective("Isp_vac", "Isp_vac"))
     opt.add_objective(Objective("CF_vac", "CF_vac"))
 
-    def eval_func(params: dict[str, float]) -> dict[str, float]:
-        params["_oxidizer"] = oxidizer
-        params["_fuel"] = fuel
-        return _default_engine_eval(params)
+    _check_propellants(console, oxidizer, fuel)
+    eval_func = partial(_default_engine_eval, oxidizer=oxidizer, fuel=fuel)
 
     sens = opt.sensitivity_analysis(eval_func, perturbation=perturbation)
 
-    console.print("\n[bold]RESA Pro — Sensitivity Analysis[/bold]\n")
+    if ctx.obj.get("json_out"):
+        emit_json(sens)
+    elif not ctx.obj.get("quiet"):
+        console.print("\n[bold]RESA Pro — Sensitivity Analysis[/bold]\n")
+        _print_sensitivities(console, sens, opt.objectives)
 
-    table = Table(title="Normalised Sensitivities (Δf/f)/(Δx/x_range)")
-    table.add_column("Variable", style="cyan")
-    for obj in opt.objectives:
-        table.add_column(obj.name, style="green", justify="right")
 
-    for var_name, obj_sens in sens.items():
-        row = [var_name]
-        for obj in opt.objectives:
-            val = obj_sens.get(obj.name, 0.0)
-            row.append(f"{val:+.4f}")
-        table.add_row(*row)
+def _print_top_points(console: Console, top: list[DesignPoint], n_total: int) -> None:
+    """Render the best DOE samples as a table."""
+    from rich.table import Table
+
+    table = Table(title=f"Top {len(top)} of {n_total} Samples")
+    table.add_column("#", style="dim")
+    table.add_column("Pc [bar]", style="cyan", justify="right")
+    table.add_column("ε", style="cyan", justify="right")
+    table.add_column("Isp_vac [s]", style="green", justify="right")
+
+    for i, pt in enumerate(top):
+        table.add_row(
+            str(i + 1),
+            f"{pt.variables.get('chamber_pressure', 0) / 1e5:.1f}",
+            f"{pt.variables.get('expansion_ratio', 0):.1f}",
+            f"{pt.objectives.get('Isp_vac', 0):.1f}",
+        )
 
     console.print(table)
 
@@ -181,6 +272,13 @@ def sensitivity_cmd(
 @click.option("--eps-min", type=float, default=3.0, help="Min expansion ratio.")
 @click.option("--eps-max", type=float, default=50.0, help="Max expansion ratio.")
 @click.option("--samples", "-n", type=int, default=20, show_default=True, help="Number of samples.")
+@click.option(
+    "--method",
+    type=click.Choice(["lhs", "sobol"]),
+    default="lhs",
+    show_default=True,
+    help="Sampling scheme (use a power-of-two --samples with sobol).",
+)
 @click.option("--seed", type=int, default=42, show_default=True, help="Random seed.")
 @click.option("--output", "-o", type=click.Path(), default=None, help="Output file (JSON).")
 @click.pass_context
@@ -193,54 +291,50 @@ def doe_cmd(
     eps_min: float,
     eps_max: float,
     samples: int,
+    method: str,
     seed: int,
     output: str | None,
 ) -> None:
-    """Run Latin Hypercube sampling of the design space."""
-    console: Console = ctx.obj.get("console", Console())
+    """Sample the design space (Latin Hypercube or Sobol')."""
+    from resa_pro.optimization.optimizer import DesignOptimizer, DesignVariable, Objective
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     opt = DesignOptimizer()
     opt.add_variable(DesignVariable("chamber_pressure", pc_min, pc_max, unit="Pa"))
     opt.add_variable(DesignVariable("expansion_ratio", eps_min, eps_max))
     opt.add_objective(Objective("Isp_vac", "Isp_vac"))
 
-    def eval_func(params: dict[str, float]) -> dict[str, float]:
-        params["_oxidizer"] = oxidizer
-        params["_fuel"] = fuel
-        return _default_engine_eval(params)
-
-    points = opt.doe_latin_hypercube(eval_func, n_samples=samples, seed=seed)
+    _check_propellants(console, oxidizer, fuel)
+    eval_func = partial(_default_engine_eval, oxidizer=oxidizer, fuel=fuel)
 
-    console.print(f"\n[bold]RESA Pro — DOE ({samples} samples)[/bold]\n")
+    if method == "sobol":
+        points = opt.doe_sobol(eval_func, n_samples=samples, seed=seed)
+    else:
+        points = opt.doe_latin_hypercube(eval_func, n_samples=samples, seed=seed)
 
-    # Show top 5 by Isp
-    ranked = sorted(points, key=lambda p: p.objectives.get("Isp_vac", 0), reverse=True)
+    def isp_of(p: DesignPoint) -> float:
+        return p.objectives.get("Isp_vac", 0)
 
-    table = Table(title=f"Top 5 of {len(ranked)} Samples")
-    table.add_column("#", style="dim")
-    table.add_column("Pc [bar]", style="cyan", justify="right")
-    table.add_column("ε", style="cyan", justify="right")
-    table.add_column("Isp_vac [s]", style="green", justify="right")
+    json_out = ctx.obj.get("json_out")
+    if not json_out and not ctx.obj.get("quiet"):
+        console.print(f"\n[bold]RESA Pro — DOE ({samples} samples)[/bold]\n")
+        # Only the top 5 are shown, so skip the full sort
+        _print_top_points(console, heapq.nlargest(5, points, key=isp_of), len(points))
 
-    for i, pt in enumerate(ranked[:5]):
-        table.add_row(
-            str(i + 1),
-            f"{pt.variables.get('chamber_pressure', 0) / 1e5:.1f}",
-            f"{pt.variables.get('expansion_ratio', 0):.1f}",
-            f"{pt.objectives.get('Isp_vac', 0):.1f}",
-        )
-
-    console.print(table)
-
-    if output:
+    if output or json_out:
         data = [
             {
                 "variables": pt.variables,
                 "objectives": pt.objectives,
                 "feasible": pt.feasible,
             }
-            for pt in ranked
+            for pt in sorted(points, key=isp_of, reverse=True)
         ]
-        with open(output, "w") as f:
-            json.dump(data, f, indent=2)
-        console.print(f"\n[dim]Saved {len(data)} points to {output}[/dim]")
+        if json_out:
+            emit_json(data)
+
+    if output:
+        write_json(data, output)
+        if not json_out:
+            console.print(f"\n[dim]Saved {len(data)} points to {output}[/dim]")
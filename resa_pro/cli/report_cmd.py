@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
 
-from resa_pro.core.config import load_design_json
-from resa_pro.reports.summary import (
-    generate_text_report,
-    save_html_report,
-    save_text_report,
-)
+from resa_pro.cli._console import emit_json, get_console
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 @click.command("report")
@@ -42,25 +41,40 @@ def report(
     output: str | None,
 ) -> None:
     """Generate a design summary report."""
-    console: Console = ctx.obj.get("console", Console())
+    from resa_pro.core.config import load_design_json
+    from resa_pro.reports.summary import (
+        generate_text_report,
+        save_html_report,
+        save_text_report,
+    )
+
+    console: Console = ctx.obj.get("console") or get_console()
 
     state = load_design_json(design)
+    json_out = ctx.obj.get("json_out")
+    saved: dict[str, str] = {}
 
     if fmt == "text" or fmt == "both":
         out_txt = output or "report.txt"
         if fmt == "both" and output:
             out_txt = output.rsplit(".", 1)[0] + ".txt"
         save_text_report(state, out_txt)
-        console.print(f"[green]Text report saved:[/green] {out_txt}")
+        saved["text"] = out_txt
+        if not json_out:
+            console.print(f"[green]Text report saved:[/green] {out_txt}")
 
     if fmt == "html" or fmt == "both":
         out_html = output or "report.html"
         if fmt == "both" and output:
             out_html = output.rsplit(".", 1)[0] + ".html"
         save_html_report(state, out_html)
-        console.print(f"[green]HTML report saved:[/green] {out_html}")
+        saved["html"] = out_html
+        if not json_out:
+            console.print(f"[green]HTML report saved:[/green] {out_html}")
 
-    if fmt == "text" and not output:
+    if json_out:
+        emit_json({"saved": saved})
+    elif fmt == "text" and not output and not ctx.obj.get("quiet"):
         # Print to console as well
         text = generate_text_report(state)
         console.print(f"\n{text}")
@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-import json
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
-
-from resa_pro.core.thermo import compute_nozzle_performance, lookup_combustion
-from resa_pro.optimization.uq import (
-    Distribution,
-    UncertainParameter,
-    UncertaintyAnalysis,
-)
+
+from resa_pro.cli._console import emit_json, get_console, write_json
+
+if TYPE_CHECKING:
+    import numpy as np
+    from rich.console import Console
+
+    from resa_pro.optimization.uq import UQResult
 
 
 def _engine_uq_eval(params: dict[str, float]) -> dict[str, float]:
     """Evaluation function for engine UQ with uncertain Pc, MR, gamma."""
+    from resa_pro.core.thermo import compute_nozzle_performance, lookup_combustion
+
     pc = params.get("chamber_pressure", 2e6)
     mr = params.get("mixture_ratio", 4.0)
     eps = params.get("expansion_ratio", 10.0)
@@ -38,56 +39,35 @@ def _engine_uq_eval(params: dict[str, float]) -> dict[str, float]:
     }
 
 
-@click.group("uq")
-@click.pass_context
-def uq(ctx: click.Context) -> None:
-    """Uncertainty quantification commands."""
-    pass
+def _engine_uq_eval_batch(params: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Vectorised :func:`_engine_uq_eval` over whole Monte Carlo sample arrays."""
+    import numpy as np
 
+    from resa_pro.core.thermo import compute_nozzle_performance_batch, lookup_combustion_batch
 
-@uq.command("monte-carlo")
-@click.option("--pc", type=float, default=2e6, show_default=True, help="Nominal chamber pressure [Pa].")
-@click.option("--pc-std", type=float, default=0.1e6, show_default=True, help="Chamber pressure std dev [Pa].")
-@click.option("--mr", type=float, default=4.0, show_default=True, help="Nominal mixture ratio.")
-@click.option("--mr-std", type=float, default=0.2, show_default=True, help="Mixture ratio std dev.")
-@click.option("--eps", type=float, default=10.0, show_default=True, help="Nominal expansion ratio.")
-@click.option("--eps-std", type=float, default=0.5, show_default=True, help="Expansion ratio std dev.")
-@click.option("--samples", "-n", type=int, default=1000, show_default=True, help="Number of MC samples.")
-@click.option("--seed", type=int, default=42, show_default=True, help="Random seed.")
-@click.option("--output", "-o", type=click.Path(), default=None, help="Output file (JSON).")
-@click.pass_context
-def monte_carlo_cmd(
-    ctx: click.Context,
-    pc: float,
-    pc_std: float,
-    mr: float,
-    mr_std: float,
-    eps: float,
-    eps_std: float,
-    samples: int,
-    seed: int,
-    output: str | None,
-) -> None:
-    """Run Monte Carlo uncertainty propagation on engine performance."""
-    console: Console = ctx.obj.get("console", Console())
+    pc = np.maximum(params["chamber_pressure"], 1e5)
+    mr = params["mixture_ratio"]
+    eps = np.maximum(params["expansion_ratio"], 1.1)
 
-    uq_engine = UncertaintyAnalysis()
-    uq_engine.add_parameter(UncertainParameter(
-        "chamber_pressure", pc, Distribution.NORMAL, std=pc_std, unit="Pa",
-    ))
-    uq_engine.add_parameter(UncertainParameter(
-        "mixture_ratio", mr, Distribution.NORMAL, std=mr_std,
-    ))
-    uq_engine.add_parameter(UncertainParameter(
-        "expansion_ratio", eps, Distribution.NORMAL, std=eps_std,
-    ))
-    uq_engine.add_output("Isp_vac")
-    uq_engine.add_output("c_star")
-    uq_engine.add_output("CF_vac")
+    comb = lookup_combustion_batch("n2o", "ethanol", mr)
+    perf = compute_nozzle_performance_batch(
+        gamma=comb["gamma"],
+        molar_mass=comb["molar_mass"],
+        Tc=comb["chamber_temperature"],
+        expansion_ratio=eps,
+        pc=pc,
+    )
+    return {
+        "Isp_vac": perf.Isp_vac,
+        "Isp_sl": perf.Isp_sl,
+        "c_star": perf.c_star,
+        "CF_vac": perf.CF_vac,
+    }
 
-    result = uq_engine.run(_engine_uq_eval, n_samples=samples, seed=seed)
 
-    console.print(f"\n[bold]RESA Pro — Monte Carlo UQ ({samples} samples)[/bold]\n")
+def _print_results(console: Console, result: UQResult, output_keys: list[str]) -> None:
+    """Render the statistics, sensitivity and correlation tables."""
+    from rich.table import Table
 
     # Output statistics
     stat_table = Table(title="Output Statistics")
@@ -110,12 +90,12 @@ def monte_carlo_cmd(
     if result.sensitivity_indices:
         sens_table = Table(title="First-Order Sensitivity Indices")
         sens_table.add_column("Parameter", style="cyan")
-        for key in uq_engine.output_keys:
+        for key in output_keys:
             sens_table.add_column(key, style="green", justify="right")
 
         for param_name, indices in result.sensitivity_indices.items():
             row = [param_name]
-            for key in uq_engine.output_keys:
+            for key in output_keys:
                 row.append(f"{indices.get(key, 0.0):.4f}")
             sens_table.add_row(*row)
 
@@ -125,39 +105,113 @@ def monte_carlo_cmd(
     if result.correlation_matrix:
         corr_table = Table(title="Input-Output Correlations")
         corr_table.add_column("Parameter", style="cyan")
-        for key in uq_engine.output_keys:
+        for key in output_keys:
             corr_table.add_column(key, style="green", justify="right")
 
         for param_name, corrs in result.correlation_matrix.items():
             row = [param_name]
-            for key in uq_engine.output_keys:
+            for key in output_keys:
                 val = corrs.get(key, 0.0)
                 row.append(f"{val:+.4f}")
             corr_table.add_row(*row)
 
         console.print(corr_table)
 
-    if result.n_failed > 0:
-        console.print(f"\n[yellow]Warning: {result.n_failed} samples failed[/yellow]")
+
+@click.group("uq")
+@click.pass_context
+def uq(ctx: click.Context) -> None:
+    """Uncertainty quantification commands."""
+    pass
+
+
+@uq.command("monte-carlo")
+@click.option("--pc", type=float, default=2e6, show_default=True, help="Nominal chamber pressure [Pa].")
+@click.option("--pc-std", type=float, default=0.1e6, show_default=True, help="Chamber pressure std dev [Pa].")
+@click.option("--mr", type=float, default=4.0, show_default=True, help="Nominal mixture ratio.")
+@click.option("--mr-std", type=float, default=0.2, show_default=True, help="Mixture ratio std dev.")
+@click.option("--eps", type=float, default=10.0, show_default=True, help="Nominal expansion ratio.")
+@click.option("--eps-std", type=float, default=0.5, show_default=True, help="Expansion ratio std dev.")
+@click.option("--samples", "-n", type=int, default=1000, show_default=True, help="Number of MC samples.")
+@click.option(
+    "--method",
+    type=click.Choice(["iid", "lhs", "sobol"]),
+    default="iid",
+    show_default=True,
+    help="Sampling scheme; lhs/sobol need fewer samples (power of two for sobol).",
+)
+@click.option("--seed", type=int, default=42, show_default=True, help="Random seed.")
+@click.option("--output", "-o", type=click.Path(), default=None, help="Output file (JSON).")
+@click.pass_context
+def monte_carlo_cmd(
+    ctx: click.Context,
+    pc: float,
+    pc_std: float,
+    mr: float,
+    mr_std: float,
+    eps: float,
+    eps_std: float,
+    samples: int,
+    method: str,
+    seed: int,
+    output: str | None,
+) -> None:
+    """Run Monte Carlo uncertainty propagation on engine performance."""
+    from resa_pro.optimization.uq import Distribution, UncertainParameter, UncertaintyAnalysis
+
+    console: Console = ctx.obj.get("console") or get_console()
+
+    uq_engine = UncertaintyAnalysis()
+    uq_engine.add_parameter(UncertainParameter(
+        "chamber_pressure", pc, Distribution.NORMAL, std=pc_std, unit="Pa",
+    ))
+    uq_engine.add_parameter(UncertainParameter(
+        "mixture_ratio", mr, Distribution.NORMAL, std=mr_std,
+    ))
+    uq_engine.add_parameter(UncertainParameter(
+        "expansion_ratio", eps, Distribution.NORMAL, std=eps_std,
+    ))
+    uq_engine.add_output("Isp_vac")
+    uq_engine.add_output("c_star")
+    uq_engine.add_output("CF_vac")
+
+    result = uq_engine.run(
+        _engine_uq_eval,
+        n_samples=samples,
+        seed=seed,
+        batch_func=_engine_uq_eval_batch,
+        sampling=method,
+    )
+
+    data = {
+        "n_samples": result.n_samples,
+        "n_failed": result.n_failed,
+        "statistics": {
+            key: {
+                "mean": s.mean,
+                "std": s.std,
+                "median": s.median,
+                "p05": s.p05,
+                "p95": s.p95,
+                "ci_95": [s.ci_95_lower, s.ci_95_upper],
+            }
+            for key, s in result.output_statistics.items()
+        },
+        "sensitivity_indices": result.sensitivity_indices,
+        "correlations": result.correlation_matrix,
+    }
+
+    json_out = ctx.obj.get("json_out")
+    if json_out:
+        emit_json(data)
+    else:
+        if not ctx.obj.get("quiet"):
+            console.print(f"\n[bold]RESA Pro — Monte Carlo UQ ({samples} samples)[/bold]\n")
+            _print_results(console, result, uq_engine.output_keys)
+        if result.n_failed > 0:
+            console.print(f"\n[yellow]Warning: {result.n_failed} samples failed[/yellow]")
 
     if output:
-        data = {
-            "n_samples": result.n_samples,
-            "n_failed": result.n_failed,
-            "statistics": {
-                key: {
-                    "mean": s.mean,
-                    "std": s.std,
-                    "median": s.median,
-                    "p05": s.p05,
-                    "p95": s.p95,
-                    "ci_95": [s.ci_95_lower, s.ci_95_upper],
-                }
-                for key, s in result.output_statistics.items()
-            },
-            "sensitivity_indices": result.sensitivity_indices,
-            "correlations": result.correlation_matrix,
-        }
-        with open(output, "w") as f:
-            json.dump(data, f, indent=2)
-        console.print(f"\n[dim]Saved to {output}[/dim]")
+        write_json(data, output)
+        if not json_out:
+            console.print(f"\n[dim]Saved to {output}[/dim]")
@@ -0,0 +1,131 @@
+"""CLI command to pre-compile cached Numba kernels."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import click
+
+from resa_pro.cli._console import emit_json, get_console
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# --- Warm-up tasks ---
+# Each task imports a module with @njit(cache=True) kernels and calls them with
+# tiny inputs, so the compiled code is written to Numba's on-disk cache.
+
+
+def _warm_revolve() -> None:
+    import numpy as np
+
+    from resa_pro.geometry3d.engine import revolve_contour
+
+    revolve_contour(np.array([0.0, 1.0]), np.array([1.0, 1.0]), n_circumferential=4)
+
+
+def _warm_thermo() -> None:
+    from resa_pro.core.thermo import _solve_exit_mach, mach_from_area_ratio
+
+    _solve_exit_mach(10.0, 1.2)
+    mach_from_area_ratio(2.0, 1.2, supersonic=False)
+
+
+def _warm_cooling() -> None:
+    import numpy as np
+
+    from resa_pro.core.cooling import analyze_regen_cooling
+    from resa_pro.core.thermal import bartz_heat_transfer_coefficient
+
+    bartz_heat_transfer_coefficient(2e6, 1500.0, 0.02, 3000.0, 600.0, 1.2, 0.025, 2.0)
+    analyze_regen_cooling(
+        np.array([0.0, 0.01]), np.array([0.02, 0.01]), 0.01,
+        pc=2e6, c_star=1500.0, Tc=3000.0, gamma=1.2, molar_mass=0.025,
+        coolant_mass_flow=0.1, coolant_inlet_temp=300.0, coolant_cp=2400.0,
+        coolant_rho=800.0, coolant_mu=1e-3, coolant_k=0.2, wall_conductivity=300.0,
+    )
+
+
+def _warm_feed_system() -> None:
+    from resa_pro.core.feed_system import feed_line_pressure_drop
+
+    feed_line_pressure_drop(0.5, 800.0, 1e-3, 0.01, 1.0)
+
+
+def _warm_moc() -> None:
+    from resa_pro.core.moc import _interior_point, compute_moc_nozzle, mach_angle
+
+    compute_moc_nozzle(0.01, 4.0, 1.2, num_char_lines=2)
+    # Scalar kernels the nozzle sweep does not call itself
+    mach_angle(2.0)
+    _interior_point(0.0, 0.02, 2.0, 0.2, 0.3, 0.0, 0.0, 1.8, 0.0, 0.2, 1.3)
+
+
+_WARMUP_TASKS = {
+    "core.cooling": _warm_cooling,
+    "core.feed_system": _warm_feed_system,
+    "core.moc": _warm_moc,
+    "core.thermo": _warm_thermo,
+    "geometry3d.revolve": _warm_revolve,
+}
+
+
+def _run_task(name: str) -> tuple[str, float]:
+    """Run one warm-up task and return (name, elapsed seconds)."""
+    t0 = time.perf_counter()
+    _WARMUP_TASKS[name]()
+    return name, time.perf_counter() - t0
+
+
+@click.command("warmup")
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=None,
+    help="Parallel worker processes (default: CPU count; 1 compiles in-process).",
+)
+@click.pass_context
+def warmup(ctx: click.Context, jobs: int | None) -> None:
+    """Pre-compile Numba kernels so the first real run skips JIT compilation.
+
+    Useful after installation or when building Docker/CI images.
+    """
+    from resa_pro.utils.jit import _HAS_NUMBA
+
+    console: Console = ctx.obj.get("console") or get_console()
+
+    json_out = ctx.obj.get("json_out")
+    quiet = json_out or ctx.obj.get("quiet")
+
+    if not _HAS_NUMBA:
+        if json_out:
+            emit_json({"numba": False, "tasks": {}})
+        elif not quiet:
+            console.print("[yellow]Numba is not installed — nothing to compile.[/yellow]")
+        return
+
+    names = list(_WARMUP_TASKS)
+    jobs = min(jobs or os.cpu_count() or 1, len(names))
+
+    if not quiet:
+        console.print(f"\n[bold]RESA Pro — Warm-up ({len(names)} tasks)[/bold]\n")
+    t0 = time.perf_counter()
+    if jobs == 1:
+        results = [_run_task(name) for name in names]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_run_task, names))
+
+    if json_out:
+        emit_json({"numba": True, "tasks": dict(results)})
+    if quiet:
+        return
+    for name, elapsed in results:
+        console.print(f"  {name:<28} {elapsed:6.2f} s")
+    console.print(f"\n[dim]Compiled in {time.perf_counter() - t0:.2f} s[/dim]")
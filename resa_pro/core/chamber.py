@@ -248,36 +248,47 @@ def generate_chamber_contour(
     Lc = geom.chamber_length
     Ru = geom.throat_upstream_radius
     beta = geom.convergent_half_angle
+    sin_b, cos_b, tan_b = math.sin(beta), math.cos(beta), math.tan(beta)
 
-    # --- Section 1: Cylindrical chamber ---
+    # Contour is written into preallocated arrays section by section
     n_cyl = num_points // 3
-    x_cyl = np.linspace(0, Lc, n_cyl, endpoint=False)
-    y_cyl = np.full_like(x_cyl, Rc)
+    n_conv = num_points // 3
+    x = np.empty(num_points)
+    y = np.empty(num_points)
+    cyl = slice(0, n_cyl)
+    conv = slice(n_cyl, n_cyl + n_conv)
+    arc = slice(n_cyl + n_conv, num_points)
+
+    # --- Section 1: Cylindrical chamber ---
+    x[cyl] = np.linspace(0.0, Lc, n_cyl, endpoint=False)
+    y[cyl] = Rc
 
     # --- Section 2: Convergent cone (from chamber to upstream throat arc tangent point) ---
     # The upstream arc is tangent to the cone at a point above the throat.
     # Tangent point on upstream arc:
     #   y_tang = Rt + Ru * (1 - cos(beta))
     #   The cone runs from Rc down to y_tang.
-    y_tang = Rt + Ru * (1.0 - math.cos(beta))
-    x_tang = Lc + (Rc - y_tang) / math.tan(beta)  # axial position of tangent point
+    y_tang = Rt + Ru * (1.0 - cos_b)
+    x_tang = Lc + (Rc - y_tang) / tan_b  # axial position of tangent point
 
-    n_conv = num_points // 3
-    x_conv = np.linspace(Lc, x_tang, n_conv, endpoint=False)
-    y_conv = Rc - (x_conv - Lc) * math.tan(beta)
+    x[conv] = np.linspace(Lc, x_tang, n_conv, endpoint=False)
+    np.subtract(x[conv], Lc, out=y[conv])
+    y[conv] *= tan_b
+    np.subtract(Rc, y[conv], out=y[conv])
 
     # --- Section 3: Upstream throat circular arc ---
     # Arc from tangent point to throat (angle sweeps from beta to 0)
     # Arc center: (x_center, Rt + Ru)
-    x_center = x_tang + Ru * math.sin(beta)
+    x_center = x_tang + Ru * sin_b
     y_center = Rt + Ru
 
-    n_arc = num_points - n_cyl - n_conv
-    theta = np.linspace(PI / 2 + beta, PI / 2, n_arc)
-    x_arc = x_center + Ru * np.cos(theta)
-    y_arc = y_center - Ru * np.sin(theta)
-
-    x = np.concatenate([x_cyl, x_conv, x_arc])
-    y = np.concatenate([y_cyl, y_conv, y_arc])
+    # theta, overwritten below
+    y[arc] = np.linspace(PI / 2 + beta, PI / 2, num_points - n_cyl - n_conv)
+    np.cos(y[arc], out=x[arc])
+    x[arc] *= Ru
+    x[arc] += x_center
+    np.sin(y[arc], out=y[arc])
+    y[arc] *= Ru
+    np.subtract(y_center, y[arc], out=y[arc])
 
     return x, y
@@ -1,14 +1,15 @@
 """Design state management and project I/O for RESA Pro.
 
 Handles saving/loading engine designs in JSON (metadata, config) and
-HDF5 (large array data like contour points and simulation results).
+HDF5 (large array data like contour points and simulation results),
+either as a JSON + companion ``.h5`` pair or as a single HDF5 file.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -26,6 +27,14 @@ except ImportError:
     _HAS_H5PY = False
     logger.info("h5py not available — HDF5 features disabled")
 
+# orjson serialises numpy arrays natively; fall back to the stdlib encoder
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 # --- Project metadata ---
 
@@ -82,6 +91,41 @@ class DesignState:
     # Array data stored separately in HDF5
     _array_data: dict[str, np.ndarray] = field(default_factory=dict, repr=False)
 
+    # Decoded contour arrays, keyed by section name (not persisted)
+    _contour_cache: dict[str, tuple[Any, np.ndarray, np.ndarray]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def contour(self, section: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return the (x, y) contour of a section as float arrays.
+
+        Contours are kept as the raw lists decoded from JSON and only
+        converted to numpy on first access, so commands that never touch
+        geometry skip the conversion.  The result is cached until the
+        section's ``contour_x`` entry is replaced.
+
+        Args:
+            section: Section name holding the contour (``"chamber"`` or
+                ``"nozzle"``).
+
+        Returns:
+            Tuple of (x, y) arrays, or None if the section has no contour.
+        """
+        data: dict[str, Any] = getattr(self, section)
+        raw_x = data.get("contour_x")
+        raw_y = data.get("contour_y")
+        if raw_x is None or raw_y is None:
+            return None
+
+        cached = self._contour_cache.get(section)
+        if cached is not None and cached[0] is raw_x:
+            return cached[1], cached[2]
+
+        x = np.asarray(raw_x, dtype=float)
+        y = np.asarray(raw_y, dtype=float)
+        self._contour_cache[section] = (raw_x, x, y)
+        return x, y
+
 
 # --- JSON serialization ---
 
@@ -99,74 +143,292 @@ class _NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _orjson_default(obj: Any) -> Any:
+    """orjson fallback for numpy values it cannot encode from the buffer.
+
+    orjson only serialises C-contiguous arrays of common dtypes; slices,
+    reversed views and e.g. float16 arrays or scalars land here.
+    """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _design_document(state: DesignState) -> dict[str, Any]:
+    """JSON document for *state*, excluding array data and cached views."""
+    # Build the document shallowly from the public fields: asdict() would
+    # deep-copy every section value and the HDF5-bound _array_data only to
+    # encode (or discard) them
+    data = {
+        f.name: getattr(state, f.name) for f in fields(state) if not f.name.startswith("_")
+    }
+    data["meta"] = asdict(state.meta)
+    return data
+
+
+def _encode_json(data: dict[str, Any], indent: bool = True) -> bytes:
+    """Encode a design document, with orjson if available."""
+    if _HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_orjson_default, option=option)
+    # json.dump() would issue one write per encoder chunk
+    return json.dumps(data, indent=2 if indent else None, cls=_NumpyEncoder).encode()
+
+
+def _decode_json(payload: bytes | str) -> dict[str, Any]:
+    """Decode a design document, with orjson if available."""
+    document: dict[str, Any] = orjson.loads(payload) if _HAS_ORJSON else json.loads(payload)
+    return document
+
+
+def _state_from_document(data: dict[str, Any]) -> DesignState:
+    """Rebuild a DesignState from a decoded JSON document."""
+    meta = ProjectMeta(**data.pop("meta", {}))
+    return DesignState(meta=meta, **data)
+
+
 def save_design_json(state: DesignState, path: str | Path) -> None:
     """Save design state to a JSON file (excludes large arrays).
 
+    Numpy arrays in the section dicts (e.g. contours) are written as JSON
+    lists; with orjson installed they are encoded directly from the array
+    buffer without an intermediate Python list.
+
     Arrays stored in _array_data are written to a companion HDF5 file
-    if h5py is available.
+    if h5py is available, and the document records whether it did
+    (``has_array_data``) so loading can skip looking for one.  See
+    :func:`save_design_hdf5` for a single-file alternative.
     """
     path = Path(path)
     state.meta.touch()
+    write_arrays = bool(_HAS_H5PY and state._array_data)
 
-    # Serialise the dataclass, skipping _array_data
-    data = asdict(state)
-    data.pop("_array_data", None)
-
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, cls=_NumpyEncoder)
+    # Encode the whole document up front and write it in one call
+    data = _design_document(state)
+    data["has_array_data"] = write_arrays
+    path.write_bytes(_encode_json(data))
 
     logger.info("Saved design to %s", path)
 
     # Optionally write arrays to HDF5
-    if _HAS_H5PY and state._array_data:
-        h5_path = path.with_suffix(".h5")
-        save_arrays_hdf5(state._array_data, h5_path)
+    if write_arrays:
+        save_arrays_hdf5(state._array_data, path.with_suffix(".h5"))
 
 
 def load_design_json(path: str | Path) -> DesignState:
     """Load design state from a JSON file.
 
-    If a companion .h5 file exists, array data is also loaded.
+    If the design was saved with array data, the companion .h5 file is
+    also loaded.  Files written before ``has_array_data`` was recorded
+    fall back to checking whether the companion exists.  Contour lists
+    are left as decoded; use :meth:`DesignState.contour` to get them as
+    arrays.
     """
     path = Path(path)
-    with open(path) as f:
-        data = json.load(f)
-
-    meta = ProjectMeta(**data.pop("meta", {}))
-    state = DesignState(meta=meta, **data)
+    data = _decode_json(path.read_bytes())
+    has_arrays = data.pop("has_array_data", None)
+    state = _state_from_document(data)
 
     # Load companion HDF5 if present
-    h5_path = path.with_suffix(".h5")
-    if _HAS_H5PY and h5_path.exists():
-        state._array_data = load_arrays_hdf5(h5_path)
+    if _HAS_H5PY and has_arrays is not False:
+        h5_path = path.with_suffix(".h5")
+        if has_arrays or h5_path.exists():
+            state._array_data = load_arrays_hdf5(h5_path)
 
     return state
 
 
-# --- HDF5 helpers ---
+def save_design_hdf5(state: DesignState, path: str | Path, **dataset_options: Any) -> None:
+    """Save design state and its arrays to a single HDF5 file.
 
+    The JSON document (as written by :func:`save_design_json`, without
+    indentation) is stored in the root ``design_json`` attribute and each
+    ``_array_data`` entry as a dataset, all in one file open.  The file is
+    written next to *path* and renamed into place, so an interrupted save
+    never leaves a half-written design behind.
 
-def save_arrays_hdf5(arrays: dict[str, np.ndarray], path: str | Path) -> None:
-    """Save a dictionary of numpy arrays to HDF5."""
+    Args:
+        state: Design state to save.
+        path: Output file path (conventionally ``.resa``).
+        **dataset_options: Chunking/compression options forwarded to
+            :func:`save_arrays_hdf5`.
+
+    Raises:
+        ImportError: If h5py is not installed.
+        ValueError: If an array is named ``_packed`` (reserved).
+    """
+    if not _HAS_H5PY:
+        raise ImportError("h5py is required for single-file HDF5 designs")
+    _check_array_names(state._array_data)
+    path = Path(path)
+    state.meta.touch()
+
+    payload = _encode_json(_design_document(state), indent=False)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with h5py.File(tmp_path, "w") as f:
+            f.attrs["design_json"] = payload.decode()
+            _write_datasets(f, state._array_data, **dataset_options)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info("Saved design with %d arrays to %s", len(state._array_data), path)
+
+
+def load_design_hdf5(path: str | Path) -> DesignState:
+    """Load a design saved with :func:`save_design_hdf5`.
+
+    Raises:
+        ImportError: If h5py is not installed.
+        KeyError: If the file has no ``design_json`` attribute.
+    """
+    if not _HAS_H5PY:
+        raise ImportError("h5py is required for single-file HDF5 designs")
+    path = Path(path)
+    with h5py.File(path, "r") as f:
+        state = _state_from_document(_decode_json(f.attrs["design_json"]))
+        state._array_data = _read_datasets(f)
+    return state
+
+
+# --- HDF5 helpers ---
+
+# Group holding small arrays packed into compound records, and the
+# number of fields per record
+_PACKED_GROUP = "_packed"
+_PACKED_FIELDS = 256
+
+
+def _check_array_names(arrays: dict[str, np.ndarray]) -> None:
+    """Reject array names that collide with the packed-record group."""
+    if _PACKED_GROUP in arrays:
+        raise ValueError(f"Array name {_PACKED_GROUP!r} is reserved for packed small arrays")
+
+
+def _chunk_shape(shape: tuple[int, ...], itemsize: int, chunk_bytes: int) -> tuple[int, ...]:
+    """Chunk shape of about *chunk_bytes*, blocking only the leading axis."""
+    row_bytes = itemsize * int(np.prod(shape[1:], dtype=np.int64))
+    rows = max(1, chunk_bytes // max(row_bytes, 1))
+    return (min(shape[0], rows), *shape[1:])
+
+
+def save_arrays_hdf5(
+    arrays: dict[str, np.ndarray],
+    path: str | Path,
+    compression: str | None = "lzf",
+    shuffle: bool = True,
+    chunk_bytes: int = 1 << 20,
+    min_chunked_bytes: int = 64 << 10,
+    pack_small: bool = True,
+) -> None:
+    """Save a dictionary of numpy arrays to HDF5.
+
+    Arrays of at least *min_chunked_bytes* are stored chunked (about
+    *chunk_bytes* per chunk, whole rows along the leading axis) with the
+    byte-shuffle filter and *compression*.  Smooth contour and simulation
+    data typically shrinks 2-4x with LZF at negligible CPU cost.  Smaller
+    arrays are stored contiguously, where per-chunk overhead would dominate.
+
+    With *pack_small*, the small arrays are instead packed as fields of
+    compound records in the reserved ``_packed`` group, so a result made
+    of many short per-station series costs a few dataset creations rather
+    than one per array.  :func:`load_arrays_hdf5` unpacks them
+    transparently; disable packing for files read by other HDF5 tools.
+
+    Args:
+        arrays: Mapping of dataset name to array.
+        path: Output file path.
+        compression: h5py compression filter (``"lzf"``, ``"gzip"``) or None.
+        shuffle: Apply the shuffle filter before compression.
+        chunk_bytes: Target chunk size in bytes.
+        min_chunked_bytes: Arrays smaller than this are stored contiguously.
+        pack_small: Pack arrays smaller than *min_chunked_bytes* into
+            compound records.
+
+    Raises:
+        ValueError: If an array is named ``_packed`` (reserved).
+    """
     if not _HAS_H5PY:
         logger.warning("h5py not available, skipping HDF5 save")
         return
+    _check_array_names(arrays)
     path = Path(path)
     with h5py.File(path, "w") as f:
-        for key, arr in arrays.items():
-            f.create_dataset(key, data=arr)
+        _write_datasets(
+            f, arrays, compression, shuffle, chunk_bytes, min_chunked_bytes, pack_small
+        )
         f.attrs["created"] = datetime.now(timezone.utc).isoformat()
     logger.info("Saved %d arrays to %s", len(arrays), path)
 
 
+def _write_datasets(
+    f: h5py.File,
+    arrays: dict[str, np.ndarray],
+    compression: str | None = "lzf",
+    shuffle: bool = True,
+    chunk_bytes: int = 1 << 20,
+    min_chunked_bytes: int = 64 << 10,
+    pack_small: bool = True,
+) -> None:
+    """Write *arrays* as datasets of an open file (see :func:`save_arrays_hdf5`)."""
+    small: dict[str, np.ndarray] = {}
+    for key, arr in arrays.items():
+        arr = np.asarray(arr)
+        if arr.ndim == 0 or arr.nbytes < min_chunked_bytes:
+            small[key] = arr
+            continue
+        f.create_dataset(
+            key,
+            data=arr,
+            chunks=_chunk_shape(arr.shape, arr.dtype.itemsize, chunk_bytes),
+            shuffle=shuffle,
+            compression=compression,
+        )
+
+    if not pack_small or len(small) < 2:
+        for key, arr in small.items():
+            f.create_dataset(key, data=arr)
+        return
+
+    # One scalar compound record per batch; HDF5 caps the size of the
+    # datatype header, so very many fields are split across records
+    group = f.create_group(_PACKED_GROUP)
+    items = list(small.items())
+    for start in range(0, len(items), _PACKED_FIELDS):
+        batch = items[start : start + _PACKED_FIELDS]
+        record = np.empty((), dtype=[(key, arr.dtype, arr.shape) for key, arr in batch])
+        for key, arr in batch:
+            record[key] = arr
+        group.create_dataset(str(start // _PACKED_FIELDS), data=record)
+
+
 def load_arrays_hdf5(path: str | Path) -> dict[str, np.ndarray]:
-    """Load all datasets from an HDF5 file into a dictionary."""
+    """Load all datasets from an HDF5 file into a dictionary.
+
+    Each dataset is read with ``dset[()]``, which h5py turns into a single
+    H5Dread into a freshly allocated array (no intermediate copy); scalar
+    datasets come back as numpy scalars.
+    """
     if not _HAS_H5PY:
         logger.warning("h5py not available, skipping HDF5 load")
         return {}
     path = Path(path)
-    arrays: dict[str, np.ndarray] = {}
     with h5py.File(path, "r") as f:
-        for key in f.keys():
-            arrays[key] = f[key][:]
+        return _read_datasets(f)
+
+
+def _read_datasets(f: h5py.File) -> dict[str, np.ndarray]:
+    """Read every dataset of an open file into memory, unpacking records."""
+    arrays: dict[str, np.ndarray] = {}
+    for key, node in f.items():
+        if key != _PACKED_GROUP or not isinstance(node, h5py.Group):
+            arrays[key] = node[()]
+            continue
+        for dset in node.values():
+            record = dset[()]
+            for name in record.dtype.names:
+                arrays[name] = record[name]
     return arrays
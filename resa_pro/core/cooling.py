@@ -7,20 +7,26 @@ calculations for regenerative cooling jackets.
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property
+from typing import overload
 
 import numpy as np
 
-from resa_pro.utils.constants import PI
+from resa_pro.core.thermal import _bartz_constant, _bartz_scaled, _bartz_sigma, _gas_viscosity
+from resa_pro.utils.constants import PI, R_UNIVERSAL
+from resa_pro.utils.friction import darcy_friction_factor_array
+from resa_pro.utils.jit import njit
 
 
-@dataclass
+@dataclass(frozen=True)
 class CoolingChannel:
     """Cooling channel cross-section geometry.
 
     Rectangular channel geometry is assumed (most common for milled or
-    electroformed regenerative jackets).
+    electroformed regenerative jackets).  Instances are immutable, so the
+    derived areas and diameters are computed once and cached.
     """
 
     width: float = 1.0e-3  # m — channel width
@@ -29,22 +35,22 @@ class CoolingChannel:
     fin_width: float = 1.0e-3  # m — land (rib) width between channels
     n_channels: int = 40  # number of channels around circumference
 
-    @property
+    @cached_property
     def area(self) -> float:
         """Channel cross-sectional flow area [m²]."""
         return self.width * self.height
 
-    @property
+    @cached_property
     def wetted_perimeter(self) -> float:
         """Wetted perimeter of rectangular channel [m]."""
         return 2.0 * (self.width + self.height)
 
-    @property
+    @cached_property
     def hydraulic_diameter(self) -> float:
         """Hydraulic diameter Dh = 4A/P [m]."""
         return 4.0 * self.area / self.wetted_perimeter
 
-    @property
+    @cached_property
     def total_flow_area(self) -> float:
         """Total coolant flow area across all channels [m²]."""
         return self.n_channels * self.area
@@ -73,41 +79,66 @@ def size_channels(
     Returns:
         CoolingChannel with dimensions and channel count.
     """
-    outer_radius = local_radius + wall_thickness + channel_height
-    circumference = 2.0 * PI * (local_radius + wall_thickness + channel_height / 2.0)
-    pitch = channel_width + fin_width
-    n = max(1, int(circumference / pitch))
-
     return CoolingChannel(
         width=channel_width,
         height=channel_height,
         wall_thickness=wall_thickness,
         fin_width=fin_width,
-        n_channels=n,
+        n_channels=int(
+            _channel_count(local_radius, channel_width, fin_width, channel_height, wall_thickness)
+        ),
     )
 
 
+def _channel_count(
+    local_radius: float | np.ndarray,
+    channel_width: float,
+    fin_width: float,
+    channel_height: float,
+    wall_thickness: float,
+) -> np.ndarray:
+    """Number of channels fitting around the circumference (array-aware)."""
+    circumference = 2.0 * PI * (local_radius + wall_thickness + channel_height / 2.0)
+    pitch = channel_width + fin_width
+    return np.maximum(1, np.floor(circumference / pitch).astype(np.int32))
+
+
+@overload
 def coolant_htc_dittus_boelter(
-    Re: float,
-    Pr: float,
-    k: float,
-    Dh: float,
+    Re: float, Pr: float, k: float, Dh: float, heating: bool = ...
+) -> float: ...
+@overload
+def coolant_htc_dittus_boelter(
+    Re: np.ndarray,
+    Pr: float | np.ndarray,
+    k: float | np.ndarray,
+    Dh: float | np.ndarray,
+    heating: bool = ...,
+) -> np.ndarray: ...
+
+
+def coolant_htc_dittus_boelter(
+    Re: float | np.ndarray,
+    Pr: float | np.ndarray,
+    k: float | np.ndarray,
+    Dh: float | np.ndarray,
     heating: bool = True,
-) -> float:
+) -> float | np.ndarray:
     """Dittus-Boelter correlation for turbulent forced convection.
 
     Nu = 0.023 · Re^0.8 · Pr^n
     where n = 0.4 for heating, 0.3 for cooling.
 
     Args:
-        Re: Reynolds number.
+        Re: Reynolds number (scalar or array).
         Pr: Prandtl number.
         k: Thermal conductivity of coolant [W/(m·K)].
         Dh: Hydraulic diameter [m].
         heating: True if fluid is being heated (default).
 
     Returns:
-        Coolant-side heat transfer coefficient [W/(m²·K)].
+        Coolant-side heat transfer coefficient [W/(m²·K)], an array for
+        array ``Re``.
     """
     n = 0.4 if heating else 0.3
     Nu = 0.023 * Re**0.8 * Pr**n
@@ -145,16 +176,17 @@ def coolant_htc_sieder_tate(
 
 
 def channel_pressure_drop(
-    length: float,
-    Dh: float,
+    length: float | np.ndarray,
+    Dh: float | np.ndarray,
     rho: float,
-    velocity: float,
-    Re: float,
+    velocity: float | np.ndarray,
+    Re: float | np.ndarray,
     roughness: float = 3.0e-6,
-) -> float:
+) -> float | np.ndarray:
     """Frictional pressure drop in a cooling channel [Pa].
 
     Uses the Darcy-Weisbach equation with the Colebrook friction factor.
+    Array inputs are evaluated element-wise.
 
     Args:
         length: Channel length [m].
@@ -167,34 +199,10 @@ def channel_pressure_drop(
     Returns:
         Frictional pressure drop [Pa].
     """
-    f = _friction_factor(Re, Dh, roughness)
+    f = darcy_friction_factor_array(Re, Dh, roughness)
     return f * (length / Dh) * 0.5 * rho * velocity**2
 
 
-def _friction_factor(Re: float, Dh: float, roughness: float) -> float:
-    """Darcy friction factor using Swamee-Jain approximation.
-
-    Explicit approximation of the Colebrook equation.
-
-    Args:
-        Re: Reynolds number.
-        Dh: Hydraulic diameter [m].
-        roughness: Surface roughness [m].
-
-    Returns:
-        Darcy friction factor.
-    """
-    if Re < 2300:
-        # Laminar
-        return 64.0 / max(Re, 1.0)
-
-    # Swamee-Jain (1976) explicit approximation
-    eps_d = roughness / Dh
-    log_arg = eps_d / 3.7 + 5.74 / Re**0.9
-    f = 0.25 / (math.log10(log_arg)) ** 2
-    return f
-
-
 @dataclass
 class CoolingStation:
     """Results at a single axial station along the cooling jacket."""
@@ -221,11 +229,95 @@ class CoolingStation:
     k_wall: float = 0.0  # W/(m·K) — wall thermal conductivity
 
 
+def _empty_column() -> np.ndarray:
+    return np.empty(0)
+
+
+@dataclass
+class CoolingStationsArray:
+    """Station-by-station cooling results stored as columns.
+
+    Each field holds one float64 array of length n (``n_channels`` is
+    int32), in marching order.  Channel dimensions and wall conductivity
+    are the same at every station and are stored once.  Indexing or
+    iterating yields :class:`CoolingStation` views built on demand, so
+    ``result.stations[i].T_wg`` keeps working.
+    """
+
+    x: np.ndarray = field(default_factory=_empty_column)
+    radius: np.ndarray = field(default_factory=_empty_column)
+    n_channels: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    h_g: np.ndarray = field(default_factory=_empty_column)
+    q_dot: np.ndarray = field(default_factory=_empty_column)
+    T_aw: np.ndarray = field(default_factory=_empty_column)
+    h_c: np.ndarray = field(default_factory=_empty_column)
+    T_coolant: np.ndarray = field(default_factory=_empty_column)
+    v_coolant: np.ndarray = field(default_factory=_empty_column)
+    Re: np.ndarray = field(default_factory=_empty_column)
+    dp: np.ndarray = field(default_factory=_empty_column)
+    T_wg: np.ndarray = field(default_factory=_empty_column)
+    T_wc: np.ndarray = field(default_factory=_empty_column)
+
+    channel_width: float = 1.0e-3  # m
+    channel_height: float = 2.0e-3  # m
+    wall_thickness: float = 1.0e-3  # m
+    fin_width: float = 1.0e-3  # m
+    k_wall: float = 0.0  # W/(m·K)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @overload
+    def __getitem__(self, i: int) -> CoolingStation: ...
+    @overload
+    def __getitem__(self, i: slice) -> CoolingStationsArray: ...
+
+    def __getitem__(self, i: int | slice) -> CoolingStation | CoolingStationsArray:
+        """Build the :class:`CoolingStation` for station *i*.
+
+        A slice such as ``[::10]`` returns a :class:`CoolingStationsArray` of column views.
+        """
+        if isinstance(i, slice):
+            columns = {
+                f.name: getattr(self, f.name)[i]
+                for f in fields(self)
+                if isinstance(getattr(self, f.name), np.ndarray)
+            }
+            return replace(self, **columns)
+        if not -len(self) <= i < len(self):
+            raise IndexError("station index out of range")
+        return CoolingStation(
+            x=float(self.x[i]),
+            radius=float(self.radius[i]),
+            channel=CoolingChannel(
+                width=self.channel_width,
+                height=self.channel_height,
+                wall_thickness=self.wall_thickness,
+                fin_width=self.fin_width,
+                n_channels=int(self.n_channels[i]),
+            ),
+            h_g=float(self.h_g[i]),
+            q_dot=float(self.q_dot[i]),
+            T_aw=float(self.T_aw[i]),
+            h_c=float(self.h_c[i]),
+            T_coolant=float(self.T_coolant[i]),
+            v_coolant=float(self.v_coolant[i]),
+            Re=float(self.Re[i]),
+            dp=float(self.dp[i]),
+            T_wg=float(self.T_wg[i]),
+            T_wc=float(self.T_wc[i]),
+            k_wall=self.k_wall,
+        )
+
+    def __iter__(self) -> Iterator[CoolingStation]:
+        return (self[i] for i in range(len(self)))
+
+
 @dataclass
 class CoolingAnalysisResult:
     """Complete regenerative cooling analysis result."""
 
-    stations: list[CoolingStation] = field(default_factory=list)
+    stations: CoolingStationsArray = field(default_factory=CoolingStationsArray)
     total_pressure_drop: float = 0.0  # Pa
     coolant_outlet_temperature: float = 0.0  # K
     max_wall_temperature: float = 0.0  # K — peak gas-side wall temperature
@@ -233,6 +325,61 @@ class CoolingAnalysisResult:
     total_heat_load: float = 0.0  # W
 
 
+@njit(cache=True)
+def _march_coolant(
+    ar: np.ndarray,
+    mach: np.ndarray,
+    t_aw: np.ndarray,
+    r_c: np.ndarray,
+    d_area: np.ndarray,
+    t_in: float,
+    r_w: float,
+    heat_capacity_rate: float,
+    pc: float,
+    c_star: float,
+    d_throat: float,
+    t_chamber: float,
+    gamma: float,
+    molar_mass: float,
+    cp_gas: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """March the coolant temperature along the stations.
+
+    Evaluates Bartz at each station with the wall temperature implied by
+    the coolant temperature so far, then the 1-D heat flux and the coolant
+    temperature rise.  A zero *heat_capacity_rate* keeps the coolant at
+    *t_in*.
+
+    Returns:
+        (h_g, q_dot, t_coolant) — coolant temperature is the value after
+        each station.  Totals are left to NumPy reductions by the caller.
+    """
+    n = len(ar)
+    h_g = np.empty(n)
+    q_dot = np.empty(n)
+    t_coolant = np.empty(n)
+    t_cool = t_in
+    # Pr = 0.5, the Bartz default for combustion gases
+    factor = _bartz_constant(pc, c_star, d_throat, cp_gas, 0.5)
+    for i in range(n):
+        t_wall = max(t_cool + 100.0, 500.0)
+        mu_ref = _gas_viscosity(molar_mass, 0.5 * (t_chamber + t_wall))
+        sigma = _bartz_sigma(t_wall, t_chamber, gamma, mach[i])
+        h = _bartz_scaled(factor, mu_ref, ar[i], sigma)
+
+        # 1-D wall temperature calculation
+        r_g = 1.0 / h if h > 0 else 1e10
+        q = (t_aw[i] - t_cool) / (r_g + r_w + r_c[i])
+        h_g[i] = h
+        q_dot[i] = q
+
+        # Coolant temperature rise: q · dA = ṁ · cp · dT
+        if heat_capacity_rate > 0:
+            t_cool += q * d_area[i] / heat_capacity_rate
+        t_coolant[i] = t_cool
+    return h_g, q_dot, t_coolant
+
+
 def analyze_regen_cooling(
     contour_x: np.ndarray,
     contour_y: np.ndarray,
@@ -291,100 +438,86 @@ def analyze_regen_cooling(
         CoolingAnalysisResult with station-by-station data.
     """
     from resa_pro.core.thermal import (
+        _mach_from_area_ratio_approx_array,
         adiabatic_wall_temperature,
-        bartz_heat_transfer_coefficient,
-        _mach_from_area_ratio_approx,
     )
 
-    At = PI * throat_radius**2
     Dt = 2.0 * throat_radius
 
     # Station ordering: if counter-flow, march from nozzle exit to injector
-    n = len(contour_x)
+    x_st = np.array(contour_x, dtype=float)
+    r_st = np.array(contour_y, dtype=float)
     if counter_flow:
-        indices = list(range(n - 1, -1, -1))
-    else:
-        indices = list(range(n))
-
-    T_cool = coolant_inlet_temp
-    total_dp = 0.0
-    total_heat = 0.0
-    max_Twg = 0.0
-    max_q = 0.0
-    stations: list[CoolingStation] = []
-
-    for i, idx in enumerate(indices):
-        x = contour_x[idx]
-        r = contour_y[idx]
-        A = PI * r**2
-        ar = max(A / At, 1.0)
-
-        # Gas-side Mach number and adiabatic wall temperature
-        M = _mach_from_area_ratio_approx(ar, gamma) if ar > 1.001 else 1.0
-        T_aw = adiabatic_wall_temperature(Tc, gamma, M)
-
-        # Gas-side HTC (Bartz)
-        h_g = bartz_heat_transfer_coefficient(
-            pc=pc, c_star=c_star, Dt=Dt, Tc=Tc, Tw=max(T_cool + 100, 500),
-            gamma=gamma, molar_mass=molar_mass, local_area_ratio=ar,
-        )
-
-        # Channel geometry at this station
-        chan = size_channels(r, channel_width, fin_width, channel_height, wall_thickness)
-
-        # Coolant velocity and Reynolds number
-        v_cool = coolant_mass_flow / (coolant_rho * chan.total_flow_area) if chan.total_flow_area > 0 else 0.0
-        Dh = chan.hydraulic_diameter
-        Re = coolant_rho * v_cool * Dh / coolant_mu if coolant_mu > 0 else 0.0
-        Pr = coolant_mu * coolant_cp / coolant_k if coolant_k > 0 else 0.7
-
-        # Coolant-side HTC
-        h_c = coolant_htc_dittus_boelter(Re, Pr, coolant_k, Dh)
-
-        # 1-D wall temperature calculation
-        R_g = 1.0 / h_g if h_g > 0 else 1e10
-        R_w = wall_thickness / wall_conductivity if wall_conductivity > 0 else 1e10
-        R_c = 1.0 / h_c if h_c > 0 else 1e10
-        R_total = R_g + R_w + R_c
-
-        q_dot = (T_aw - T_cool) / R_total
-        T_wg = T_aw - q_dot * R_g
-        T_wc = T_cool + q_dot * R_c
-
-        # Incremental pressure drop
-        if i > 0:
-            prev_idx = indices[i - 1]
-            dx = abs(contour_x[idx] - contour_x[prev_idx])
-        else:
-            dx = 0.0
-
-        dp_station = channel_pressure_drop(dx, Dh, coolant_rho, v_cool, Re) if dx > 0 else 0.0
-        total_dp += dp_station
-
-        # Coolant temperature rise: q · dA = ṁ · cp · dT
-        perimeter_heated = 2.0 * PI * r
-        dA = perimeter_heated * dx if i > 0 else 0.0
-        dQ = q_dot * dA
-        total_heat += dQ
-        if coolant_mass_flow > 0 and coolant_cp > 0:
-            T_cool += dQ / (coolant_mass_flow * coolant_cp)
-
-        max_Twg = max(max_Twg, T_wg)
-        max_q = max(max_q, q_dot)
-
-        stations.append(CoolingStation(
-            x=x, radius=r, channel=chan,
-            h_g=h_g, q_dot=q_dot, T_aw=T_aw,
-            h_c=h_c, T_coolant=T_cool, v_coolant=v_cool,
-            Re=Re, dp=dp_station,
-            T_wg=T_wg, T_wc=T_wc, k_wall=wall_conductivity,
-        ))
+        x_st = np.ascontiguousarray(x_st[::-1])
+        r_st = np.ascontiguousarray(r_st[::-1])
+    n = len(x_st)
+
+    # Everything except the coolant temperature is independent of the march,
+    # so evaluate it for all stations at once
+    ar = np.maximum((r_st / throat_radius) ** 2, 1.0)
+
+    # Gas-side Mach number and adiabatic wall temperature
+    M_local = _mach_from_area_ratio_approx_array(ar, gamma)
+    M = np.where(ar > 1.001, M_local, 1.0)
+    T_aw = adiabatic_wall_temperature(Tc, gamma, M)
+
+    # Channel geometry, coolant velocity and Reynolds number
+    n_chan = _channel_count(r_st, channel_width, fin_width, channel_height, wall_thickness)
+    template = CoolingChannel(channel_width, channel_height, wall_thickness, fin_width)
+    chan_area = template.area
+    Dh = template.hydraulic_diameter
+    flow_area = n_chan * chan_area
+    v_cool = coolant_mass_flow / (coolant_rho * flow_area) if chan_area > 0 else np.zeros(n)
+    Re = coolant_rho * v_cool * Dh / coolant_mu if coolant_mu > 0 else np.zeros(n)
+    Pr = coolant_mu * coolant_cp / coolant_k if coolant_k > 0 else 0.7
+
+    # Coolant-side HTC and thermal resistances
+    h_c = coolant_htc_dittus_boelter(Re, Pr, coolant_k, Dh)
+    R_w = wall_thickness / wall_conductivity if wall_conductivity > 0 else 1e10
+    R_c = np.where(h_c > 0, 1.0 / np.where(h_c > 0, h_c, 1.0), 1e10)
+
+    # Incremental pressure drop and heated area between successive stations
+    dx = np.zeros(n)
+    dx[1:] = np.abs(np.diff(x_st))
+    dp = np.where(dx > 0, channel_pressure_drop(dx, Dh, coolant_rho, v_cool, Re), 0.0)
+    dA = 2.0 * PI * r_st * dx  # heated (hot-gas wall) area
+
+    # The gas-side HTC depends on the wall temperature, and so on the
+    # coolant temperature reached so far: march that part station by station
+    heat_capacity_rate = (
+        coolant_mass_flow * coolant_cp if coolant_mass_flow > 0 and coolant_cp > 0 else 0.0
+    )
+    cp_gas = gamma * (R_UNIVERSAL / molar_mass) / (gamma - 1.0)
+    h_g, q_dot, T_coolant = _march_coolant(
+        ar, M_local, T_aw, R_c, dA,
+        float(coolant_inlet_temp), float(R_w), float(heat_capacity_rate),
+        float(pc), float(c_star), float(Dt), float(Tc), float(gamma),
+        float(molar_mass), float(cp_gas),
+    )
+    T_cool = float(T_coolant[-1]) if n else coolant_inlet_temp
+
+    # Wall temperatures use the coolant temperature at each station's inlet
+    T_cool_in = np.concatenate(([coolant_inlet_temp], T_coolant))[:-1]
+    R_g = np.where(h_g > 0, 1.0 / np.where(h_g > 0, h_g, 1.0), 1e10)
+    T_wg = T_aw - q_dot * R_g
+    T_wc = T_cool_in + q_dot * R_c
+
+    stations = CoolingStationsArray(
+        x=x_st, radius=r_st, n_channels=n_chan,
+        h_g=h_g, q_dot=q_dot, T_aw=T_aw,
+        h_c=h_c, T_coolant=T_coolant, v_coolant=v_cool,
+        Re=Re, dp=dp,
+        T_wg=T_wg, T_wc=T_wc,
+        channel_width=channel_width, channel_height=channel_height,
+        wall_thickness=wall_thickness, fin_width=fin_width, k_wall=wall_conductivity,
+    )
 
+    # Summary values are single reductions over the station columns
     return CoolingAnalysisResult(
         stations=stations,
-        total_pressure_drop=total_dp,
+        total_pressure_drop=float(dp.sum()),
         coolant_outlet_temperature=T_cool,
-        max_wall_temperature=max_Twg,
-        max_heat_flux=max_q,
-        total_heat_load=total_heat,
+        max_wall_temperature=float(T_wg.max(initial=0.0)),
+        max_heat_flux=float(q_dot.max(initial=0.0)),
+        total_heat_load=float(np.dot(q_dot, dA)),
     )
@@ -6,10 +6,12 @@ pressure-drop estimation for pressure-fed and blowdown systems.
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from resa_pro.utils.constants import PI, R_UNIVERSAL, G_0
+from resa_pro.utils.friction import darcy_friction_factor, darcy_friction_factor_array
 
 
 # --- Tank sizing ---
@@ -270,12 +272,7 @@ def feed_line_pressure_drop(
     Re = rho * v * line_diameter / mu if mu > 0 else 0.0
 
     # Friction factor (Swamee-Jain approximation)
-    if Re < 2300:
-        f = 64.0 / max(Re, 1.0)
-    else:
-        eps_d = roughness / line_diameter
-        log_arg = eps_d / 3.7 + 5.74 / Re**0.9
-        f = 0.25 / (math.log10(log_arg)) ** 2
+    f = darcy_friction_factor(Re, line_diameter, roughness)
 
     dp_friction = f * (line_length / line_diameter) * 0.5 * rho * v**2
     dp_minor = K_minor * 0.5 * rho * v**2
@@ -293,6 +290,99 @@ def feed_line_pressure_drop(
     )
 
 
+@dataclass
+class FeedLineResultArray:
+    """Feed-line pressure drops for many segments, stored as arrays.
+
+    Every field has the broadcast shape of the inputs to
+    :func:`feed_line_pressure_drop_batch`.  Indexing yields the
+    :class:`FeedLineResult` of one segment.
+    """
+
+    length: np.ndarray
+    inner_diameter: np.ndarray
+    velocity: np.ndarray
+    reynolds: np.ndarray
+    friction_dp: np.ndarray
+    minor_dp: np.ndarray
+    gravity_dp: np.ndarray
+    total_dp: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.total_dp)
+
+    def __getitem__(self, i: int | tuple[int, ...]) -> FeedLineResult:
+        """Build the :class:`FeedLineResult` for segment *i*."""
+        return FeedLineResult(
+            length=float(self.length[i]),
+            inner_diameter=float(self.inner_diameter[i]),
+            velocity=float(self.velocity[i]),
+            reynolds=float(self.reynolds[i]),
+            friction_dp=float(self.friction_dp[i]),
+            minor_dp=float(self.minor_dp[i]),
+            gravity_dp=float(self.gravity_dp[i]),
+            total_dp=float(self.total_dp[i]),
+        )
+
+
+def feed_line_pressure_drop_batch(
+    mass_flow: float | np.ndarray,
+    rho: float | np.ndarray,
+    mu: float | np.ndarray,
+    line_diameter: float | np.ndarray,
+    line_length: float | np.ndarray,
+    height_change: float | np.ndarray = 0.0,
+    K_minor: float | np.ndarray = 5.0,
+    roughness: float = 1.5e-6,
+) -> FeedLineResultArray:
+    """Vectorised :func:`feed_line_pressure_drop` for line sweeps.
+
+    All arguments except *roughness* may be arrays and are broadcast
+    against each other, so e.g. a diameter × length grid is evaluated in
+    one pass instead of one call (and result object) per combination.
+
+    Args:
+        mass_flow: Mass flow rate [kg/s].
+        rho: Fluid density [kg/m³].
+        mu: Dynamic viscosity [Pa·s].
+        line_diameter: Inner diameter of feed line [m].
+        line_length: Total line length [m].
+        height_change: Elevation change (positive = upward) [m].
+        K_minor: Sum of minor loss coefficients for fittings, bends, valves.
+        roughness: Pipe inner surface roughness [m].
+
+    Returns:
+        FeedLineResultArray with the pressure-drop breakdown per segment.
+    """
+    mass_flow, rho, mu, d, length, dz, k_minor = np.broadcast_arrays(
+        *(
+            np.asarray(a, dtype=float)
+            for a in (mass_flow, rho, mu, line_diameter, line_length, height_change, K_minor)
+        )
+    )
+
+    area = PI * (d / 2.0) ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.where(area > 0, mass_flow / (rho * area), 0.0)
+        reynolds = np.where(mu > 0, rho * v * d / mu, 0.0)
+        f = darcy_friction_factor_array(reynolds, d, roughness)
+        dynamic = 0.5 * rho * v**2
+        dp_friction = f * (length / d) * dynamic
+    dp_minor = k_minor * dynamic
+    dp_gravity = rho * G_0 * dz
+
+    return FeedLineResultArray(
+        length=length,
+        inner_diameter=d,
+        velocity=v,
+        reynolds=reynolds,
+        friction_dp=dp_friction,
+        minor_dp=dp_minor,
+        gravity_dp=dp_gravity,
+        total_dp=dp_friction + dp_minor + dp_gravity,
+    )
+
+
 # --- System-level pressure budget ---
 
 
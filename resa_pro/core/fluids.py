@@ -6,6 +6,7 @@ proper error handling and optional RefProp backend fallback.
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 from functools import lru_cache
@@ -13,7 +14,7 @@ from pathlib import Path
 from typing import Any
 
 import CoolProp.CoolProp as CP
-from CoolProp.CoolProp import PropsSI
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,12 @@ class Fluid:
     backend object.  Supports both HEOS (CoolProp default) and REFPROP
     backends transparently.
 
+    The AbstractState and critical-point constants are interned per
+    ``(name, backend)``, so constructing a Fluid is cheap and every
+    instance of the same fluid shares one state object.  That state is
+    not thread-safe: code that evaluates properties from several threads
+    should give each thread its own copy via :meth:`fresh`.
+
     Args:
         name: CoolProp fluid name (e.g. "NitrousOxide", "Ethanol", "Oxygen").
         backend: CoolProp backend string.  ``"HEOS"`` for built-in,
@@ -54,17 +61,23 @@ class Fluid:
         self.name = name
         self.backend = backend
         try:
-            self._state = CP.AbstractState(backend, name)
+            (
+                self._state,
+                self.T_critical,
+                self.P_critical,
+                self.T_min,
+                self.molar_mass,  # kg/mol
+            ) = _shared_state(name, backend)
         except Exception as exc:
             raise FluidPropertyError(
                 f"Cannot create fluid '{name}' with backend '{backend}': {exc}"
             ) from exc
 
-        # Cache critical point
-        self.T_critical = self._state.T_critical()
-        self.P_critical = self._state.p_critical()
-        self.T_min = self._state.Tmin()
-        self.molar_mass = self._state.molar_mass()  # kg/mol
+    def fresh(self) -> Fluid:
+        """Return a copy of this fluid with its own, unshared AbstractState."""
+        clone = copy.copy(self)
+        clone._state = CP.AbstractState(self.backend, self.name)
+        return clone
 
     # --- Core property access ---
 
@@ -85,8 +98,67 @@ class Fluid:
         self._update(CP.HmassP_INPUTS, H, P)
         return self._extract_props()
 
+    def props_at_TP_array(self, T: np.ndarray, P: np.ndarray) -> dict[str, np.ndarray]:
+        """Property bundles at many (T [K], P [Pa]) points, as arrays.
+
+        *T* and *P* are broadcast against each other.  Returns the same keys
+        as :meth:`props_at_TP`, each mapped to an array of the broadcast
+        shape (``phase`` as int32), filled point by point from the cached
+        state without building a dict per point.
+        """
+        T, P = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(P, dtype=float))
+        s = self._state
+        getters = {
+            "T": s.T,
+            "P": s.p,
+            "rho": s.rhomass,
+            "h": s.hmass,
+            "s": s.smass,
+            "cp": s.cpmass,
+            "cv": s.cvmass,
+            "mu": s.viscosity,
+            "k": s.conductivity,
+            "phase": s.phase,
+            "speed_of_sound": s.speed_sound,
+        }
+        calls = tuple(getters.values())
+        i_phase = list(getters).index("phase")
+        twophase = CP.iphase_twophase
+
+        # Gather plain floats row by row and convert once at the end, which
+        # is cheaper than a scalar ndarray store per property and point
+        rows = []
+        quality = []
+        for t, p in zip(T.ravel().tolist(), P.ravel().tolist()):
+            self._update(CP.PT_INPUTS, p, t)
+            row = [get() for get in calls]
+            rows.append(row)
+            quality.append(s.Q() if row[i_phase] == twophase else -1.0)
+
+        table = np.array(rows, dtype=float).reshape(T.size, len(calls))
+        out = {key: table[:, j].reshape(T.shape).copy() for j, key in enumerate(getters)}
+        out["phase"] = out["phase"].astype(np.int32)
+        out["Q"] = np.array(quality, dtype=float).reshape(T.shape)
+        return out
+
+    def density_array(self, T: np.ndarray, P: np.ndarray) -> np.ndarray:
+        """Density [kg/m³] at many (T [K], P [Pa]) points.
+
+        *T* and *P* are broadcast against each other.  Unlike vectorised
+        ``PropsSI``, which returns ``inf`` for a failed point, an invalid
+        state raises :class:`FluidPropertyError`.
+        """
+        T, P = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(P, dtype=float))
+        rhomass = self._state.rhomass
+        rho = []
+        for t, p in zip(T.ravel().tolist(), P.ravel().tolist()):
+            self._update(CP.PT_INPUTS, p, t)
+            rho.append(rhomass())
+        return np.array(rho, dtype=float).reshape(T.shape)
+
     def _extract_props(self) -> dict[str, float]:
         s = self._state
+        phase = s.phase()
         return {
             "T": s.T(),
             "P": s.p(),
@@ -97,66 +169,111 @@ class Fluid:
             "cv": s.cvmass(),
             "mu": s.viscosity(),
             "k": s.conductivity(),
-            "phase": s.phase(),
-            "Q": s.Q() if s.phase() in (CP.iphase_twophase,) else -1.0,
+            "phase": phase,
+            "Q": s.Q() if phase == CP.iphase_twophase else -1.0,
             "speed_of_sound": s.speed_sound(),
         }
 
     # --- Convenience scalar lookups ---
+    # Each lookup reads one property off a cached AbstractState (avoiding
+    # PropsSI's per-call backend construction and fluid name parsing), and
+    # results are memoised on the exact inputs, so sweeps that revisit a
+    # state point skip the equation-of-state evaluation entirely.
+
+    def _lookup(self, input_pair: int, val1: float, val2: float, getter: str) -> float:
+        return _cached_property(self.name, self.backend, input_pair, val1, val2, getter)
 
     def density(self, T: float, P: float) -> float:
         """Density [kg/m³] at T [K], P [Pa]."""
-        return PropsSI("D", "T", T, "P", P, self.name)
+        return self._lookup(CP.PT_INPUTS, P, T, "rhomass")
 
     def specific_heat_cp(self, T: float, P: float) -> float:
         """Isobaric specific heat [J/(kg·K)]."""
-        return PropsSI("C", "T", T, "P", P, self.name)
+        return self._lookup(CP.PT_INPUTS, P, T, "cpmass")
 
     def viscosity(self, T: float, P: float) -> float:
         """Dynamic viscosity [Pa·s]."""
-        return PropsSI("V", "T", T, "P", P, self.name)
+        return self._lookup(CP.PT_INPUTS, P, T, "viscosity")
 
     def thermal_conductivity(self, T: float, P: float) -> float:
         """Thermal conductivity [W/(m·K)]."""
-        return PropsSI("L", "T", T, "P", P, self.name)
+        return self._lookup(CP.PT_INPUTS, P, T, "conductivity")
 
     def enthalpy(self, T: float, P: float) -> float:
         """Mass-specific enthalpy [J/kg]."""
-        return PropsSI("H", "T", T, "P", P, self.name)
+        return self._lookup(CP.PT_INPUTS, P, T, "hmass")
 
     def entropy(self, T: float, P: float) -> float:
         """Mass-specific entropy [J/(kg·K)]."""
-        return PropsSI("S", "T", T, "P", P, self.name)
+        return self._lookup(CP.PT_INPUTS, P, T, "smass")
 
     def speed_of_sound(self, T: float, P: float) -> float:
         """Speed of sound [m/s]."""
-        return PropsSI("A", "T", T, "P", P, self.name)
+        return self._lookup(CP.PT_INPUTS, P, T, "speed_sound")
 
     def gamma(self, T: float, P: float) -> float:
         """Ratio of specific heats cp/cv."""
-        cp = self.specific_heat_cp(T, P)
-        cv = PropsSI("O", "T", T, "P", P, self.name)  # Cv
-        return cp / cv
+        return self._lookup(CP.PT_INPUTS, P, T, "gamma")
 
     def saturation_pressure(self, T: float) -> float:
         """Saturation (vapour) pressure [Pa] at temperature T [K]."""
-        return PropsSI("P", "T", T, "Q", 0, self.name)
+        return self._lookup(CP.QT_INPUTS, 0.0, T, "p")
 
     def saturation_temperature(self, P: float) -> float:
         """Saturation temperature [K] at pressure P [Pa]."""
-        return PropsSI("T", "P", P, "Q", 0, self.name)
+        return self._lookup(CP.PQ_INPUTS, P, 0.0, "T")
 
     def quality(self, P: float, H: float) -> float:
         """Vapour quality at given P [Pa] and H [J/kg]. Returns -1 if single-phase."""
         try:
-            return PropsSI("Q", "P", P, "H", H, self.name)
-        except Exception:
+            return self._lookup(CP.HmassP_INPUTS, H, P, "Q")
+        except FluidPropertyError:
             return -1.0
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoised scalar lookups (shared by every Fluid)."""
+        _cached_property.cache_clear()
+
     def __repr__(self) -> str:
         return f"Fluid('{self.name}', backend='{self.backend}')"
 
 
+# --- Memoised scalar lookups ---
+
+
+@lru_cache(maxsize=32)
+def _shared_state(
+    name: str, backend: str
+) -> tuple[CP.AbstractState, float, float, float, float]:
+    """Interned AbstractState and its constants for one fluid.
+
+    Returns:
+        (state, T_critical [K], P_critical [Pa], T_min [K], molar mass [kg/mol]).
+    """
+    state = CP.AbstractState(backend, name)
+    return state, state.T_critical(), state.p_critical(), state.Tmin(), state.molar_mass()
+
+
+@lru_cache(maxsize=4096)
+def _cached_property(
+    name: str, backend: str, input_pair: int, val1: float, val2: float, getter: str
+) -> float:
+    """Evaluate one property at a state point; failures are not cached.
+
+    *getter* names an AbstractState method (e.g. ``"rhomass"``), or is
+    ``"gamma"`` for cp/cv from the same update.
+    """
+    state = _shared_state(name, backend)[0]
+    try:
+        state.update(input_pair, val1, val2)
+    except Exception as exc:
+        raise FluidPropertyError(f"State update failed for {name}: {exc}") from exc
+    if getter == "gamma":
+        return state.cpmass() / state.cvmass()
+    return float(getattr(state, getter)())
+
+
 # --- Propellant database ---
 
 
@@ -170,6 +287,12 @@ def _load_propellant_db() -> dict[str, Any]:
         return json.load(f)
 
 
+@lru_cache(maxsize=1)
+def _propellant_index() -> dict[str, dict[str, Any]]:
+    """Case-folded name -> database entry (first match wins), built once per process."""
+    return {key.lower(): val for key, val in reversed(_load_propellant_db().items())}
+
+
 def list_propellants() -> list[str]:
     """Return names of all propellants in the database."""
     return list(_load_propellant_db().keys())
@@ -187,12 +310,11 @@ def get_propellant_info(name: str) -> dict[str, Any]:
     Raises:
         KeyError: If propellant is not found.
     """
-    db = _load_propellant_db()
     # Case-insensitive lookup
-    for key, val in db.items():
-        if key.lower() == name.lower():
-            return val
-    raise KeyError(f"Propellant '{name}' not found. Available: {list(db.keys())}")
+    try:
+        return _propellant_index()[name.lower()]
+    except KeyError:
+        raise KeyError(f"Propellant '{name}' not found. Available: {list_propellants()}") from None
 
 
 def get_fluid(propellant_name: str) -> Fluid:
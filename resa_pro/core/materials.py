@@ -6,9 +6,10 @@ database and provides interpolated look-ups.
 
 from __future__ import annotations
 
+import bisect
 import json
 import logging
-from functools import lru_cache
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +32,54 @@ def _load_materials_db() -> dict[str, Any]:
         return json.load(f)
 
 
+@lru_cache(maxsize=1)
+def _materials_index() -> dict[str, dict[str, Any]]:
+    """Case-folded material id -> database entry (first match wins), built once per process."""
+    return {key.lower(): val for key, val in reversed(_load_materials_db().items())}
+
+
+@cache
+def _property_tables(material_key: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Read-only (k_T, k, cp_T, cp) interpolation tables for one material.
+
+    Built once per case-folded material id and shared by every
+    :class:`Material` instance, so the arrays must not be modified.
+    """
+    info = _materials_index()[material_key]
+    k_data = info["thermal_conductivity"]
+    cp_data = info["specific_heat"]
+    tables = (
+        np.array(k_data["T"], dtype=np.float64),
+        np.array(k_data["k"], dtype=np.float64),
+        np.array(cp_data["T"], dtype=np.float64),
+        np.array(cp_data["cp"], dtype=np.float64),
+    )
+    for arr in tables:
+        arr.flags.writeable = False
+    return tables
+
+
+@cache
+def _diffusivity_table(material_key: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read-only (T, k, ρ·cp) on the union of the k and cp temperature grids.
+
+    Both properties are piecewise linear with breakpoints on this grid
+    (and continue their end segments beyond it), so a single segment
+    search per query recovers k(T) and ρ·cp(T) exactly.
+    """
+    k_temps, k_vals, cp_temps, cp_vals = _property_tables(material_key)
+    density = _materials_index()[material_key]["density"]
+    temps = np.union1d(k_temps, cp_temps)
+    tables = (
+        temps,
+        linear_interp_1d(k_temps, k_vals, temps, extrapolate=True),
+        density * linear_interp_1d(cp_temps, cp_vals, temps, extrapolate=True),
+    )
+    for arr in tables:
+        arr.flags.writeable = False
+    return tables
+
+
 def list_materials() -> list[str]:
     """Return all material identifiers in the database."""
     return list(_load_materials_db().keys())
@@ -42,11 +91,12 @@ def get_material_info(material_id: str) -> dict[str, Any]:
     Raises:
         KeyError: If material_id is not in the database.
     """
-    db = _load_materials_db()
-    for key, val in db.items():
-        if key.lower() == material_id.lower():
-            return val
-    raise KeyError(f"Material '{material_id}' not found. Available: {list(db.keys())}")
+    try:
+        return _materials_index()[material_id.lower()]
+    except KeyError:
+        raise KeyError(
+            f"Material '{material_id}' not found. Available: {list_materials()}"
+        ) from None
 
 
 class Material:
@@ -64,31 +114,50 @@ class Material:
         self.density: float = info["density"]  # kg/m³
         self.melting_point: float = info["melting_point"]  # K
 
-        # Build interpolation arrays
-        k_data = info["thermal_conductivity"]
-        self._k_T = np.asarray(k_data["T"], dtype=float)
-        self._k_vals = np.asarray(k_data["k"], dtype=float)
-
-        cp_data = info["specific_heat"]
-        self._cp_T = np.asarray(cp_data["T"], dtype=float)
-        self._cp_vals = np.asarray(cp_data["cp"], dtype=float)
+        # Interpolation arrays, shared across instances of this material
+        self._k_T, self._k_vals, self._cp_T, self._cp_vals = _property_tables(
+            material_id.lower()
+        )
+        self._alpha_T, self._alpha_k, self._alpha_rho_cp = _diffusivity_table(
+            material_id.lower()
+        )
+        self._alpha_T_list = self._alpha_T.tolist()
 
         self.yield_strength_20C: float = info.get("yield_strength_20C", 0.0)  # MPa
         self.ultimate_tensile_20C: float = info.get("ultimate_tensile_20C", 0.0)  # MPa
 
-    def thermal_conductivity(self, T: float) -> float:
+    # The getters below accept a scalar T or an array of temperatures and
+    # return the same shape; beyond the table the end segments are extended.
+
+    def thermal_conductivity(self, T: float | np.ndarray) -> float | np.ndarray:
         """Thermal conductivity [W/(m·K)] at temperature T [K]."""
         return linear_interp_1d(self._k_T, self._k_vals, T, extrapolate=True)
 
-    def specific_heat(self, T: float) -> float:
+    def specific_heat(self, T: float | np.ndarray) -> float | np.ndarray:
         """Specific heat capacity [J/(kg·K)] at temperature T [K]."""
         return linear_interp_1d(self._cp_T, self._cp_vals, T, extrapolate=True)
 
-    def thermal_diffusivity(self, T: float) -> float:
-        """Thermal diffusivity [m²/s] at temperature T [K]."""
-        k = self.thermal_conductivity(T)
-        cp = self.specific_heat(T)
-        return k / (self.density * cp)
+    def thermal_diffusivity(self, T: float | np.ndarray) -> float | np.ndarray:
+        """Thermal diffusivity [m²/s] at temperature T [K].
+
+        Finds the segment once on the merged k/cp grid and evaluates both
+        linear pieces there, rather than interpolating k and cp separately.
+        """
+        grid, k, rho_cp = self._alpha_T, self._alpha_k, self._alpha_rho_cp
+        last = len(grid) - 2
+        if np.isscalar(T):
+            i = min(max(bisect.bisect_right(self._alpha_T_list, T) - 1, 0), last)
+            w = (T - grid[i]) / (grid[i + 1] - grid[i])
+            k_at = k[i] + w * (k[i + 1] - k[i])
+            return float(k_at / (rho_cp[i] + w * (rho_cp[i + 1] - rho_cp[i])))
+
+        temps = np.asarray(T, dtype=float)
+        seg = np.clip(np.searchsorted(grid, temps, side="right") - 1, 0, last)
+        w = (temps - grid[seg]) / (grid[seg + 1] - grid[seg])
+        alpha: np.ndarray = (k[seg] + w * (k[seg + 1] - k[seg])) / (
+            rho_cp[seg] + w * (rho_cp[seg + 1] - rho_cp[seg])
+        )
+        return alpha
 
     def __repr__(self) -> str:
         return f"Material('{self.material_id}': {self.name})"
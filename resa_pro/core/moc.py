@@ -10,10 +10,10 @@ import math
 from dataclasses import dataclass, field
 
 import numpy as np
-from scipy.optimize import brentq
 
 from resa_pro.core.thermo import area_ratio_from_mach, mach_from_area_ratio
 from resa_pro.utils.constants import DEG_TO_RAD, PI, RAD_TO_DEG
+from resa_pro.utils.jit import _HAS_NUMBA, njit
 
 
 @dataclass
@@ -27,6 +27,16 @@ class MOCPoint:
     nu: float  # Prandtl-Meyer angle [rad]
 
 
+# Record layout of MOCResult.mesh_points, one row per MOCPoint
+MOCPOINT_DTYPE = np.dtype(
+    [("x", "f8"), ("y", "f8"), ("M", "f8"), ("theta", "f8"), ("nu", "f8")]
+)
+
+
+def _empty_mesh() -> np.recarray:
+    return np.recarray(0, dtype=MOCPOINT_DTYPE)
+
+
 @dataclass
 class MOCResult:
     """Result of the MOC nozzle computation."""
@@ -38,9 +48,11 @@ class MOCResult:
     wall_y: np.ndarray = field(default_factory=lambda: np.array([]))
     exit_mach: float = 0.0
     length: float = 0.0
-    mesh_points: list[MOCPoint] = field(default_factory=list)
+    # Columns via mesh_points.x etc.; mesh_points[i].x for a single point
+    mesh_points: np.recarray = field(default_factory=_empty_mesh)
 
 
+@njit(cache=True)
 def prandtl_meyer(M: float, gamma: float) -> float:
     """Prandtl-Meyer function ν(M) [radians].
 
@@ -54,20 +66,122 @@ def prandtl_meyer(M: float, gamma: float) -> float:
     return math.sqrt(gp1 / gm1) * math.atan(term) - math.atan(math.sqrt(M**2 - 1.0))
 
 
+# Upper end of the Mach range searched when inverting ν(M)
+_M_MAX = 50.0
+
+
+@njit(cache=True)
 def mach_from_prandtl_meyer(nu: float, gamma: float) -> float:
     """Invert Prandtl-Meyer function to get Mach from ν.
 
-    Uses Brent's method on the interval [1, 50].
+    Solves on the interval [1, 50] with a bracketed Newton iteration.
+    Compiled alongside :func:`prandtl_meyer`, so it can be called from
+    other Numba kernels.
+
+    Raises:
+        ValueError: If ν exceeds the Prandtl-Meyer angle at M = 50.
     """
     if nu <= 0:
         return 1.0
+    if nu >= prandtl_meyer(_M_MAX, gamma):
+        raise ValueError("Prandtl-Meyer angle is beyond M = 50")
+    return _invert_prandtl_meyer(nu, gamma)
+
 
-    def residual(M: float) -> float:
-        return prandtl_meyer(M, gamma) - nu
+@njit(cache=True)
+def _invert_prandtl_meyer(nu: float, gamma: float) -> float:
+    """Mach number with ν(M) = *nu* on (1, 50), for 0 < ν < ν(50).
 
-    return brentq(residual, 1.0, 50.0, xtol=1e-10)
+    Newton iteration in β = sqrt(M²−1), where
+    ν = a·arctan(β/a) − arctan(β) with a = sqrt((γ+1)/(γ−1)), starting from
+    the small-ν expansion ν ≈ (1 − 1/a²)·β³/3.  ν is monotonic in β, so the
+    sign of the residual keeps a bracket around the root and steps that
+    would leave it fall back to bisection.  Compiled with Numba when
+    available, since the MOC construction inverts ν at every point.
+    """
+    a = math.sqrt((gamma + 1.0) / (gamma - 1.0))
+    inv_a2 = 1.0 / (a * a)
+    c = 1.0 - inv_a2
+    lo = 0.0
+    hi = math.sqrt(_M_MAX * _M_MAX - 1.0)
+    beta = min((3.0 * nu / c) ** (1.0 / 3.0), hi)
+    for _ in range(100):
+        f = a * math.atan(beta / a) - math.atan(beta) - nu
+        if f > 0.0:
+            hi = beta
+        else:
+            lo = beta
+        b2 = beta * beta
+        dnu = c * b2 / ((1.0 + b2 * inv_a2) * (1.0 + b2))
+        beta_new = beta - f / dnu if dnu > 0.0 else 0.5 * (lo + hi)
+        if not lo <= beta_new <= hi:
+            beta_new = 0.5 * (lo + hi)
+        if abs(beta_new - beta) <= 1e-13 * beta_new:
+            beta = beta_new
+            break
+        beta = beta_new
+    return math.sqrt(1.0 + beta * beta)
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _invert_prandtl_meyer_array(nu: np.ndarray, gamma: float) -> np.ndarray:
+        """Vectorised :func:`_invert_prandtl_meyer` (compiled loop)."""
+        mach = np.empty(nu.size)
+        for i in range(nu.size):
+            mach[i] = _invert_prandtl_meyer(nu[i], gamma)
+        return mach
+
+else:
+
+    def _invert_prandtl_meyer_array(nu: np.ndarray, gamma: float) -> np.ndarray:
+        """Vectorised :func:`_invert_prandtl_meyer`.
+
+        Runs the same bracketed Newton iteration over the whole array,
+        freezing each element once its step meets the scalar tolerance.
+        """
+        a = math.sqrt((gamma + 1.0) / (gamma - 1.0))
+        inv_a2 = 1.0 / (a * a)
+        c = 1.0 - inv_a2
+        lo = np.zeros_like(nu)
+        hi = np.full_like(nu, math.sqrt(_M_MAX * _M_MAX - 1.0))
+        beta = np.minimum(np.cbrt(3.0 * nu / c), hi)
+        active = np.ones(nu.shape, dtype=bool)
+        for _ in range(100):
+            if not active.any():
+                break
+            f = a * np.arctan(beta / a) - np.arctan(beta) - nu
+            hi = np.where(f > 0.0, beta, hi)
+            lo = np.where(f > 0.0, lo, beta)
+            b2 = beta * beta
+            dnu = c * b2 / ((1.0 + b2 * inv_a2) * (1.0 + b2))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                beta_new = beta - f / dnu
+            bisect = ~((dnu > 0.0) & (lo <= beta_new) & (beta_new <= hi))
+            beta_new = np.where(bisect, 0.5 * (lo + hi), beta_new)
+            converged = np.abs(beta_new - beta) <= 1e-13 * beta_new
+            beta = np.where(active, beta_new, beta)
+            active &= ~converged
+        return np.sqrt(1.0 + beta * beta)
+
+
+def _mach_from_prandtl_meyer_array(nu: np.ndarray, gamma: float) -> np.ndarray:
+    """Array version of :func:`mach_from_prandtl_meyer`.
+
+    Raises:
+        ValueError: If any ν exceeds the Prandtl-Meyer angle at M = 50.
+    """
+    nu = np.ascontiguousarray(nu, dtype=float)
+    if np.any(nu >= prandtl_meyer(_M_MAX, gamma)):
+        raise ValueError("Prandtl-Meyer angle is beyond M = 50")
+    mach = np.ones_like(nu)
+    pos = nu > 0.0
+    mach[pos] = _invert_prandtl_meyer_array(nu[pos], gamma)
+    return mach
 
 
+@njit(cache=True)
 def mach_angle(M: float) -> float:
     """Mach angle μ = arcsin(1/M) [rad]."""
     if M <= 1.0:
@@ -75,6 +189,45 @@ def mach_angle(M: float) -> float:
     return math.asin(1.0 / M)
 
 
+@njit(cache=True)
+def _interior_point(
+    x1: float, y1: float, m1: float, theta1: float, nu1: float,
+    x2: float, y2: float, m2: float, theta2: float, nu2: float,
+    gamma: float,
+) -> tuple[float, float, float, float, float]:
+    """Compiled core of :func:`_solve_interior_point` on plain floats.
+
+    Returns:
+        (x, y, M, θ, ν) of the new point.
+    """
+    k_plus = theta1 + nu1   # along C+ from p1
+    k_minus = theta2 - nu2  # along C- from p2
+
+    theta_new = 0.5 * (k_plus + k_minus)
+    nu_new = 0.5 * (k_plus - k_minus)
+    m_new = mach_from_prandtl_meyer(nu_new, gamma)
+
+    # Position: average of characteristic slopes
+    mu1 = mach_angle(m1)
+    mu2 = mach_angle(m2)
+    mu_new = mach_angle(m_new)
+
+    # C+ slope: tan(θ - μ), C- slope: tan(θ + μ)
+    slope_cp = math.tan(0.5 * (theta1 + theta_new) - 0.5 * (mu1 + mu_new))
+    slope_cm = math.tan(0.5 * (theta2 + theta_new) + 0.5 * (mu2 + mu_new))
+
+    # Intersection of y = y1 + slope_cp·(x − x1) and y = y2 + slope_cm·(x − x2)
+    denom = slope_cp - slope_cm
+    if abs(denom) < 1e-15:
+        x_new = 0.5 * (x1 + x2)
+        y_new = 0.5 * (y1 + y2)
+    else:
+        x_new = (y2 - y1 + slope_cp * x1 - slope_cm * x2) / denom
+        y_new = y1 + slope_cp * (x_new - x1)
+
+    return x_new, y_new, m_new, theta_new, nu_new
+
+
 def _solve_interior_point(
     p1: MOCPoint, p2: MOCPoint, gamma: float
 ) -> MOCPoint:
@@ -86,33 +239,16 @@ def _solve_interior_point(
     Compatibility equations (2-D planar, simplified):
         Along C+: θ + ν = const  (K+ = θ1 + ν1)
         Along C-: θ - ν = const  (K- = θ2 - ν2)
-    """
-    Kplus = p1.theta + p1.nu   # along C+ from p1
-    Kminus = p2.theta - p2.nu  # along C- from p2
-
-    theta_new = 0.5 * (Kplus + Kminus)
-    nu_new = 0.5 * (Kplus - Kminus)
-    M_new = mach_from_prandtl_meyer(nu_new, gamma)
-
-    # Position: average of characteristic slopes
-    mu1 = mach_angle(p1.M)
-    mu2 = mach_angle(p2.M)
-    mu_new = mach_angle(M_new)
 
-    # C+ slope: tan(θ - μ), C- slope: tan(θ + μ)
-    slope_cp = math.tan(0.5 * (p1.theta + theta_new) - 0.5 * (mu1 + mu_new))
-    slope_cm = math.tan(0.5 * (p2.theta + theta_new) + 0.5 * (mu2 + mu_new))
-
-    # Intersection
-    denom = slope_cm - slope_cp
-    if abs(denom) < 1e-15:
-        x_new = 0.5 * (p1.x + p2.x)
-        y_new = 0.5 * (p1.y + p2.y)
-    else:
-        x_new = (p2.y - p1.y + slope_cp * p1.x - slope_cm * p2.x) / denom
-        y_new = p1.y + slope_cp * (x_new - p1.x)
-
-    return MOCPoint(x=x_new, y=y_new, M=M_new, theta=theta_new, nu=nu_new)
+    The arithmetic lives in :func:`_interior_point`, which mesh loops
+    compiled with Numba can call directly on array columns.
+    """
+    x, y, mach, theta, nu = _interior_point(
+        p1.x, p1.y, p1.M, p1.theta, p1.nu,
+        p2.x, p2.y, p2.M, p2.theta, p2.nu,
+        gamma,
+    )
+    return MOCPoint(x=x, y=y, M=mach, theta=theta, nu=nu)
 
 
 def _solve_wall_point(
@@ -155,6 +291,19 @@ def _solve_wall_point(
     return MOCPoint(x=x_wall, y=y_wall, M=M_wall, theta=theta_wall, nu=nu_wall)
 
 
+def _enforce_min_spacing(x: np.ndarray, delta: float) -> np.ndarray:
+    """Apply x_k = max(x_k, x_{k-1} + δ) along *x* without a Python loop.
+
+    Shifting by k·δ turns the recurrence into a running maximum.  Points
+    the constraint leaves alone keep their value exactly rather than a
+    shifted-and-restored copy.
+    """
+    step = delta * np.arange(len(x))
+    shifted = x - step
+    running = np.maximum.accumulate(shifted)
+    return np.where(shifted >= running, x, running + step)
+
+
 def compute_moc_nozzle(
     throat_radius: float,
     expansion_ratio: float,
@@ -195,42 +344,32 @@ def compute_moc_nozzle(
     # At the sharp corner origin (x=0, y=Rt), for each ray i:
     #   θ_i = i · dθ,  ν_i = θ_i  (from centerline K- = 0 condition)
 
-    all_points: list[MOCPoint] = []
-
     # --- Step 2: Trace each ray to the centerline (θ = 0 reflection) ---
-    # At the centerline, θ = 0, so ν_cl = K+_i = 2·θ_i
-    centerline_points: list[MOCPoint] = []
-    for i in range(1, N + 1):
-        theta_i = i * d_theta
-        nu_cl = 2.0 * theta_i  # K+ = θ + ν, at axis θ=0 so ν = K+
-        M_cl = mach_from_prandtl_meyer(nu_cl, gamma)
-        mu_cl = mach_angle(M_cl)
-
-        # Position: fan ray from (0, Rt) hits the axis.
-        # Ray direction: angle (θ_i - μ_i) below horizontal where μ_i = mach_angle(M_i)
-        M_i = mach_from_prandtl_meyer(theta_i, gamma)
-        mu_i = mach_angle(M_i)
-        ray_angle = theta_i - mu_i  # angle from horizontal (negative → downward)
-
-        # Distance from (0, Rt) to centerline along the ray
-        if abs(math.sin(ray_angle)) > 1e-10:
-            dist = Rt / abs(math.sin(-ray_angle)) if ray_angle < 0 else Rt * 10
-        else:
-            dist = Rt * 10  # nearly horizontal
-
-        # Use average properties for better accuracy
-        avg_angle = 0.5 * theta_i  # average θ between fan origin and axis
-        avg_mu = 0.5 * (mu_i + mu_cl)
-        char_slope = avg_angle - avg_mu
-        if abs(math.sin(char_slope)) > 1e-10:
-            x_cl = Rt / abs(math.tan(-char_slope)) if char_slope < 0 else Rt * 5
-        else:
-            x_cl = Rt * 5
-
-        x_cl = abs(x_cl)
-        pt = MOCPoint(x=x_cl, y=0.0, M=M_cl, theta=0.0, nu=nu_cl)
-        centerline_points.append(pt)
-        all_points.append(pt)
+    # At the centerline, θ = 0, so ν_cl = K+_i = 2·θ_i.  Every ray is
+    # independent, so the whole fan is solved as arrays.
+    theta_i = np.arange(1, N + 1) * d_theta
+    nu_cl = 2.0 * theta_i  # K+ = θ + ν, at axis θ=0 so ν = K+
+
+    # Wall angle decreases linearly from θ_max toward 0 (see Step 3).
+    # At the wall θ_wall - ν_wall = K- = -ν_cl, so ν_wall = θ_wall + ν_cl
+    frac = np.arange(1, N + 1) / N
+    theta_wall = theta_max * (1.0 - frac)
+    nu_wall = theta_wall + nu_cl
+    nu_wall = np.where(nu_wall <= 0, nu_cl, nu_wall)
+
+    # One inversion call for the fan, axis and wall points
+    M_i, M_cl, M_wall = _mach_from_prandtl_meyer_array(
+        np.concatenate((theta_i, nu_cl, nu_wall)), gamma
+    ).reshape(3, N)
+    # M ≥ 1 from the inversion, so arcsin(1/M) is the Mach angle
+    mu_i, mu_cl, mu_wall = np.arcsin(1.0 / np.stack((M_i, M_cl, M_wall)))
+
+    # Fan ray from (0, Rt) to the axis, using average properties between
+    # the fan origin (θ_i, μ_i) and the axis (0, μ_cl)
+    char_slope = 0.5 * theta_i - 0.5 * (mu_i + mu_cl)
+    downward = (np.abs(np.sin(char_slope)) > 1e-10) & (char_slope < 0)
+    with np.errstate(divide="ignore"):
+        x_cl = np.where(downward, Rt / np.abs(np.tan(-char_slope)), Rt * 5)
 
     # --- Step 3: Build wall contour from reflected C- characteristics ---
     # After reflecting from the axis, the C- characteristics (K- = -ν_cl)
@@ -238,52 +377,29 @@ def compute_moc_nozzle(
     # For a minimum-length nozzle, the wall angle at each point is:
     #   θ_wall = θ_max - i · dθ  (linearly decreasing from θ_max to 0)
 
-    wall_points_x = [0.0]
-    wall_points_y = [Rt]
-
-    for i, cl_pt in enumerate(centerline_points):
-        # Wall angle decreases from θ_max toward 0
-        frac = (i + 1) / N
-        theta_wall = theta_max * (1.0 - frac)
-
-        # From the reflected C- at the centerline:
-        # K- = θ_cl - ν_cl = 0 - ν_cl = -ν_cl
-        # At wall: θ_wall - ν_wall = K- = -ν_cl
-        # So: ν_wall = θ_wall + ν_cl
-        nu_wall = theta_wall + cl_pt.nu
-        if nu_wall <= 0:
-            nu_wall = cl_pt.nu
-        M_wall = mach_from_prandtl_meyer(nu_wall, gamma)
-        mu_wall = mach_angle(M_wall)
-
-        # C- characteristic slope from centerline to wall:
-        # slope = tan(θ_avg + μ_avg)
-        theta_avg = 0.5 * theta_wall
-        mu_avg = 0.5 * (mach_angle(cl_pt.M) + mu_wall)
-        slope = math.tan(theta_avg + mu_avg)
-
-        # y_wall from area ratio progression (for robustness)
-        y_wall = Rt + frac * (Re - Rt)
-
-        # x_wall from C- characteristic projection
-        if abs(slope) > 1e-10:
-            x_wall = cl_pt.x + y_wall / slope
-        else:
-            x_wall = cl_pt.x + y_wall * 2.0
-
-        x_wall = max(x_wall, wall_points_x[-1] + Rt * 0.001)  # enforce monotonicity
+    # C- characteristic slope from centerline to wall: tan(θ_avg + μ_avg)
+    slope = np.tan(0.5 * theta_wall + 0.5 * (mu_cl + mu_wall))
 
-        wall_points_x.append(x_wall)
-        wall_points_y.append(y_wall)
+    # y_wall from area ratio progression (for robustness)
+    y_wall = Rt + frac * (Re - Rt)
 
-        wall_pt = MOCPoint(x=x_wall, y=y_wall, M=M_wall, theta=theta_wall, nu=nu_wall)
-        all_points.append(wall_pt)
+    # x_wall from C- characteristic projection
+    with np.errstate(divide="ignore"):
+        x_wall = np.where(np.abs(slope) > 1e-10, x_cl + y_wall / slope, x_cl + y_wall * 2.0)
 
-    # Ensure final exit radius matches target
-    wall_points_y[-1] = Re
+    wall_x = _enforce_min_spacing(np.concatenate(([0.0], x_wall)), Rt * 0.001)
+    wall_y = np.concatenate(([Rt], y_wall))
+    wall_y[-1] = Re  # final exit radius matches target exactly
 
-    wall_x = np.array(wall_points_x)
-    wall_y = np.array(wall_points_y)
+    # Axis points first, then wall points
+    mesh = np.empty(2 * N, dtype=MOCPOINT_DTYPE)
+    mesh["x"] = np.concatenate((x_cl, wall_x[1:]))
+    mesh["y"][:N] = 0.0
+    mesh["y"][N:] = y_wall
+    mesh["M"] = np.concatenate((M_cl, M_wall))
+    mesh["theta"][:N] = 0.0
+    mesh["theta"][N:] = theta_wall
+    mesh["nu"] = np.concatenate((nu_cl, nu_wall))
 
     return MOCResult(
         gamma=gamma,
@@ -293,5 +409,5 @@ def compute_moc_nozzle(
         wall_y=wall_y,
         exit_mach=Me,
         length=float(wall_x[-1]),
-        mesh_points=all_points,
+        mesh_points=mesh.view(np.recarray),
     )
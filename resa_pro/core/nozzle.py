@@ -48,6 +48,20 @@ class NozzleContour:
 # --- Conical nozzle ---
 
 
+def _arc_points(
+    theta: np.ndarray, radius: float, y_center: float, x_out: np.ndarray, y_out: np.ndarray
+) -> None:
+    """Write the throat arc (radius·cos θ, y_center − radius·sin θ) in place.
+
+    Fills the contour slices directly, with no trig or scaling temporaries.
+    """
+    np.cos(theta, out=x_out)
+    x_out *= radius
+    np.sin(theta, out=y_out)
+    y_out *= -radius
+    y_out += y_center
+
+
 def conical_nozzle(
     throat_radius: float,
     expansion_ratio: float,
@@ -75,26 +89,30 @@ def conical_nozzle(
     alpha = half_angle * DEG_TO_RAD
     Rd = downstream_rc_ratio * Rt  # downstream rounding radius
 
+    # Contour is written into preallocated arrays: arc first, then cone
+    n_arc = num_points // 4
+    n_cone = num_points - n_arc
+    x = np.empty(num_points)
+    y = np.empty(num_points)
+
     # Downstream arc: from throat (angle 0) to cone tangent point (angle alpha)
     # Arc center at (0, Rt + Rd)
     y_center = Rt + Rd
-    n_arc = num_points // 4
     theta_arc = np.linspace(PI / 2, PI / 2 - alpha, n_arc, endpoint=False)
-    x_arc = Rd * np.cos(theta_arc)  # starts at 0
-    y_arc = y_center - Rd * np.sin(theta_arc)
+    _arc_points(theta_arc, Rd, y_center, x[:n_arc], y[:n_arc])  # starts at x = 0
 
     # Tangent point on arc
     x_t = Rd * math.sin(alpha)
     y_t = Rt + Rd * (1.0 - math.cos(alpha))
 
     # Straight cone from tangent point to exit
-    cone_length = (Re - y_t) / math.tan(alpha)
-    n_cone = num_points - n_arc
-    x_cone = np.linspace(x_t, x_t + cone_length, n_cone)
-    y_cone = y_t + (x_cone - x_t) * math.tan(alpha)
-
-    x = np.concatenate([x_arc, x_cone])
-    y = np.concatenate([y_arc, y_cone])
+    tan_a = math.tan(alpha)
+    cone_length = (Re - y_t) / tan_a
+    x_cone = x[n_arc:]
+    x_cone[:] = np.linspace(x_t, x_t + cone_length, n_cone)
+    y_cone = np.subtract(x_cone, x_t, out=y[n_arc:])
+    y_cone *= tan_a
+    y_cone += y_t
 
     # Divergence efficiency for conical nozzle: lambda = (1 + cos(alpha)) / 2
     div_eff = (1.0 + math.cos(alpha)) / 2.0
@@ -122,6 +140,19 @@ def conical_nozzle(
 # These are approximate curve-fit correlations.
 
 
+def _bezier2(t: np.ndarray, p0: float, p1: float, p2: float, out: np.ndarray) -> np.ndarray:
+    """Evaluate a scalar quadratic Bezier at parameters *t* into *out*.
+
+    Uses the Horner form p0 + t·(2(p1 − p0) + t·(p0 − 2p1 + p2)), which needs
+    two array temporaries instead of the six of the Bernstein form.
+    """
+    np.multiply(t, p0 - 2.0 * p1 + p2, out=out)
+    out += 2.0 * (p1 - p0)
+    out *= t
+    out += p0
+    return out
+
+
 def _rao_angles(expansion_ratio: float, Lf: float = 0.8) -> tuple[float, float]:
     """Estimate initial and exit wall angles for a Rao parabolic nozzle.
 
@@ -196,13 +227,16 @@ def parabolic_nozzle(
     # --- Downstream circular arc (throat to tangent point) ---
     y_center = Rt + Rd
     n_arc = num_points // 4
+    n_para = num_points - n_arc
+    # The arc's last point is also the Bezier start, so the two share a slot
+    x = np.empty(n_arc - 1 + n_para)
+    y = np.empty_like(x)
     theta_arc = np.linspace(PI / 2, PI / 2 - theta_initial, n_arc, endpoint=True)
-    x_arc = Rd * np.cos(theta_arc)
-    y_arc = y_center - Rd * np.sin(theta_arc)
+    _arc_points(theta_arc, Rd, y_center, x[:n_arc], y[:n_arc])
 
     # Start point of parabola = end of arc
-    xN = x_arc[-1]
-    yN = y_arc[-1]
+    xN = float(x[n_arc - 1])
+    yN = float(y[n_arc - 1])
 
     # End point of parabola
     # Length of equivalent 15° cone
@@ -227,13 +261,10 @@ def parabolic_nozzle(
         xP1 = (yE - yN + m0 * xN - m1 * xE) / (m0 - m1)
         yP1 = yN + m0 * (xP1 - xN)
 
-    n_para = num_points - n_arc
+    # Parabola from the arc's last point onwards (t = 0 reproduces it exactly)
     t = np.linspace(0, 1, n_para)
-    x_para = (1 - t) ** 2 * xN + 2 * (1 - t) * t * xP1 + t**2 * xE
-    y_para = (1 - t) ** 2 * yN + 2 * (1 - t) * t * yP1 + t**2 * yE
-
-    x = np.concatenate([x_arc[:-1], x_para])  # avoid duplicate at junction
-    y = np.concatenate([y_arc[:-1], y_para])
+    _bezier2(t, xN, xP1, xE, out=x[n_arc - 1 :])
+    _bezier2(t, yN, yP1, yE, out=y[n_arc - 1 :])
 
     # Divergence efficiency for parabolic nozzle (approximation)
     # Generally > conical; use average angle approach
@@ -7,11 +7,17 @@ film cooling effectiveness, and wall temperature estimation.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields, replace
+from typing import TypeVar, overload
 
 import numpy as np
 
-from resa_pro.utils.constants import STEFAN_BOLTZMANN
+from resa_pro.utils.constants import R_UNIVERSAL, STEFAN_BOLTZMANN
+from resa_pro.utils.jit import _HAS_NUMBA, njit
+
+# A scalar station value, or one array entry per contour station
+_FloatOrArray = TypeVar("_FloatOrArray", float, np.ndarray)
 
 
 # --- Bartz equation ---
@@ -30,6 +36,7 @@ def bartz_heat_transfer_coefficient(
     mu_ref: float | None = None,
     cp_ref: float | None = None,
     sigma_correction: bool = True,
+    local_mach: float | None = None,
 ) -> float:
     """Bartz convective heat transfer coefficient for hot-gas side.
 
@@ -54,47 +61,114 @@ def bartz_heat_transfer_coefficient(
         mu_ref: Reference dynamic viscosity [Pa·s]. If None, estimated.
         cp_ref: Reference specific heat [J/(kg·K)]. If None, estimated.
         sigma_correction: Apply Bartz sigma correction for BL temperature.
+        local_mach: Mach number at *local_area_ratio*, if already known.
+            Skips the internal area-ratio solve for the sigma correction.
 
     Returns:
         Hot-gas side heat transfer coefficient h_g [W/(m²·K)].
     """
-    from resa_pro.utils.constants import R_UNIVERSAL
+    # Unsupplied optional inputs travel to the compiled kernel as NaN
+    return _bartz_kernel(
+        float(pc),
+        float(c_star),
+        float(Dt),
+        float(Tc),
+        float(Tw),
+        float(gamma),
+        float(molar_mass),
+        float(local_area_ratio),
+        float(Pr),
+        math.nan if mu_ref is None else float(mu_ref),
+        math.nan if cp_ref is None else float(cp_ref),
+        bool(sigma_correction),
+        math.nan if local_mach is None else float(local_mach),
+    )
+
 
-    R_spec = R_UNIVERSAL / molar_mass
+@njit(cache=True)
+def _bartz_kernel(
+    pc: float,
+    c_star: float,
+    d_throat: float,
+    t_chamber: float,
+    t_wall: float,
+    gamma: float,
+    molar_mass: float,
+    local_area_ratio: float,
+    prandtl: float,
+    mu_ref: float,
+    cp_ref: float,
+    sigma_correction: bool,
+    local_mach: float,
+) -> float:
+    """Compiled body of :func:`bartz_heat_transfer_coefficient`.
 
+    *mu_ref*, *cp_ref* and *local_mach* are NaN when they should be
+    estimated, so one call covers the property estimates, the Mach solve
+    and the correlation.
+    """
     # Estimate transport properties if not provided
-    if mu_ref is None:
-        # Approximate viscosity using Sutherland-like scaling:
-        # mu ~ 1.184e-7 · M^0.5 · T^0.6  (engineering approximation)
-        T_ref = 0.5 * (Tc + Tw)
-        mu_ref = 1.184e-7 * (molar_mass * 1000) ** 0.5 * T_ref**0.6
-    if cp_ref is None:
-        cp_ref = gamma * R_spec / (gamma - 1.0)
+    if math.isnan(mu_ref):
+        mu_ref = _gas_viscosity(molar_mass, 0.5 * (t_chamber + t_wall))
+    if math.isnan(cp_ref):
+        cp_ref = gamma * (R_UNIVERSAL / molar_mass) / (gamma - 1.0)
 
     # Sigma correction (property variation across boundary layer)
     if sigma_correction:
-        T_ratio = 0.5 * (Tw / Tc) + 0.5
-        gm1_half = 0.5 * (gamma - 1.0)
-        M_local = _mach_from_area_ratio_approx(local_area_ratio, gamma)
-        sigma = (
-            (T_ratio * (1.0 + gm1_half * M_local**2)) ** 0.68
-            * (1.0 + gm1_half * M_local**2) ** 0.12
-        ) ** (-1)
+        if math.isnan(local_mach):
+            mach = _mach_from_area_ratio_approx(local_area_ratio, gamma)
+        else:
+            mach = local_mach
+        sigma = _bartz_sigma(t_wall, t_chamber, gamma, mach)
     else:
         sigma = 1.0
 
-    h_g = (
-        0.026
-        / Dt**0.2
-        * (mu_ref**0.2 * cp_ref / Pr**0.6)
-        * (pc / c_star) ** 0.8
-        * (1.0 / local_area_ratio) ** 0.9
-        * sigma
-    )
+    factor = _bartz_constant(pc, c_star, d_throat, cp_ref, prandtl)
+    return _bartz_scaled(factor, mu_ref, local_area_ratio, sigma)
+
+
+@njit(cache=True)
+def _gas_viscosity(molar_mass: float, t_ref: float) -> float:
+    """Approximate combustion-gas viscosity [Pa·s] at reference temperature."""
+    # Sutherland-like scaling: mu ~ 1.184e-7 · M^0.5 · T^0.6  (engineering approximation)
+    return 1.184e-7 * (molar_mass * 1000) ** 0.5 * t_ref**0.6
 
-    return h_g
 
+@njit(cache=True)
+def _bartz_sigma(
+    t_wall: float, t_chamber: float, gamma: float, mach: _FloatOrArray
+) -> _FloatOrArray:
+    """Bartz sigma correction for property variation across the boundary layer."""
+    t_ratio = 0.5 * (t_wall / t_chamber) + 0.5
+    gm1_half = 0.5 * (gamma - 1.0)
+    return (
+        (t_ratio * (1.0 + gm1_half * mach**2)) ** 0.68
+        * (1.0 + gm1_half * mach**2) ** 0.12
+    ) ** (-1)
+
+
+@njit(cache=True)
+def _bartz_constant(
+    pc: float, c_star: float, d_throat: float, cp_ref: float, prandtl: float
+) -> float:
+    """Station-independent factor K of the Bartz correlation.
+
+    h_g = K · mu_ref^0.2 · (At/A)^0.9 · sigma, so loops over stations with
+    fixed chamber conditions evaluate K once and pass it to
+    :func:`_bartz_scaled`.
+    """
+    return 0.026 / d_throat**0.2 * (cp_ref / prandtl**0.6) * (pc / c_star) ** 0.8
 
+
+@njit(cache=True)
+def _bartz_scaled(
+    factor: float, mu_ref: float, local_area_ratio: _FloatOrArray, sigma: _FloatOrArray
+) -> _FloatOrArray:
+    """Bartz h_g from the factor K returned by :func:`_bartz_constant`."""
+    return factor * mu_ref**0.2 * (1.0 / local_area_ratio) ** 0.9 * sigma
+
+
+@njit(cache=True)
 def _mach_from_area_ratio_approx(area_ratio: float, gamma: float) -> float:
     """Quick Mach number estimate from area ratio (Newton iteration).
 
@@ -102,27 +176,76 @@ def _mach_from_area_ratio_approx(area_ratio: float, gamma: float) -> float:
     """
     if area_ratio <= 1.0:
         return 1.0
-    # Start with an initial guess
-    M = 1.0 + 0.5 * (area_ratio - 1.0)
+    gp1 = gamma + 1.0
+    gm1 = gamma - 1.0
+    exp = gp1 / (2.0 * gm1)
+    # Start above the root, where the convex residual makes Newton descend
+    # monotonically: the bound A^((γ-1)/2) + 1.5, tightened by one pass of
+    # the area relation solved for M² = (2/(γ-1))·((γ+1)/2·(A·M)^(1/exp) − 1)
+    mach: float = area_ratio ** (0.5 * gm1) + 1.5
+    mach = math.sqrt(max((2.0 / gm1) * (0.5 * gp1 * (area_ratio * mach) ** (1.0 / exp) - 1.0), 1.0))
     for _ in range(20):
-        gp1 = gamma + 1.0
-        gm1 = gamma - 1.0
-        factor = (2.0 / gp1) * (1.0 + 0.5 * gm1 * M**2)
-        exp = gp1 / (2.0 * gm1)
-        f = (1.0 / M) * factor**exp - area_ratio
-        # Derivative (numerical)
-        dM = M * 1e-6
-        M2 = M + dM
-        factor2 = (2.0 / gp1) * (1.0 + 0.5 * gm1 * M2**2)
-        f2 = (1.0 / M2) * factor2**exp - area_ratio
-        df = (f2 - f) / dM
+        factor = (2.0 / gp1) * (1.0 + 0.5 * gm1 * mach**2)
+        ratio = factor**exp / mach
+        f = ratio - area_ratio
+        # d/dM [factor^exp / M] = ratio · (M / factor - 1 / M)
+        df = ratio * (mach / factor - 1.0 / mach)
         if abs(df) < 1e-30:
             break
-        M = M - f / df
-        M = max(M, 1.001)
+        mach = mach - f / df
+        mach = max(mach, 1.001)
         if abs(f) < 1e-10:
             break
-    return M
+    return mach
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _mach_from_area_ratio_approx_array(area_ratio: np.ndarray, gamma: float) -> np.ndarray:
+        """Vectorised :func:`_mach_from_area_ratio_approx` (compiled loop).
+
+        Each station runs the scalar Newton solve directly, so elements stop
+        iterating independently instead of paying for the slowest one.
+        """
+        ar = np.ascontiguousarray(area_ratio).ravel()
+        mach = np.empty(ar.size)
+        for i in range(ar.size):
+            mach[i] = _mach_from_area_ratio_approx(ar[i], gamma)
+        return mach.reshape(np.shape(area_ratio))
+
+else:
+
+    def _mach_from_area_ratio_approx_array(area_ratio: np.ndarray, gamma: float) -> np.ndarray:
+        """Vectorised :func:`_mach_from_area_ratio_approx`.
+
+        Runs the same Newton iteration over the whole array, freezing each
+        element once it meets the scalar version's stopping tests, so results
+        agree with the scalar solve to within its tolerance.
+        """
+        ar = np.asarray(area_ratio, dtype=float)
+        gp1 = gamma + 1.0
+        gm1 = gamma - 1.0
+        exp = gp1 / (2.0 * gm1)
+
+        active = ar > 1.0
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            mach = ar ** (0.5 * gm1) + 1.5
+            mach = np.sqrt(
+                np.maximum((2.0 / gm1) * (0.5 * gp1 * (ar * mach) ** (1.0 / exp) - 1.0), 1.0)
+            )
+            for _ in range(20):
+                if not active.any():
+                    break
+                factor = (2.0 / gp1) * (1.0 + 0.5 * gm1 * mach**2)
+                ratio = factor**exp / mach
+                f = ratio - ar
+                # d/dM [factor^exp / M] = ratio · (M / factor - 1 / M)
+                df = ratio * (mach / factor - 1.0 / mach)
+                active &= np.abs(df) >= 1e-30
+                mach = np.where(active, np.maximum(mach - f / df, 1.001), mach)
+                active &= np.abs(f) >= 1e-10
+        return np.where(ar <= 1.0, 1.0, mach)
 
 
 # --- Heat flux calculations ---
@@ -140,12 +263,77 @@ class HeatFluxResult:
     T_wg: float  # K — gas-side wall temperature (input)
 
 
+def _empty_column() -> np.ndarray:
+    return np.empty(0)
+
+
+@dataclass
+class HeatFluxDistribution:
+    """Heat flux results along the wall stored as columns.
+
+    Each field holds one float64 array of length n, in contour order.
+    Indexing or iterating yields :class:`HeatFluxResult` views built on
+    demand, so ``results[i].q_dot`` keeps working.
+    """
+
+    x: np.ndarray = field(default_factory=_empty_column)
+    area_ratio: np.ndarray = field(default_factory=_empty_column)
+    h_g: np.ndarray = field(default_factory=_empty_column)
+    q_dot: np.ndarray = field(default_factory=_empty_column)
+    T_aw: np.ndarray = field(default_factory=_empty_column)
+    T_wg: np.ndarray = field(default_factory=_empty_column)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @overload
+    def __getitem__(self, i: int) -> HeatFluxResult: ...
+    @overload
+    def __getitem__(self, i: slice) -> HeatFluxDistribution: ...
+
+    def __getitem__(self, i: int | slice) -> HeatFluxResult | HeatFluxDistribution:
+        """Build the :class:`HeatFluxResult` for station *i*.
+
+        A slice such as ``[::10]`` returns a :class:`HeatFluxDistribution` of column views.
+        """
+        if isinstance(i, slice):
+            columns = {
+                f.name: getattr(self, f.name)[i]
+                for f in fields(self)
+                if isinstance(getattr(self, f.name), np.ndarray)
+            }
+            return replace(self, **columns)
+        if not -len(self) <= i < len(self):
+            raise IndexError("station index out of range")
+        return HeatFluxResult(
+            x=float(self.x[i]),
+            area_ratio=float(self.area_ratio[i]),
+            h_g=float(self.h_g[i]),
+            q_dot=float(self.q_dot[i]),
+            T_aw=float(self.T_aw[i]),
+            T_wg=float(self.T_wg[i]),
+        )
+
+    def __iter__(self) -> Iterator[HeatFluxResult]:
+        return (self[i] for i in range(len(self)))
+
+
+@overload
+def adiabatic_wall_temperature(
+    Tc: float, gamma: float, M: float, recovery_factor: float = ...
+) -> float: ...
+@overload
+def adiabatic_wall_temperature(
+    Tc: float, gamma: float, M: np.ndarray, recovery_factor: float = ...
+) -> np.ndarray: ...
+
+
 def adiabatic_wall_temperature(
     Tc: float,
     gamma: float,
-    M: float,
+    M: float | np.ndarray,
     recovery_factor: float = 0.9,
-) -> float:
+) -> float | np.ndarray:
     """Adiabatic (recovery) wall temperature.
 
     T_aw = Tc · r_f · [1 + (γ-1)/2 · M²] / [1 + (γ-1)/2 · M²]
@@ -155,11 +343,11 @@ def adiabatic_wall_temperature(
     Args:
         Tc: Chamber stagnation temperature [K].
         gamma: Ratio of specific heats.
-        M: Local Mach number.
+        M: Local Mach number (scalar or array).
         recovery_factor: ~Pr^(1/3) for turbulent BL, typically 0.85–0.92.
 
     Returns:
-        Adiabatic wall temperature [K].
+        Adiabatic wall temperature [K], an array for array ``M``.
     """
     gm1_half = 0.5 * (gamma - 1.0)
     T_static = Tc / (1.0 + gm1_half * M**2)
@@ -167,7 +355,15 @@ def adiabatic_wall_temperature(
     return T_aw
 
 
-def heat_flux(h_g: float, T_aw: float, T_wall: float) -> float:
+@overload
+def heat_flux(h_g: float, T_aw: float, T_wall: float) -> float: ...
+@overload
+def heat_flux(h_g: float | np.ndarray, T_aw: np.ndarray, T_wall: float) -> np.ndarray: ...
+
+
+def heat_flux(
+    h_g: float | np.ndarray, T_aw: float | np.ndarray, T_wall: float
+) -> float | np.ndarray:
     """Convective heat flux [W/m²].
 
     q = h_g · (T_aw - T_wall)
@@ -185,7 +381,7 @@ def compute_heat_flux_distribution(
     gamma: float,
     molar_mass: float,
     T_wall: float = 600.0,
-) -> list[HeatFluxResult]:
+) -> HeatFluxDistribution:
     """Compute heat flux along the chamber/nozzle wall.
 
     Args:
@@ -200,39 +396,34 @@ def compute_heat_flux_distribution(
         T_wall: Assumed gas-side wall temperature [K].
 
     Returns:
-        List of HeatFluxResult for each station.
+        HeatFluxDistribution with one entry per station.
     """
     Dt = 2.0 * throat_radius
-    At = math.pi * throat_radius**2
-    results = []
-
-    for x, r in zip(contour_x, contour_y):
-        A = math.pi * r**2
-        ar = A / At
-        if ar < 1.0:
-            ar = 1.0  # clamp at throat
-
-        M = _mach_from_area_ratio_approx(ar, gamma) if ar > 1.001 else 1.0
-        T_aw = adiabatic_wall_temperature(Tc, gamma, M)
-
-        h_g = bartz_heat_transfer_coefficient(
-            pc=pc,
-            c_star=c_star,
-            Dt=Dt,
-            Tc=Tc,
-            Tw=T_wall,
-            gamma=gamma,
-            molar_mass=molar_mass,
-            local_area_ratio=ar,
-        )
-
-        q = heat_flux(h_g, T_aw, T_wall)
-
-        results.append(
-            HeatFluxResult(x=x, area_ratio=ar, h_g=h_g, q_dot=q, T_aw=T_aw, T_wg=T_wall)
-        )
-
-    return results
+    r = np.asarray(contour_y, dtype=float)
+    ar = np.maximum(r**2 / throat_radius**2, 1.0)  # clamp at throat
+
+    # The Bartz sigma correction solves for Mach at every station, while the
+    # recovery temperature treats stations within 0.1 % of the throat as sonic
+    M_local = _mach_from_area_ratio_approx_array(ar, gamma)
+    M = np.where(ar > 1.001, M_local, 1.0)
+    T_aw = adiabatic_wall_temperature(Tc, gamma, M)
+
+    # Same property estimates as bartz_heat_transfer_coefficient's defaults
+    mu_ref = _gas_viscosity(molar_mass, 0.5 * (Tc + T_wall))
+    cp_ref = gamma * (R_UNIVERSAL / molar_mass) / (gamma - 1.0)
+    sigma = _bartz_sigma(T_wall, Tc, gamma, M_local)
+    h_g = _bartz_scaled(_bartz_constant(pc, c_star, Dt, cp_ref, 0.5), mu_ref, ar, sigma)
+
+    q = heat_flux(h_g, T_aw, T_wall)
+
+    return HeatFluxDistribution(
+        x=np.array(contour_x, dtype=float),
+        area_ratio=ar,
+        h_g=h_g,
+        q_dot=q,
+        T_aw=T_aw,
+        T_wg=np.full(ar.shape, float(T_wall)),
+    )
 
 
 # --- Radiative cooling ---
@@ -302,3 +493,39 @@ def wall_temperature_simple(
     T_wc = T_coolant + q * R_c
 
     return T_wg, T_wc
+
+
+def wall_temperature_simple_array(
+    h_g: float | np.ndarray,
+    T_aw: float | np.ndarray,
+    h_c: float | np.ndarray,
+    T_coolant: float | np.ndarray,
+    wall_thickness: float | np.ndarray,
+    wall_conductivity: float | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Array-aware :func:`wall_temperature_simple`, with the heat flux.
+
+    Solves the same resistance network for many stations at once; the
+    inputs are broadcast against each other.  The heat flux through the
+    network is returned as well, and equals :func:`heat_flux` evaluated
+    at the gas-side wall temperature.
+
+    Args:
+        h_g: Gas-side heat transfer coefficient [W/(m²·K)].
+        T_aw: Adiabatic wall temperature [K].
+        h_c: Coolant-side heat transfer coefficient [W/(m²·K)].
+        T_coolant: Bulk coolant temperature [K].
+        wall_thickness: Wall thickness [m].
+        wall_conductivity: Wall thermal conductivity [W/(m·K)].
+
+    Returns:
+        (T_wg, T_wc, q_dot) — gas-side and coolant-side wall temperatures
+        [K] and heat flux [W/m²], as arrays of the broadcast shape.
+    """
+    t_aw = np.asarray(T_aw, dtype=float)
+    r_g = 1.0 / np.asarray(h_g, dtype=float)
+    r_c = 1.0 / np.asarray(h_c, dtype=float)
+    r_total = r_g + np.divide(wall_thickness, wall_conductivity) + r_c
+
+    q = (t_aw - T_coolant) / r_total
+    return t_aw - q * r_g, T_coolant + q * r_c, q
@@ -10,13 +10,16 @@ equilibrium chemistry, interface with CEA or Cantera externally.
 
 from __future__ import annotations
 
+import bisect
 import math
 from dataclasses import dataclass
+from functools import cache, lru_cache
 
 import numpy as np
 from scipy.optimize import brentq
 
 from resa_pro.utils.constants import G_0, R_UNIVERSAL
+from resa_pro.utils.jit import njit
 
 
 # --- Pre-tabulated combustion data for common propellant pairs ---
@@ -52,6 +55,63 @@ _COMBUSTION_TABLE: list[CombustionData] = [
 ]
 
 
+_COMBUSTION_FIELDS = ("mixture_ratio", "chamber_temperature", "gamma", "molar_mass", "c_star")
+
+
+@lru_cache(maxsize=1)
+def _combustion_index() -> dict[
+    tuple[str, str], tuple[tuple[CombustionData, ...], tuple[float, ...], CombustionData]
+]:
+    """Case-folded (oxidizer, fuel) -> table entries, built once per process.
+
+    Each pair maps to its entries in ascending mixture ratio, the midpoints
+    between successive tabulated ratios, and the entry with the highest c*.
+    """
+    index: dict[tuple[str, str], list[CombustionData]] = {}
+    for d in _COMBUSTION_TABLE:
+        index.setdefault((d.oxidizer.lower(), d.fuel.lower()), []).append(d)
+
+    out = {}
+    for pair, entries in index.items():
+        # max() keeps the first of equal c* values in table order
+        best = max(entries, key=lambda d: d.c_star)
+        entries.sort(key=lambda d: d.mixture_ratio)
+        mr = [d.mixture_ratio for d in entries]
+        midpoints = tuple(0.5 * (hi + lo) for lo, hi in zip(mr, mr[1:]))
+        out[pair] = (tuple(entries), midpoints, best)
+    return out
+
+
+def _combustion_pair(
+    oxidizer: str, fuel: str
+) -> tuple[tuple[CombustionData, ...], tuple[float, ...], CombustionData]:
+    index = _combustion_index()
+    # Callers normally pass the lower-case names the index is keyed on, so
+    # only fold the case when the names as given miss
+    pair = index.get((oxidizer, fuel))
+    if pair is not None:
+        return pair
+    try:
+        return index[oxidizer.lower(), fuel.lower()]
+    except KeyError:
+        available = {(d.oxidizer, d.fuel) for d in _COMBUSTION_TABLE}
+        raise KeyError(
+            f"No combustion data for {oxidizer}/{fuel}. Available pairs: {available}"
+        ) from None
+
+
+@cache
+def _combustion_arrays(oxidizer: str, fuel: str) -> dict[str, np.ndarray]:
+    """Read-only column arrays for one propellant pair, in ascending mixture ratio."""
+    entries = _combustion_pair(oxidizer, fuel)[0]
+    columns = {}
+    for name in _COMBUSTION_FIELDS:
+        col = np.array([getattr(d, name) for d in entries], dtype=float)
+        col.setflags(write=False)
+        columns[name] = col
+    return columns
+
+
 def lookup_combustion(
     oxidizer: str, fuel: str, mixture_ratio: float | None = None
 ) -> CombustionData:
@@ -68,23 +128,45 @@ def lookup_combustion(
     Raises:
         KeyError: If propellant combination is not in the table.
     """
-    matches = [
-        d
-        for d in _COMBUSTION_TABLE
-        if d.oxidizer.lower() == oxidizer.lower() and d.fuel.lower() == fuel.lower()
-    ]
-    if not matches:
-        available = {(d.oxidizer, d.fuel) for d in _COMBUSTION_TABLE}
-        raise KeyError(
-            f"No combustion data for {oxidizer}/{fuel}. Available pairs: {available}"
-        )
+    entries, midpoints, best = _combustion_pair(oxidizer, fuel)
 
     if mixture_ratio is not None:
-        matches.sort(key=lambda d: abs(d.mixture_ratio - mixture_ratio))
-        return matches[0]
+        # A ratio exactly on a midpoint takes the lower entry
+        return entries[bisect.bisect_left(midpoints, mixture_ratio)]
+
+    return best
 
-    # Return highest c*
-    return max(matches, key=lambda d: d.c_star)
+
+def lookup_combustion_batch(
+    oxidizer: str, fuel: str, mixture_ratio: np.ndarray
+) -> dict[str, np.ndarray]:
+    """Vectorised :func:`lookup_combustion` for an array of mixture ratios.
+
+    Each mixture ratio selects the closest tabulated entry, exactly as the
+    scalar lookup does.
+
+    Args:
+        oxidizer: Oxidizer name.
+        fuel: Fuel name.
+        mixture_ratio: O/F mass ratios.
+
+    Returns:
+        Dict of arrays shaped like ``mixture_ratio``: ``mixture_ratio``
+        (the tabulated value used), ``chamber_temperature``, ``gamma``,
+        ``molar_mass`` and ``c_star``.
+
+    Raises:
+        KeyError: If propellant combination is not in the table.
+    """
+    columns = _combustion_arrays(oxidizer.lower(), fuel.lower())
+
+    table_mr = columns["mixture_ratio"]
+    # Nearest entry by bisecting the midpoints between tabulated ratios; a
+    # ratio exactly on a midpoint takes the lower entry, like the scalar lookup
+    midpoints = 0.5 * (table_mr[1:] + table_mr[:-1])
+    idx = np.searchsorted(midpoints, np.asarray(mixture_ratio, dtype=float), side="left")
+
+    return {name: col[idx] for name, col in columns.items()}
 
 
 # --- Isentropic nozzle flow ---
@@ -121,14 +203,115 @@ def mach_from_area_ratio(area_ratio: float, gamma: float, supersonic: bool = Tru
     if area_ratio < 1.0:
         raise ValueError(f"Area ratio must be >= 1.0, got {area_ratio}")
 
-    def residual(M: float) -> float:
-        return area_ratio_from_mach(M, gamma) - area_ratio
-
     if supersonic:
-        M = brentq(residual, 1.0, 50.0)
+        return _solve_exit_mach(area_ratio, gamma)
+
+    mach = _solve_subsonic_mach(area_ratio, gamma)
+    if math.isnan(mach):
+        # Newton stalls within ~1e-9 of A/A* = 1, where the root is nearly double
+        mach = brentq(lambda m: area_ratio_from_mach(m, gamma) - area_ratio, 1e-6, 1.0)
+    return mach
+
+
+@njit(cache=True)
+def _solve_exit_mach(area_ratio: float, gamma: float) -> float:
+    """Supersonic Mach number for a scalar A/A* (Newton on ln(A/A*)).
+
+    Scalar counterpart of :func:`mach_from_area_ratio_batch`; compiled with
+    Numba when available, since every performance evaluation in the
+    optimisation and UQ loops goes through it.
+    """
+    if area_ratio <= 1.0:
+        return 1.0
+    gm1 = gamma - 1.0
+    exponent = (gamma + 1.0) / (2.0 * gm1)
+    two_over_gp1 = 2.0 / (gamma + 1.0)
+    ln_ar = math.log(area_ratio)
+
+    mach: float = area_ratio ** (0.5 * gm1) + 1.5
+    for _ in range(50):
+        t = 1.0 + 0.5 * gm1 * mach * mach
+        f = exponent * math.log(two_over_gp1 * t) - math.log(mach) - ln_ar
+        step = f * mach * t / (mach * mach - 1.0)
+        mach = max(mach - step, 1.0 + 1e-12)
+        if abs(step) <= 1e-13 * mach:
+            break
+    return mach
+
+
+@njit(cache=True)
+def _solve_subsonic_mach(area_ratio: float, gamma: float) -> float:
+    """Subsonic Mach number for a scalar A/A* (Newton on ln(A/A*)).
+
+    Starts from the low-Mach asymptote A/A* ≈ (2/(γ+1))^((γ+1)/(2(γ-1))) / M,
+    which lies below the root; ln(A/A*) is convex and decreasing for M < 1,
+    so the iteration rises monotonically onto it.  Returns NaN if it has not
+    converged after 50 steps.
+    """
+    if area_ratio <= 1.0:
+        return 1.0
+    gm1 = gamma - 1.0
+    exponent = (gamma + 1.0) / (2.0 * gm1)
+    two_over_gp1 = 2.0 / (gamma + 1.0)
+    ln_ar = math.log(area_ratio)
+
+    mach: float = two_over_gp1**exponent / area_ratio
+    for _ in range(50):
+        t = 1.0 + 0.5 * gm1 * mach * mach
+        f = exponent * math.log(two_over_gp1 * t) - math.log(mach) - ln_ar
+        step = f * mach * t / (mach * mach - 1.0)
+        mach = min(mach - step, 1.0 - 1e-12)
+        if abs(step) <= 1e-13 * mach:
+            return mach
+    return math.nan
+
+
+def mach_from_area_ratio_batch(
+    area_ratio: np.ndarray,
+    gamma: np.ndarray | float,
+    rtol: float = 1e-13,
+    max_iter: int = 50,
+    initial: np.ndarray | None = None,
+) -> np.ndarray:
+    """Supersonic Mach numbers for arrays of area ratios.
+
+    Newton iteration on ln(A/A*) over the whole array, by default starting
+    above the supersonic root, where the iteration converges monotonically.
+    Agrees with :func:`mach_from_area_ratio` to ~1e-12.
+
+    Args:
+        area_ratio: A/A* values (must be > 1).
+        gamma: Ratio of specific heats (scalar or broadcastable array).
+        rtol: Relative step tolerance for convergence.
+        max_iter: Maximum Newton iterations.
+        initial: Optional starting guess, e.g. the solution for nearby area
+            ratios in a sweep.  Must lie close to the supersonic root.
+
+    Returns:
+        Supersonic Mach number array.
+    """
+    ar, g = np.broadcast_arrays(np.asarray(area_ratio, dtype=float), np.asarray(gamma, dtype=float))
+    if np.any(ar <= 1.0):
+        raise ValueError("Area ratios must be > 1.0 for the supersonic solution")
+
+    gm1 = g - 1.0
+    exponent = (g + 1.0) / (2.0 * gm1)
+    ln_ar = np.log(ar)
+    two_over_gp1 = 2.0 / (g + 1.0)
+
+    if initial is None:
+        mach = ar ** (0.5 * gm1) + 1.5
     else:
-        M = brentq(residual, 1e-6, 1.0)
-    return M
+        mach = np.maximum(np.asarray(initial, dtype=float), 1.0 + 1e-12)
+    for _ in range(max_iter):
+        t = 1.0 + 0.5 * gm1 * mach * mach
+        f = exponent * np.log(two_over_gp1 * t) - np.log(mach) - ln_ar
+        # d(ln A)/dM = (M² − 1) / (M · t)
+        step = f * mach * t / (mach * mach - 1.0)
+        mach = np.maximum(mach - step, 1.0 + 1e-12)
+        if np.all(np.abs(step) <= rtol * mach):
+            break
+    return mach
 
 
 def pressure_ratio(M: float, gamma: float) -> float:
@@ -253,6 +436,44 @@ class NozzlePerformance:
     ve_vac: float  # m/s — effective exhaust velocity (vacuum)
 
 
+@dataclass
+class NozzlePerformanceBatch:
+    """Nozzle performance for many operating points at once.
+
+    Every field is an array of the broadcast input shape; entry ``i``
+    corresponds to :class:`NozzlePerformance` via :meth:`performance`.
+    """
+
+    gamma: np.ndarray
+    expansion_ratio: np.ndarray
+    exit_mach: np.ndarray
+    pe_pc: np.ndarray
+    CF_vac: np.ndarray
+    CF_sl: np.ndarray
+    c_star: np.ndarray  # m/s
+    Isp_vac: np.ndarray  # s
+    Isp_sl: np.ndarray  # s
+    ve_vac: np.ndarray  # m/s
+
+    def __len__(self) -> int:
+        return len(self.gamma)
+
+    def performance(self, i: int) -> NozzlePerformance:
+        """Return operating point *i* as a scalar :class:`NozzlePerformance`."""
+        return NozzlePerformance(
+            gamma=float(self.gamma[i]),
+            expansion_ratio=float(self.expansion_ratio[i]),
+            exit_mach=float(self.exit_mach[i]),
+            pe_pc=float(self.pe_pc[i]),
+            CF_vac=float(self.CF_vac[i]),
+            CF_sl=float(self.CF_sl[i]),
+            c_star=float(self.c_star[i]),
+            Isp_vac=float(self.Isp_vac[i]),
+            Isp_sl=float(self.Isp_sl[i]),
+            ve_vac=float(self.ve_vac[i]),
+        )
+
+
 def compute_nozzle_performance(
     gamma: float,
     molar_mass: float,
@@ -295,3 +516,51 @@ def compute_nozzle_performance(
         Isp_sl=specific_impulse(c_s, CF_sl),
         ve_vac=exhaust_velocity(c_s, CF_vac),
     )
+
+
+def compute_nozzle_performance_batch(
+    gamma: np.ndarray | float,
+    molar_mass: np.ndarray | float,
+    Tc: np.ndarray | float,
+    expansion_ratio: np.ndarray | float,
+    pc: np.ndarray | float,
+    pa: float = 101325.0,
+) -> NozzlePerformanceBatch:
+    """Vectorised :func:`compute_nozzle_performance`.
+
+    All inputs are broadcast against each other and evaluated in one pass
+    of NumPy ufuncs, for Monte Carlo and design sweeps.
+
+    Returns:
+        NozzlePerformanceBatch whose fields are arrays of the broadcast shape.
+    """
+    g, mm, t_chamber, eps, pc = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (gamma, molar_mass, Tc, expansion_ratio, pc))
+    )
+    gm1 = g - 1.0
+    gp1 = g + 1.0
+
+    r_spec = R_UNIVERSAL / mm
+    c_s = np.sqrt(r_spec * t_chamber) / (g * np.sqrt((2.0 / gp1) ** (gp1 / gm1)))
+
+    mach_exit = mach_from_area_ratio_batch(eps, g)
+    pe_pc = (1.0 + 0.5 * gm1 * mach_exit**2) ** (-g / gm1)
+
+    cf_momentum = np.sqrt(
+        (2.0 * g**2 / gm1) * (2.0 / gp1) ** (gp1 / gm1) * (1.0 - pe_pc ** (gm1 / g))
+    )
+    cf_vac = cf_momentum + pe_pc * eps
+    cf_sl = cf_vac - (pa / pc) * eps
+
+    return NozzlePerformanceBatch(
+        gamma=g,
+        expansion_ratio=eps,
+        exit_mach=mach_exit,
+        pe_pc=pe_pc,
+        CF_vac=cf_vac,
+        CF_sl=cf_sl,
+        c_star=c_s,
+        Isp_vac=c_s * cf_vac / G_0,
+        Isp_sl=c_s * cf_sl / G_0,
+        ve_vac=c_s * cf_vac,
+    )
@@ -10,11 +10,25 @@ dependencies used only for STL export.
 from __future__ import annotations
 
 import math
+import struct
 from dataclasses import dataclass, field
+from typing import BinaryIO
 
 import numpy as np
 
 from resa_pro.utils.constants import PI, TWO_PI
+from resa_pro.utils.jit import _HAS_NUMBA, njit
+
+_STL_HEADER = b"RESA Pro STL export".ljust(80, b"\0")
+
+# Binary STL triangle record: normal + 3 vertices (float32) + attribute byte count
+_STL_RECORD_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("v0", "<f4", (3,)),
+    ("v1", "<f4", (3,)),
+    ("v2", "<f4", (3,)),
+    ("attr", "<u2"),
+])
 
 
 @dataclass
@@ -58,63 +72,42 @@ def revolve_contour(
     Returns:
         RevolutionMesh with vertices and face indices.
     """
-    n_axial = len(contour_x)
+    x = np.ascontiguousarray(contour_x, dtype=np.float64)
+    y = np.ascontiguousarray(contour_y, dtype=np.float64)
+    n_axial = len(x)
     n_circ = n_circumferential
     theta = np.linspace(0, TWO_PI, n_circ, endpoint=False)
 
-    # Generate vertices: each axial station × each circumferential angle
-    # Shape: (n_axial * n_circ, 3)
-    vertices = np.zeros((n_axial * n_circ, 3))
-    for i in range(n_axial):
-        x = contour_x[i]
-        r = contour_y[i]
-        for j in range(n_circ):
-            idx = i * n_circ + j
-            vertices[idx, 0] = x
-            vertices[idx, 1] = r * np.cos(theta[j])
-            vertices[idx, 2] = r * np.sin(theta[j])
-
-    # Generate faces (two triangles per quad)
-    faces = []
-    for i in range(n_axial - 1):
-        for j in range(n_circ):
-            j_next = (j + 1) % n_circ
-            # Indices of the four corners of the quad
-            v00 = i * n_circ + j
-            v01 = i * n_circ + j_next
-            v10 = (i + 1) * n_circ + j
-            v11 = (i + 1) * n_circ + j_next
-
-            # Two triangles
-            faces.append([v00, v10, v01])
-            faces.append([v01, v10, v11])
+    # Vertices (n_axial * n_circ, 3) and faces (two triangles per quad)
+    vertices, faces_arr = _revolve_kernel(x, y, np.cos(theta), np.sin(theta))
 
     # Close ends with fan triangulation
     if close_ends:
-        # Front face (at contour_x[0])
-        if contour_y[0] > 1e-10:
-            center_front = len(vertices)
-            cx = contour_x[0]
-            vertices = np.vstack([vertices, [[cx, 0.0, 0.0]]])
-            for j in range(n_circ):
-                j_next = (j + 1) % n_circ
-                v0 = 0 * n_circ + j
-                v1 = 0 * n_circ + j_next
-                faces.append([center_front, v1, v0])  # inward-facing normal
+        ring = np.arange(n_circ)
+        ring_next = np.roll(ring, -1)
+        centers: list[list[float]] = []
+        caps = [faces_arr]
+
+        # Front face (at contour_x[0]), inward-facing normal
+        if y[0] > 1e-10:
+            center_front = len(vertices) + len(centers)
+            centers.append([x[0], 0.0, 0.0])
+            caps.append(np.column_stack([np.full(n_circ, center_front), ring_next, ring]))
 
         # Rear face (at contour_x[-1])
-        if contour_y[-1] > 1e-10:
-            center_rear = len(vertices)
-            cx = contour_x[-1]
-            vertices = np.vstack([vertices, [[cx, 0.0, 0.0]]])
+        if y[-1] > 1e-10:
+            center_rear = len(vertices) + len(centers)
+            centers.append([x[-1], 0.0, 0.0])
             last_ring = (n_axial - 1) * n_circ
-            for j in range(n_circ):
-                j_next = (j + 1) % n_circ
-                v0 = last_ring + j
-                v1 = last_ring + j_next
-                faces.append([center_rear, v0, v1])
+            caps.append(
+                np.column_stack(
+                    [np.full(n_circ, center_rear), last_ring + ring, last_ring + ring_next]
+                )
+            )
 
-    faces_arr = np.array(faces, dtype=int)
+        if centers:
+            vertices = np.vstack([vertices, centers])
+            faces_arr = np.concatenate(caps)
 
     # Compute face normals
     normals = _compute_face_normals(vertices, faces_arr)
@@ -122,6 +115,67 @@ def revolve_contour(
     return RevolutionMesh(vertices=vertices, faces=faces_arr, normals=normals)
 
 
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _revolve_kernel(
+        x: np.ndarray, y: np.ndarray, cos_t: np.ndarray, sin_t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vertex and quad-triangle index arrays of a revolved contour (Numba)."""
+        n_axial = x.shape[0]
+        n_circ = cos_t.shape[0]
+        vertices = np.empty((n_axial * n_circ, 3))
+        faces = np.empty((2 * max(n_axial - 1, 0) * n_circ, 3), dtype=np.int64)
+
+        for i in range(n_axial):
+            for j in range(n_circ):
+                idx = i * n_circ + j
+                vertices[idx, 0] = x[i]
+                vertices[idx, 1] = y[i] * cos_t[j]
+                vertices[idx, 2] = y[i] * sin_t[j]
+
+        for i in range(n_axial - 1):
+            for j in range(n_circ):
+                j_next = (j + 1) % n_circ
+                v00 = i * n_circ + j
+                v01 = i * n_circ + j_next
+                v10 = v00 + n_circ
+                v11 = v01 + n_circ
+                f = 2 * (i * n_circ + j)
+                faces[f, 0] = v00
+                faces[f, 1] = v10
+                faces[f, 2] = v01
+                faces[f + 1, 0] = v01
+                faces[f + 1, 1] = v10
+                faces[f + 1, 2] = v11
+
+        return vertices, faces
+
+else:
+
+    def _revolve_kernel(
+        x: np.ndarray, y: np.ndarray, cos_t: np.ndarray, sin_t: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vertex and quad-triangle index arrays of a revolved contour (NumPy)."""
+        n_axial = len(x)
+        n_circ = len(cos_t)
+        vertices = np.empty((n_axial, n_circ, 3))
+        vertices[..., 0] = x[:, None]
+        vertices[..., 1] = y[:, None] * cos_t
+        vertices[..., 2] = y[:, None] * sin_t
+
+        j = np.arange(n_circ)
+        v00 = np.arange(max(n_axial - 1, 0))[:, None] * n_circ + j
+        v01 = v00 - j + np.roll(j, -1)
+        v10 = v00 + n_circ
+        v11 = v01 + n_circ
+        # Two triangles per quad, interleaved: (v00, v10, v01), (v01, v10, v11)
+        faces = np.stack(
+            [np.stack([v00, v10, v01], axis=-1), np.stack([v01, v10, v11], axis=-1)], axis=2
+        ).reshape(-1, 3)
+        return vertices.reshape(-1, 3), faces
+
+
 def _compute_face_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
     """Compute unit normal vectors for each triangular face."""
     v0 = vertices[faces[:, 0]]
@@ -173,6 +227,99 @@ def combine_contours(
     return x, y
 
 
+def _stl_records(v0: np.ndarray, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+    """Pack triangle corner arrays (M, 3) into binary STL records with unit normals."""
+    normals = np.cross(v1 - v0, v2 - v0)
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals /= np.where(norms < 1e-30, 1.0, norms)
+
+    records = np.empty(len(v0), dtype=_STL_RECORD_DTYPE)
+    records["normal"] = normals
+    records["v0"] = v0
+    records["v1"] = v1
+    records["v2"] = v2
+    records["attr"] = 0
+    return records
+
+
+def revolve_and_write_stl_binary(
+    contour_x: np.ndarray,
+    contour_y: np.ndarray,
+    fh: BinaryIO,
+    n_circumferential: int = 64,
+    close_ends: bool = True,
+    tile_faces: int = 65536,
+) -> tuple[int, int]:
+    """Revolve a contour and stream it straight to a binary STL file.
+
+    Produces the same triangles, in the same order, as
+    ``export_stl_binary(revolve_contour(...))`` but never materialises the
+    full mesh: vertex rings are generated a tile of axial slabs at a time
+    and written as packed STL records.
+
+    Args:
+        contour_x: Axial positions [m].
+        contour_y: Radii [m] (distance from axis).
+        fh: Binary file handle opened for writing.
+        n_circumferential: Number of divisions around the circumference.
+        close_ends: If True, close the front and rear faces with fan triangles.
+        tile_faces: Approximate number of triangles generated per write.
+
+    Returns:
+        (n_vertices, n_faces) of the equivalent RevolutionMesh.
+    """
+    x = np.asarray(contour_x, dtype=float)
+    y = np.asarray(contour_y, dtype=float)
+    n_axial = len(x)
+    n_circ = n_circumferential
+
+    theta = np.linspace(0, TWO_PI, n_circ, endpoint=False)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+
+    cap_front = bool(close_ends and y[0] > 1e-10)
+    cap_rear = bool(close_ends and y[-1] > 1e-10)
+    n_vertices = n_axial * n_circ + cap_front + cap_rear
+    n_faces = 2 * (n_axial - 1) * n_circ + n_circ * (cap_front + cap_rear)
+
+    fh.write(_STL_HEADER)
+    fh.write(struct.pack("<I", n_faces))
+
+    def rings(i0: int, i1: int) -> np.ndarray:
+        """Vertices of axial stations i0..i1-1, shape (i1 - i0, n_circ, 3)."""
+        out = np.empty((i1 - i0, n_circ, 3))
+        out[..., 0] = x[i0:i1, None]
+        out[..., 1] = y[i0:i1, None] * cos_t
+        out[..., 2] = y[i0:i1, None] * sin_t
+        return out
+
+    # Two triangles per quad, interleaved per (i, j) as in revolve_contour:
+    # (v00, v10, v01) and (v01, v10, v11)
+    slabs_per_tile = max(1, tile_faces // (2 * n_circ))
+    for i0 in range(0, n_axial - 1, slabs_per_tile):
+        i1 = min(i0 + slabs_per_tile, n_axial - 1)
+        r = rings(i0, i1 + 1)
+        a, b = r[:-1], r[1:]
+        a_next = np.roll(a, -1, axis=1)
+        b_next = np.roll(b, -1, axis=1)
+        v0 = np.stack([a, a_next], axis=2).reshape(-1, 3)
+        v1 = np.stack([b, b], axis=2).reshape(-1, 3)
+        v2 = np.stack([a_next, b_next], axis=2).reshape(-1, 3)
+        fh.write(_stl_records(v0, v1, v2).tobytes())
+
+    # End caps (fan triangulation about the axis)
+    if cap_front:
+        ring = rings(0, 1)[0]
+        center = np.broadcast_to([x[0], 0.0, 0.0], ring.shape)
+        fh.write(_stl_records(center, np.roll(ring, -1, axis=0), ring).tobytes())
+    if cap_rear:
+        ring = rings(n_axial - 1, n_axial)[0]
+        center = np.broadcast_to([x[-1], 0.0, 0.0], ring.shape)
+        fh.write(_stl_records(center, ring, np.roll(ring, -1, axis=0)).tobytes())
+
+    return n_vertices, n_faces
+
+
 def export_stl_binary(mesh: RevolutionMesh, filepath: str) -> None:
     """Export mesh to binary STL format.
 
@@ -185,26 +332,19 @@ def export_stl_binary(mesh: RevolutionMesh, filepath: str) -> None:
         mesh: RevolutionMesh to export.
         filepath: Output file path (should end in .stl).
     """
-    import struct
-
-    n_faces = mesh.n_faces
-    header = b"RESA Pro STL export" + b"\0" * (80 - 19)
-
+    faces = mesh.faces
+    records = np.empty(mesh.n_faces, dtype=_STL_RECORD_DTYPE)
+    records["normal"] = mesh.normals
+    records["v0"] = mesh.vertices[faces[:, 0]]
+    records["v1"] = mesh.vertices[faces[:, 1]]
+    records["v2"] = mesh.vertices[faces[:, 2]]
+    records["attr"] = 0  # attribute byte count
+
+    # One contiguous write for the whole triangle block
     with open(filepath, "wb") as f:
-        f.write(header)
-        f.write(struct.pack("<I", n_faces))
-
-        for i in range(n_faces):
-            normal = mesh.normals[i]
-            v0 = mesh.vertices[mesh.faces[i, 0]]
-            v1 = mesh.vertices[mesh.faces[i, 1]]
-            v2 = mesh.vertices[mesh.faces[i, 2]]
-
-            f.write(struct.pack("<3f", *normal))
-            f.write(struct.pack("<3f", *v0))
-            f.write(struct.pack("<3f", *v1))
-            f.write(struct.pack("<3f", *v2))
-            f.write(struct.pack("<H", 0))  # attribute byte count
+        f.write(_STL_HEADER)
+        f.write(struct.pack("<I", mesh.n_faces))
+        records.tofile(f)
 
 
 def export_stl_ascii(mesh: RevolutionMesh, filepath: str, name: str = "engine") -> None:
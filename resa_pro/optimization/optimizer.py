@@ -7,13 +7,16 @@ Supports:
 - Single-objective minimization (Nelder-Mead, Powell, L-BFGS-B, etc.)
 - Bounded parameter search with linear/nonlinear constraints
 - Multi-objective optimization via weighted-sum and epsilon-constraint methods
-- Design-of-experiments (DOE) for sampling the design space
+- Design-of-experiments (DOE) for sampling the design space (LHS or Sobol')
 - Sensitivity analysis via one-at-a-time (OAT) perturbation
 """
 
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
@@ -208,8 +211,12 @@ class DesignOptimizer:
     ) -> tuple[float, DesignPoint]:
         """Evaluate a single design point and compute the scalar cost."""
         var_dict = self._array_to_dict(x)
-        raw = eval_func(var_dict)
+        return self._score_point(var_dict, eval_func(var_dict))
 
+    def _score_point(
+        self, var_dict: dict[str, float], raw: dict[str, float]
+    ) -> tuple[float, DesignPoint]:
+        """Compute the penalised cost of an already evaluated design point."""
         # Extract objectives
         obj_values = {}
         cost = 0.0
@@ -250,6 +257,7 @@ class DesignOptimizer:
         max_iter: int = 200,
         tol: float = 1e-6,
         seed: int | None = None,
+        workers: int = 1,
     ) -> OptimizationResult:
         """Run single-objective optimization.
 
@@ -260,6 +268,14 @@ class DesignOptimizer:
             max_iter: Maximum iterations / generations.
             tol: Convergence tolerance.
             seed: Random seed (for stochastic methods).
+            workers: Processes used to evaluate each differential-evolution
+                     generation (-1 = all CPUs).  Values other than 1 switch
+                     DE to deferred updating and start spawned worker
+                     processes, so ``eval_func`` must be picklable and
+                     importable (a module-level function or a
+                     ``functools.partial`` of one) and scripts must guard
+                     the call with ``if __name__ == "__main__":``.
+                     Ignored by other methods.
 
         Returns:
             OptimizationResult with best point and history.
@@ -273,13 +289,44 @@ class DesignOptimizer:
         x0 = np.array([v.initial for v in self._variables])
 
         all_points: list[DesignPoint] = []
+        all_costs: list[float] = []
 
         def cost_function(x: np.ndarray) -> float:
             cost, point = self._evaluate_point(x, eval_func)
             all_points.append(point)
+            all_costs.append(cost)
             return cost
 
-        if method.lower() == "differential_evolution":
+        if method.lower() == "differential_evolution" and workers != 1:
+            # Spawn rather than fork: forking a process that holds a Numba
+            # (TBB) or OpenMP thread pool can hang the children and the exit
+            with ProcessPoolExecutor(
+                max_workers=None if workers == -1 else workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+
+                def population_map(func: Any, population: Any) -> list[float]:
+                    # Only eval_func crosses the process boundary; scoring and
+                    # the evaluation history stay in this process
+                    var_dicts = [self._array_to_dict(x) for x in population]
+                    costs = []
+                    for var_dict, raw in zip(var_dicts, pool.map(eval_func, var_dicts)):
+                        cost, point = self._score_point(var_dict, raw)
+                        all_points.append(point)
+                        all_costs.append(cost)
+                        costs.append(cost)
+                    return costs
+
+                result = differential_evolution(
+                    cost_function,
+                    bounds=bounds,
+                    maxiter=max_iter,
+                    tol=tol,
+                    seed=seed,
+                    workers=population_map,
+                    updating="deferred",
+                )
+        elif method.lower() == "differential_evolution":
             result = differential_evolution(
                 cost_function,
                 bounds=bounds,
@@ -301,7 +348,7 @@ class DesignOptimizer:
             else:
                 opts["ftol"] = tol
 
-            bounded_methods = ("l-bfgs-b", "tnc", "slsqp", "trust-constr")
+            bounded_methods = ("nelder-mead", "powell", "l-bfgs-b", "tnc", "slsqp", "trust-constr")
             result = minimize(
                 cost_function,
                 x0,
@@ -310,19 +357,11 @@ class DesignOptimizer:
                 options=opts,
             )
 
-        # Find best feasible point
-        feasible_points = [p for p in all_points if p.feasible]
-        if feasible_points:
-            best_idx = 0
-            best_cost = float("inf")
-            for i, pt in enumerate(feasible_points):
-                c, _ = self._evaluate_point(
-                    self._dict_to_array(pt.variables), eval_func
-                )
-                if c < best_cost:
-                    best_cost = c
-                    best_idx = i
-            best = feasible_points[best_idx]
+        # Find best feasible point from the costs recorded during the run,
+        # rather than calling eval_func on every point a second time
+        feasible = [i for i, p in enumerate(all_points) if p.feasible]
+        if feasible:
+            best = all_points[min(feasible, key=all_costs.__getitem__)]
         elif all_points:
             best = all_points[-1]
         else:
@@ -422,12 +461,47 @@ class DesignOptimizer:
             perm = rng.permutation(n_samples)
             lhs[:, j] = (perm + rng.uniform(size=n_samples)) / n_samples
 
+        return self._evaluate_unit_samples(lhs, eval_func)
+
+    def doe_sobol(
+        self,
+        eval_func: EvalFunction,
+        n_samples: int = 64,
+        seed: int | None = None,
+    ) -> list[DesignPoint]:
+        """Scrambled Sobol' sampling of the design space.
+
+        A low-discrepancy sequence covers the space more evenly than LHS for
+        the same number of evaluations.  ``n_samples`` should be a power of
+        two to keep the sequence's balance properties.
+
+        Args:
+            eval_func: Evaluation function.
+            n_samples: Number of sample points.
+            seed: Random seed for the scrambling.
+
+        Returns:
+            List of evaluated DesignPoint objects.
+        """
+        from scipy.stats import qmc
+
+        if n_samples & (n_samples - 1):
+            logger.warning(
+                "Sobol' sampling is best with a power-of-two sample count (got %d)", n_samples
+            )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            unit = qmc.Sobol(len(self._variables), scramble=True, seed=seed).random(n_samples)
+
+        return self._evaluate_unit_samples(unit, eval_func)
+
+    def _evaluate_unit_samples(
+        self, unit: np.ndarray, eval_func: EvalFunction
+    ) -> list[DesignPoint]:
+        """Evaluate rows of a [0, 1]^d sample matrix mapped onto the variable bounds."""
         points: list[DesignPoint] = []
-        for i in range(n_samples):
-            x = np.array([
-                v.denormalise(lhs[i, j])
-                for j, v in enumerate(self._variables)
-            ])
+        for row in unit:
+            x = np.array([v.denormalise(row[j]) for j, v in enumerate(self._variables)])
             _, point = self._evaluate_point(x, eval_func)
             points.append(point)
 
@@ -5,6 +5,7 @@ and variance-based sensitivity indices for engine design analysis.
 
 Supports:
 - Monte Carlo propagation with normal, uniform, and triangular distributions
+- Plain random, Latin Hypercube, or scrambled Sobol' sampling
 - Statistical summary (mean, std, percentiles, confidence intervals)
 - First-order sensitivity indices (variance-based, Sobol-like)
 - Correlation analysis between inputs and outputs
@@ -13,15 +14,24 @@ Supports:
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from typing import Any, Callable
 
 import numpy as np
+from scipy.special import ndtri
 
 logger = logging.getLogger(__name__)
 
 EvalFunction = Callable[[dict[str, float]], dict[str, float]]
+BatchEvalFunction = Callable[[dict[str, np.ndarray]], dict[str, np.ndarray]]
+
+SAMPLING_METHODS = ("iid", "lhs", "sobol")
 
 
 class Distribution(Enum):
@@ -67,13 +77,42 @@ class UncertainParameter:
             mode = self.mode if self.mode is not None else self.nominal
             return rng.triangular(self.lower, mode, self.upper, size=n)
         elif self.distribution == Distribution.LOGNORMAL:
-            # Convert to lognormal parameters
-            mu = np.log(self.nominal**2 / np.sqrt(self.std**2 + self.nominal**2))
-            sigma = np.sqrt(np.log(1 + (self.std / self.nominal) ** 2))
+            mu, sigma = self._lognormal_params()
             return rng.lognormal(mu, sigma, size=n)
         else:
             raise ValueError(f"Unknown distribution: {self.distribution}")
 
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        """Map uniform [0, 1) samples through this distribution's inverse CDF.
+
+        Used to turn quasi-random (LHS / Sobol') points into parameter samples.
+        """
+        u = np.asarray(u, dtype=float)
+        if self.distribution == Distribution.NORMAL:
+            return self.nominal + self.std * ndtri(u)
+        elif self.distribution == Distribution.UNIFORM:
+            return self.lower + u * (self.upper - self.lower)
+        elif self.distribution == Distribution.TRIANGULAR:
+            mode = self.mode if self.mode is not None else self.nominal
+            span = self.upper - self.lower
+            c = (mode - self.lower) / span if span > 0 else 0.0
+            return np.where(
+                u < c,
+                self.lower + np.sqrt(u * span * (mode - self.lower)),
+                self.upper - np.sqrt((1.0 - u) * span * (self.upper - mode)),
+            )
+        elif self.distribution == Distribution.LOGNORMAL:
+            mu, sigma = self._lognormal_params()
+            return np.exp(mu + sigma * ndtri(u))
+        else:
+            raise ValueError(f"Unknown distribution: {self.distribution}")
+
+    def _lognormal_params(self) -> tuple[float, float]:
+        """Underlying normal (mu, sigma) matching the nominal mean and std."""
+        mu = np.log(self.nominal**2 / np.sqrt(self.std**2 + self.nominal**2))
+        sigma = np.sqrt(np.log(1 + (self.std / self.nominal) ** 2))
+        return float(mu), float(sigma)
+
 
 @dataclass
 class OutputStatistics:
@@ -96,19 +135,23 @@ class OutputStatistics:
     @classmethod
     def from_samples(cls, name: str, data: np.ndarray) -> OutputStatistics:
         """Compute statistics from a sample array."""
+        # One sort-based pass for all order statistics
+        ci_lo, p05, p25, median, p75, p95, ci_hi = np.percentile(
+            data, [2.5, 5, 25, 50, 75, 95, 97.5]
+        )
         return cls(
             name=name,
             mean=float(np.mean(data)),
             std=float(np.std(data, ddof=1)) if len(data) > 1 else 0.0,
-            median=float(np.median(data)),
-            p05=float(np.percentile(data, 5)),
-            p25=float(np.percentile(data, 25)),
-            p75=float(np.percentile(data, 75)),
-            p95=float(np.percentile(data, 95)),
+            median=float(median),
+            p05=float(p05),
+            p25=float(p25),
+            p75=float(p75),
+            p95=float(p95),
             min_val=float(np.min(data)),
             max_val=float(np.max(data)),
-            ci_95_lower=float(np.percentile(data, 2.5)),
-            ci_95_upper=float(np.percentile(data, 97.5)),
+            ci_95_lower=float(ci_lo),
+            ci_95_upper=float(ci_hi),
             samples=data,
         )
 
@@ -125,6 +168,19 @@ class UQResult:
     n_failed: int = 0
 
 
+def _safe_eval(
+    eval_func: EvalFunction, params: dict[str, float]
+) -> tuple[dict[str, float], str | None]:
+    """Call *eval_func*, returning ``(result, None)`` or ``({}, error message)``.
+
+    Module-level so it can be shipped to worker processes.
+    """
+    try:
+        return eval_func(params), None
+    except Exception as e:
+        return {}, str(e)
+
+
 class UncertaintyAnalysis:
     """Monte Carlo uncertainty quantification engine.
 
@@ -163,9 +219,12 @@ class UncertaintyAnalysis:
 
     def run(
         self,
-        eval_func: EvalFunction,
+        eval_func: EvalFunction | None = None,
         n_samples: int = 1000,
         seed: int | None = None,
+        batch_func: BatchEvalFunction | None = None,
+        sampling: str = "iid",
+        workers: int = 1,
     ) -> UQResult:
         """Run Monte Carlo uncertainty propagation.
 
@@ -173,40 +232,44 @@ class UncertaintyAnalysis:
             eval_func: Function mapping parameter dict → output dict.
             n_samples: Number of Monte Carlo samples.
             seed: Random seed for reproducibility.
+            batch_func: Optional vectorised evaluator mapping a dict of
+                input sample arrays → dict of output arrays.  When given it
+                is called once for all samples instead of calling
+                ``eval_func`` per sample; non-finite outputs count as
+                failed samples.
+            sampling: ``"iid"`` for independent random draws, ``"lhs"`` for
+                Latin Hypercube, or ``"sobol"`` for scrambled Sobol' points.
+                The stratified schemes reach a given confidence-interval
+                width with fewer samples; Sobol' works best when
+                ``n_samples`` is a power of two.
+            workers: Processes used to call ``eval_func`` (-1 = all CPUs).
+                Values other than 1 start spawned worker processes, so
+                ``eval_func`` must be picklable and importable (a
+                module-level function or a ``functools.partial`` of one),
+                and scripts must guard the call with
+                ``if __name__ == "__main__":``.  Ignored when
+                ``batch_func`` is given.
 
         Returns:
             UQResult with statistics, sensitivity indices, and correlations.
         """
-        rng = np.random.default_rng(seed)
+        if eval_func is None and batch_func is None:
+            raise ValueError("Provide eval_func or batch_func")
 
-        # Generate input samples
-        input_samples: dict[str, np.ndarray] = {}
-        for param in self._parameters:
-            input_samples[param.name] = param.sample(rng, n_samples)
-
-        # Evaluate all samples
-        output_samples: dict[str, list[float]] = {key: [] for key in self._output_keys}
-        n_failed = 0
-
-        for i in range(n_samples):
-            params = {}
-            for param in self._parameters:
-                params[param.name] = float(input_samples[param.name][i])
+        rng = np.random.default_rng(seed)
+        input_samples = self._draw_samples(rng, n_samples, sampling)
 
-            try:
-                result = eval_func(params)
-                for key in self._output_keys:
-                    output_samples[key].append(result.get(key, 0.0))
-            except Exception as e:
-                n_failed += 1
-                logger.debug("Sample %d failed: %s", i, e)
-                for key in self._output_keys:
-                    output_samples[key].append(np.nan)
+        if batch_func is not None:
+            output_samples, n_failed = self._evaluate_batch(batch_func, input_samples, n_samples)
+        elif eval_func is not None:
+            output_samples, n_failed = self._evaluate_each(
+                eval_func, input_samples, n_samples, workers
+            )
 
         # Compute statistics
         stats: dict[str, OutputStatistics] = {}
         for key in self._output_keys:
-            data = np.array(output_samples[key])
+            data = np.asarray(output_samples[key])
             valid = data[~np.isnan(data)]
             if len(valid) > 0:
                 stats[key] = OutputStatistics.from_samples(key, valid)
@@ -228,10 +291,103 @@ class UncertaintyAnalysis:
             n_failed=n_failed,
         )
 
+    def _draw_samples(
+        self, rng: np.random.Generator, n_samples: int, sampling: str
+    ) -> dict[str, np.ndarray]:
+        """Generate input samples for every parameter."""
+        if sampling == "iid":
+            return {param.name: param.sample(rng, n_samples) for param in self._parameters}
+        if sampling not in SAMPLING_METHODS:
+            raise ValueError(f"Unknown sampling method {sampling!r}; use one of {SAMPLING_METHODS}")
+        if not self._parameters:
+            return {}
+
+        from scipy.stats import qmc
+
+        d = len(self._parameters)
+        if sampling == "lhs":
+            u = qmc.LatinHypercube(d, seed=rng).random(n_samples)
+        else:
+            if n_samples & (n_samples - 1):
+                logger.warning(
+                    "Sobol' sampling is best with a power-of-two sample count (got %d)",
+                    n_samples,
+                )
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                u = qmc.Sobol(d, scramble=True, seed=rng).random(n_samples)
+
+        return {param.name: param.ppf(u[:, j]) for j, param in enumerate(self._parameters)}
+
+    def _evaluate_each(
+        self,
+        eval_func: EvalFunction,
+        input_samples: dict[str, np.ndarray],
+        n_samples: int,
+        workers: int = 1,
+    ) -> tuple[dict[str, np.ndarray], int]:
+        """Evaluate samples one at a time; failed samples yield NaN outputs."""
+        output_samples: dict[str, list[float]] = {key: [] for key in self._output_keys}
+        n_failed = 0
+
+        names = [param.name for param in self._parameters]
+        columns = [input_samples[name].tolist() for name in names]
+        params_iter = (dict(zip(names, row)) for row in zip(*columns))
+
+        task = partial(_safe_eval, eval_func)
+        if workers == 1:
+            outcomes = list(map(task, params_iter))
+        else:
+            n_procs = (os.cpu_count() or 1) if workers == -1 else workers
+            # Chunk so that each worker receives a few large batches
+            chunksize = max(1, n_samples // (4 * n_procs))
+            # Spawn rather than fork: forking a process that holds a Numba
+            # (TBB) or OpenMP thread pool can hang the children and the exit
+            with ProcessPoolExecutor(
+                max_workers=n_procs, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                outcomes = list(pool.map(task, params_iter, chunksize=chunksize))
+
+        for i, (result, error) in enumerate(outcomes):
+            if error is None:
+                for key in self._output_keys:
+                    output_samples[key].append(result.get(key, 0.0))
+            else:
+                n_failed += 1
+                logger.debug("Sample %d failed: %s", i, error)
+                for key in self._output_keys:
+                    output_samples[key].append(np.nan)
+
+        return {key: np.array(vals, dtype=float) for key, vals in output_samples.items()}, n_failed
+
+    def _evaluate_batch(
+        self,
+        batch_func: BatchEvalFunction,
+        input_samples: dict[str, np.ndarray],
+        n_samples: int,
+    ) -> tuple[dict[str, np.ndarray], int]:
+        """Evaluate all samples in one vectorised call."""
+        result = batch_func(input_samples)
+        output_samples: dict[str, np.ndarray] = {}
+        failed = np.zeros(n_samples, dtype=bool)
+        for key in self._output_keys:
+            data = np.asarray(result.get(key, np.zeros(n_samples)), dtype=float)
+            data = np.broadcast_to(data, (n_samples,)).copy()
+            failed |= ~np.isfinite(data)
+            output_samples[key] = data
+
+        # Match the per-sample path: a failed sample is NaN in every output
+        for data in output_samples.values():
+            data[failed] = np.nan
+        n_failed = int(failed.sum())
+        if n_failed:
+            logger.debug("%d samples produced non-finite outputs", n_failed)
+        return output_samples, n_failed
+
     def _compute_sensitivity_indices(
         self,
         input_samples: dict[str, np.ndarray],
-        output_samples: dict[str, list[float]],
+        output_samples: dict[str, np.ndarray],
         n_samples: int,
     ) -> dict[str, dict[str, float]]:
         """Estimate first-order sensitivity indices.
@@ -249,7 +405,7 @@ class UncertaintyAnalysis:
             param_sens: dict[str, float] = {}
 
             for key in self._output_keys:
-                y = np.array(output_samples[key])
+                y = np.asarray(output_samples[key])
                 valid = ~np.isnan(y)
                 if valid.sum() < n_bins:
                     param_sens[key] = 0.0
@@ -268,13 +424,11 @@ class UncertaintyAnalysis:
                 bin_indices = np.digitize(x_valid, bin_edges) - 1
                 bin_indices = np.clip(bin_indices, 0, n_bins - 1)
 
-                bin_means = np.zeros(n_bins)
-                for b in range(n_bins):
-                    mask = bin_indices == b
-                    if mask.sum() > 0:
-                        bin_means[b] = np.mean(y_valid[mask])
-                    else:
-                        bin_means[b] = np.mean(y_valid)
+                counts = np.bincount(bin_indices, minlength=n_bins)
+                sums = np.bincount(bin_indices, weights=y_valid, minlength=n_bins)
+                # Empty bins take the overall mean
+                bin_means = np.full(n_bins, np.mean(y_valid))
+                np.divide(sums, counts, out=bin_means, where=counts > 0)
 
                 var_of_means = np.var(bin_means)
                 param_sens[key] = float(var_of_means / total_var)
@@ -286,24 +440,26 @@ class UncertaintyAnalysis:
     def _compute_correlations(
         self,
         input_samples: dict[str, np.ndarray],
-        output_samples: dict[str, list[float]],
+        output_samples: dict[str, np.ndarray],
     ) -> dict[str, dict[str, float]]:
         """Compute Pearson correlation between inputs and outputs."""
-        correlations: dict[str, dict[str, float]] = {}
+        correlations: dict[str, dict[str, float]] = {
+            param.name: {} for param in self._parameters
+        }
+        if not self._parameters:
+            return correlations
+        x_all = np.vstack([input_samples[param.name] for param in self._parameters])
 
-        for param in self._parameters:
-            x = input_samples[param.name]
-            corr_row: dict[str, float] = {}
-
-            for key in self._output_keys:
-                y = np.array(output_samples[key])
-                valid = ~np.isnan(y)
-                if valid.sum() < 3:
-                    corr_row[key] = 0.0
-                    continue
-                corr_matrix = np.corrcoef(x[valid], y[valid])
-                corr_row[key] = float(corr_matrix[0, 1])
-
-            correlations[param.name] = corr_row
+        for key in self._output_keys:
+            y = np.asarray(output_samples[key], dtype=float)
+            valid = ~np.isnan(y)
+            if valid.sum() < 3:
+                for row in correlations.values():
+                    row[key] = 0.0
+                continue
+            # One corrcoef per output: last row holds output-vs-input terms
+            corr = np.corrcoef(np.vstack([x_all[:, valid], y[valid]]))[-1, :-1]
+            for param, r in zip(self._parameters, corr):
+                correlations[param.name][key] = float(r)
 
         return correlations
@@ -200,9 +200,10 @@ class CoolingFeedTab(QWidget):
             ]
             self.cool_results.set_data(rows)
 
-            x_arr = [s.x * 1e3 for s in result.stations]
-            tw_arr = [s.T_wg for s in result.stations]
-            tc_arr = [s.T_coolant for s in result.stations]
+            stations = result.stations
+            x_arr = stations.x * 1e3
+            tw_arr = stations.T_wg
+            tc_arr = stations.T_coolant
 
             self.cool_plot.plot_multi(
                 [(x_arr, tw_arr, "T_wall (gas side)"), (x_arr, tc_arr, "T_coolant")],
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import traceback
+from functools import partial
 
 import numpy as np
 from PySide6.QtWidgets import (
@@ -198,16 +199,14 @@ class OptimizeUQTab(QWidget):
 
     # ---------- Callbacks ----------
 
-    def _eval_engine(self, params: dict) -> dict:
+    def _eval_engine(self, params: dict, oxidizer: str = "n2o", fuel: str = "ethanol") -> dict:
         from resa_pro.core.thermo import compute_nozzle_performance, lookup_combustion
 
         pc = params.get("chamber_pressure", 2e6)
         eps = params.get("expansion_ratio", 10.0)
         mr = params.get("mixture_ratio", 4.0)
-        ox = params.get("_oxidizer", "n2o")
-        fuel = params.get("_fuel", "ethanol")
 
-        comb = lookup_combustion(str(ox), str(fuel), mixture_ratio=mr)
+        comb = lookup_combustion(oxidizer, fuel, mixture_ratio=mr)
         perf = compute_nozzle_performance(
             gamma=comb.gamma, molar_mass=comb.molar_mass,
             Tc=comb.chamber_temperature, expansion_ratio=max(eps, 1.1), pc=max(pc, 1e5),
@@ -226,12 +225,7 @@ class OptimizeUQTab(QWidget):
             opt.add_variable(DesignVariable("expansion_ratio", v["eps_min"], v["eps_max"]))
             opt.add_objective(Objective("Isp_vac", "Isp_vac", direction="maximize"))
 
-            ox, fuel = v["oxidizer"], v["fuel"]
-
-            def eval_fn(p):
-                p["_oxidizer"] = ox
-                p["_fuel"] = fuel
-                return self._eval_engine(p)
+            eval_fn = partial(self._eval_engine, oxidizer=v["oxidizer"], fuel=v["fuel"])
 
             result = opt.optimize(eval_fn, method=v["method"], max_iter=v["max_iter"], seed=v["seed"])
 
@@ -279,12 +273,7 @@ class OptimizeUQTab(QWidget):
             opt.add_variable(DesignVariable("expansion_ratio", v["eps_min"], v["eps_max"], initial=eps_mid))
             opt.add_objective(Objective("Isp_vac", "Isp_vac"))
 
-            ox, fuel = v["oxidizer"], v["fuel"]
-
-            def eval_fn(p):
-                p["_oxidizer"] = ox
-                p["_fuel"] = fuel
-                return self._eval_engine(p)
+            eval_fn = partial(self._eval_engine, oxidizer=v["oxidizer"], fuel=v["fuel"])
 
             sens = opt.sensitivity_analysis(eval_fn)
 
@@ -317,12 +306,7 @@ class OptimizeUQTab(QWidget):
             opt.add_variable(DesignVariable("expansion_ratio", v["eps_min"], v["eps_max"]))
             opt.add_objective(Objective("Isp_vac", "Isp_vac"))
 
-            ox, fuel = v["oxidizer"], v["fuel"]
-
-            def eval_fn(p):
-                p["_oxidizer"] = ox
-                p["_fuel"] = fuel
-                return self._eval_engine(p)
+            eval_fn = partial(self._eval_engine, oxidizer=v["oxidizer"], fuel=v["fuel"])
 
             points = opt.doe_latin_hypercube(eval_fn, n_samples=v["n_samples"], seed=v["seed"])
             ranked = sorted(points, key=lambda p: p.objectives.get("Isp_vac", 0), reverse=True)
@@ -363,12 +347,7 @@ class OptimizeUQTab(QWidget):
             uq.add_output("c_star")
             uq.add_output("CF_vac")
 
-            def eval_fn(p):
-                p["_oxidizer"] = "n2o"
-                p["_fuel"] = "ethanol"
-                return self._eval_engine(p)
-
-            result = uq.run(eval_fn, n_samples=v["n_samples"], seed=v["seed"])
+            result = uq.run(self._eval_engine, n_samples=v["n_samples"], seed=v["seed"])
 
             rows = []
             for key, stats in result.output_statistics.items():
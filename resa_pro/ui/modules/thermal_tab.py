@@ -113,13 +113,12 @@ class ThermalTab(QWidget):
             )
 
             # Extract data for plotting and display
-            x_arr = [r.x * 1e3 for r in hf_results]
-            q_arr = [r.q_dot / 1e6 for r in hf_results]
-            hg_arr = [r.h_g for r in hf_results]
+            x_arr = hf_results.x * 1e3
+            q_arr = hf_results.q_dot / 1e6
 
-            peak_q = max(r.q_dot for r in hf_results)
-            peak_hg = max(r.h_g for r in hf_results)
-            peak_taw = max(r.T_aw for r in hf_results)
+            peak_q = float(hf_results.q_dot.max())
+            peak_hg = float(hf_results.h_g.max())
+            peak_taw = float(hf_results.T_aw.max())
 
             rows = [
                 ("Peak Heat Flux", f"{peak_q / 1e6:.2f}", "MW/m^2"),
@@ -28,6 +28,7 @@ T_CELSIUS_OFFSET = 273.15  # K
 # Mathematical
 PI = math.pi
 TWO_PI = 2.0 * math.pi
+INV_PI = 1.0 / math.pi
 DEG_TO_RAD = math.pi / 180.0
 RAD_TO_DEG = 180.0 / math.pi
 
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+from typing import overload
+
 import numpy as np
 from scipy import interpolate
 
 
+@overload
+def linear_interp_1d(
+    x: np.ndarray, y: np.ndarray, x_new: float, extrapolate: bool = ...
+) -> float: ...
+@overload
+def linear_interp_1d(
+    x: np.ndarray, y: np.ndarray, x_new: np.ndarray, extrapolate: bool = ...
+) -> np.ndarray: ...
+
+
 def linear_interp_1d(
     x: np.ndarray,
     y: np.ndarray,
@@ -14,6 +26,10 @@ def linear_interp_1d(
 ) -> float | np.ndarray:
     """One-dimensional linear interpolation.
 
+    Runs on ``np.interp`` (compiled binary search) rather than building a
+    scipy interpolator per call.  Outside the data range the end values are
+    held, or with *extrapolate* the first/last segment is continued.
+
     Args:
         x: Known x-coordinates (must be monotonically increasing).
         y: Known y-values.
@@ -23,9 +39,23 @@ def linear_interp_1d(
     Returns:
         Interpolated value(s).
     """
-    fill = "extrapolate" if extrapolate else (y[0], y[-1])
-    f = interpolate.interp1d(x, y, kind="linear", fill_value=fill, bounds_error=False)
-    return float(f(x_new)) if np.isscalar(x_new) else f(x_new)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if isinstance(x_new, (int, float, np.number)):
+        if extrapolate and x_new < x[0]:
+            return float(y[0] + (x_new - x[0]) * (y[1] - y[0]) / (x[1] - x[0]))
+        if extrapolate and x_new > x[-1]:
+            return float(y[-1] + (x_new - x[-1]) * (y[-1] - y[-2]) / (x[-1] - x[-2]))
+        return float(np.interp(x_new, x, y))
+
+    x_new = np.asarray(x_new, dtype=float)
+    result: np.ndarray = np.interp(x_new, x, y)
+    if extrapolate:
+        lo = y[0] + (x_new - x[0]) * (y[1] - y[0]) / (x[1] - x[0])
+        hi = y[-1] + (x_new - x[-1]) * (y[-1] - y[-2]) / (x[-1] - x[-2])
+        result = np.where(x_new < x[0], lo, np.where(x_new > x[-1], hi, result))
+    return result
 
 
 def cubic_interp_1d(
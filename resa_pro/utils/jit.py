@@ -0,0 +1,52 @@
+"""Optional Numba JIT support for RESA Pro.
+
+Numba is an optional dependency (``pip install resa-pro[perf]``).  When it
+is installed, :func:`njit` compiles numeric kernels to machine code; without
+it the decorator is a no-op and modules fall back to their NumPy paths.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any, TypeVar, overload
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numba
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+    logger.debug("numba not available — using NumPy kernels")
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@overload
+def njit(func: _F, /) -> _F: ...
+@overload
+def njit(**kwargs: Any) -> Callable[[_F], _F]: ...
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile a function with ``numba.njit`` if Numba is installed.
+
+    Usable both bare (``@njit``) and with options
+    (``@njit(cache=True)``).  Without Numba the decorated
+    function is returned unchanged.  Either way type checkers see the
+    decorated function's own signature.
+    """
+    if _HAS_NUMBA:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: _F) -> _F:
+        return func
+
+    return decorator
+
+
+prange = numba.prange if _HAS_NUMBA else range
@@ -80,6 +80,19 @@ class TestChamberToNozzlePipeline:
         ])
         assert result.exit_code == 0, result.output
         assert os.path.exists(injector_out)
+        assert "Orifice Diameter" in result.output
+        assert "Chugging stability" in result.output
+
+    def test_injector_quiet(self, runner, tmp_dir):
+        """--quiet should skip the result tables but still save the design."""
+        injector_out = os.path.join(tmp_dir, "injector.json")
+        result = runner.invoke(cli, [
+            "--quiet", "injector", "--mass-flow", "1.0", "--mr", "4.0",
+            "--pc", "2000000", "-o", injector_out,
+        ])
+        assert result.exit_code == 0, result.output
+        assert os.path.exists(injector_out)
+        assert "Orifice Diameter" not in result.output
 
     def test_report_from_design(self, runner, tmp_dir):
         """Report command should generate a text report from design."""
@@ -156,6 +169,68 @@ class TestFeedSystemCLI:
         assert "Pressure Budget" in result.output
 
 
+class TestAnalysisCLI:
+    """Test DOE and Monte Carlo CLI commands."""
+
+    def test_doe_ranks_output(self, runner, tmp_dir):
+        out_path = os.path.join(tmp_dir, "doe.json")
+        result = runner.invoke(cli, ["optimize", "doe", "-n", "12", "-o", out_path])
+        assert result.exit_code == 0, result.output
+        assert "Top 5 of 12 Samples" in result.output
+
+        with open(out_path) as f:
+            points = json.load(f)
+        isp = [p["objectives"]["Isp_vac"] for p in points]
+        assert len(isp) == 12
+        assert isp == sorted(isp, reverse=True)
+        # Propellant names are not recorded as design variables
+        assert set(points[0]["variables"]) == {"chamber_pressure", "expansion_ratio"}
+
+    def test_doe_quiet_and_json(self, runner):
+        result = runner.invoke(cli, ["--quiet", "optimize", "doe", "-n", "8"])
+        assert result.exit_code == 0, result.output
+        assert result.output == ""
+
+        result = runner.invoke(cli, ["--json", "optimize", "doe", "-n", "8"])
+        assert result.exit_code == 0, result.output
+        points = json.loads(result.output)
+        assert len(points) == 8
+        assert points[0]["objectives"]["Isp_vac"] >= points[-1]["objectives"]["Isp_vac"]
+
+    def test_doe_unknown_propellants(self, runner):
+        result = runner.invoke(cli, ["optimize", "doe", "-n", "4", "--fuel", "unobtainium"])
+        assert result.exit_code == 1
+        assert "Error" in result.output
+
+    def test_sensitivity_rejects_point_outside_design_range(self, runner):
+        result = runner.invoke(cli, ["optimize", "sensitivity", "--eps", "80"])
+        assert result.exit_code == 2
+        assert "--eps" in result.output
+
+    def test_monte_carlo_json(self, runner):
+        result = runner.invoke(cli, ["--json", "uq", "monte-carlo", "-n", "64"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["n_samples"] == 64
+        assert set(data["statistics"]) == {"Isp_vac", "c_star", "CF_vac"}
+
+    def test_monte_carlo_output_file(self, runner, tmp_dir):
+        out_path = os.path.join(tmp_dir, "mc.json")
+        result = runner.invoke(cli, ["uq", "monte-carlo", "-n", "64", "-o", out_path])
+        assert result.exit_code == 0, result.output
+
+        with open(out_path) as f:
+            text = f.read()
+        data = json.loads(text)
+        assert data["n_samples"] == 64
+        assert text.startswith("{\n  ")  # indented for readability
+
+    def test_monte_carlo_sobol(self, runner):
+        result = runner.invoke(cli, ["uq", "monte-carlo", "-n", "256", "--method", "sobol"])
+        assert result.exit_code == 0, result.output
+        assert "Output Statistics" in result.output
+
+
 class TestInfoCommands:
     """Test info CLI commands."""
 
@@ -167,6 +242,22 @@ class TestInfoCommands:
     def test_info_materials(self, runner):
         result = runner.invoke(cli, ["info", "materials"])
         assert result.exit_code == 0, result.output
+        # Bracketed units must not be swallowed as Rich markup
+        assert "[kg/m³]" in result.output
+
+    def test_info_design(self, runner, tmp_dir):
+        chamber_out = os.path.join(tmp_dir, "chamber.json")
+        result = runner.invoke(cli, [
+            "chamber", "--thrust", "2000", "--pc", "2000000", "-o", chamber_out
+        ])
+        assert result.exit_code == 0, result.output
+
+        result = runner.invoke(cli, ["info", "design", chamber_out])
+        assert result.exit_code == 0, result.output
+        assert "Operating Point" in result.output
+        assert "Chamber Pressure: 20.0 bar" in result.output
+        assert "throat_diameter:" in result.output
+        assert "contour_x" not in result.output
 
 
 class TestSTLExport:
@@ -196,3 +287,224 @@ class TestSTLExport:
         assert result.exit_code == 0, result.output
         assert os.path.exists(stl_out)
         assert os.path.getsize(stl_out) > 0
+
+
+class TestLazyCommands:
+    """Test lazy sub-command registration on the root group."""
+
+    def test_help_lists_all_commands(self, runner):
+        result = runner.invoke(cli, ["--help"])
+        assert result.exit_code == 0, result.output
+        for name in ("chamber", "nozzle", "cooling", "export-stl", "optimize", "uq"):
+            assert name in result.output
+
+    def test_unknown_command(self, runner):
+        result = runner.invoke(cli, ["does-not-exist"])
+        assert result.exit_code != 0
+
+    def test_version_skips_heavy_imports(self):
+        """``resa --version`` should not import rich, numpy or command modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from resa_pro.cli.main import cli\n"
+            "try:\n"
+            "    cli(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "heavy = ('rich', 'numpy', 'resa_pro.cli.chamber_cmd')\n"
+            "loaded = [m for m in heavy if m in sys.modules]\n"
+            "print('LOADED=' + ','.join(loaded))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert "LOADED=\n" in out
+
+    def test_json_info_skips_rich(self):
+        """The root group must not build a console; JSON output never needs one."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from resa_pro.cli.main import cli\n"
+            "try:\n"
+            "    cli(['--json', 'info', 'materials'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('RICH=' + str('rich' in sys.modules))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert "RICH=False" in out
+
+    def test_default_console_is_shared(self):
+        from resa_pro.cli import get_console
+
+        assert get_console() is get_console()
+
+
+class TestWarmup:
+    """Test the Numba warm-up command."""
+
+    def test_warmup_in_process(self, runner):
+        result = runner.invoke(cli, ["warmup", "-j", "1"])
+        assert result.exit_code == 0, result.output
+
+
+class TestPlainOutput:
+    """Test tab-separated table output when stdout is not a terminal."""
+
+    def test_budget_is_tab_separated(self, runner):
+        result = runner.invoke(cli, [
+            "feed", "budget", "--pc", "2000000", "--injector-dp", "400000",
+        ])
+        assert result.exit_code == 0, result.output
+        assert "Chamber Pressure\t20.0\tbar" in result.output
+        assert "Required Tank Pressure\t26.9\tbar" in result.output
+        assert "┃" not in result.output
+
+    def test_plain_table_strips_markup(self):
+        from resa_pro.cli._tables import PlainTable
+
+        table = PlainTable("Title", ("Parameter", "Value", "Unit"))
+        table.add_row("[bold]Performance[/bold]", "", "")
+        table.add_row("", "", "")
+        table.add_row("c*", "1500.0", "m/s")
+        assert table.to_text() == (
+            "Title\nParameter\tValue\tUnit\nPerformance\t\t\nc*\t1500.0\tm/s\n"
+        )
+
+    def test_styled_text_is_cached(self):
+        from resa_pro.cli._tables import PlainTable, styled_text
+
+        header = styled_text("Performance")
+        assert styled_text("Performance") is header
+        assert str(header.style) == "bold"
+
+        table = PlainTable("Title", ("Parameter", "Value", "Unit"))
+        table.add_row(header, "", "")
+        assert "Performance\t\t" in table.to_text()
+
+
+class TestQuietOutput:
+    """Test that the root --quiet flag silences every result-printing command."""
+
+    @pytest.mark.parametrize("args", [
+        ["chamber", "--thrust", "2000", "--pc", "2000000"],
+        ["feed", "tank", "--mass", "5", "--density", "800", "--pressure", "3000000",
+         "--diameter", "0.15"],
+        ["feed", "pressurant", "--tank-volume", "10", "--tank-pressure", "2500000"],
+        ["feed", "budget", "--pc", "2000000", "--injector-dp", "400000"],
+        ["cycle", "analyze"],
+        ["optimize", "isp", "--max-iter", "2"],
+        ["optimize", "sensitivity"],
+        ["info", "materials"],
+        ["warmup", "-j", "1"],
+    ])
+    def test_no_output(self, runner, args):
+        result = runner.invoke(cli, ["--quiet", *args])
+        assert result.exit_code == 0, result.output
+        assert result.output == ""
+
+    def test_design_commands(self, runner, tmp_dir):
+        design = os.path.join(tmp_dir, "chamber.json")
+        result = runner.invoke(cli, [
+            "--quiet", "chamber", "--thrust", "2000", "--pc", "2000000", "-o", design
+        ])
+        assert result.exit_code == 0, result.output
+        assert result.output.strip() == f"Saved to {design}"
+
+        for args in (["cooling", "--design", design], ["report", "--design", design]):
+            result = runner.invoke(cli, ["--quiet", *args])
+            assert result.exit_code == 0, result.output
+            assert "Cooling Summary" not in result.output
+            assert "OPERATING POINT" not in result.output
+
+
+class TestJsonOutput:
+    """Test the root --json flag."""
+
+    def test_injector_json(self, runner):
+        result = runner.invoke(cli, [
+            "--json", "injector", "--mass-flow", "1.0", "--mr", "4.0", "--pc", "2000000",
+        ])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["mass_flow_oxidizer"] == pytest.approx(0.8)
+        assert data["n_elements_ox"] >= 1
+
+    def test_nozzle_and_stl_json(self, runner, tmp_dir):
+        chamber_out = os.path.join(tmp_dir, "chamber.json")
+        nozzle_out = os.path.join(tmp_dir, "nozzle.json")
+        stl_out = os.path.join(tmp_dir, "engine.stl")
+        result = runner.invoke(cli, [
+            "chamber", "--thrust", "2000", "--pc", "2000000", "-o", chamber_out
+        ])
+        assert result.exit_code == 0, result.output
+
+        result = runner.invoke(cli, [
+            "--json", "nozzle", "--design", chamber_out, "-e", "8", "-o", nozzle_out
+        ])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["nozzle"]["expansion_ratio"] == 8
+        assert data["performance"]["Isp_vac"] > 0
+        assert os.path.exists(nozzle_out)
+
+        result = runner.invoke(cli, [
+            "--json", "export-stl", "--design", nozzle_out, "-o", stl_out, "--segments", "8"
+        ])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["includes_nozzle"] is True
+        assert os.path.getsize(stl_out) == 84 + 50 * data["n_faces"]
+
+    @pytest.mark.parametrize("args, key", [
+        (["chamber", "--thrust", "2000", "--pc", "2000000"], "chamber"),
+        (["feed", "tank", "--mass", "5", "--density", "800", "--pressure", "3000000",
+          "--diameter", "0.15"], "tank_mass"),
+        (["feed", "pressurant", "--tank-volume", "10", "--tank-pressure", "2500000"],
+         "pressurant_mass"),
+        (["feed", "budget", "--pc", "2000000", "--injector-dp", "400000"],
+         "required_tank_pressure"),
+        (["cycle", "analyze"], "Isp_delivered"),
+        (["optimize", "isp", "--max-iter", "2"], "best"),
+        (["optimize", "sensitivity"], "chamber_pressure"),
+        (["warmup", "-j", "1"], "tasks"),
+    ])
+    def test_every_command_emits_json(self, runner, args, key):
+        result = runner.invoke(cli, ["--json", *args])
+        assert result.exit_code == 0, result.output
+        assert key in json.loads(result.output)
+
+    def test_design_commands_json(self, runner, tmp_dir):
+        design = os.path.join(tmp_dir, "chamber.json")
+        result = runner.invoke(cli, [
+            "--json", "chamber", "--thrust", "2000", "--pc", "2000000", "-o", design
+        ])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["chamber"]["mass_flow"] > 0
+
+        result = runner.invoke(cli, ["--json", "cooling", "--design", design])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["max_wall_temperature"] > 0
+
+        report = os.path.join(tmp_dir, "report.txt")
+        result = runner.invoke(cli, ["--json", "report", "--design", design, "-o", report])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == {"saved": {"text": report}}
+
+    def test_gui_rejects_json(self, runner):
+        result = runner.invoke(cli, ["--json", "gui"])
+        assert result.exit_code == 2
+        assert "--json is not supported" in result.output
+
+    def test_info_json(self, runner):
+        result = runner.invoke(cli, ["--json", "info", "materials"])
+        assert result.exit_code == 0, result.output
+        assert "copper_c10100" in json.loads(result.output)
@@ -105,3 +105,21 @@ class TestContourGeneration:
         geom = size_chamber_from_thrust(2000, 2e6)
         dx = np.diff(geom.contour_x)
         assert np.all(dx >= -1e-10)  # allow tiny numerical noise
+
+    def test_contour_sections_join(self):
+        """Cone and arc meet the cylinder and throat without gaps."""
+        geom = size_chamber_from_thrust(2000, 2e6)
+        x, y = generate_chamber_contour(geom, num_points=301)
+        assert len(x) == len(y) == 301
+        n_cyl = 301 // 3
+        assert np.all(y[:n_cyl] == geom.chamber_radius)
+        assert y[n_cyl] == pytest.approx(geom.chamber_radius)
+        assert y[-1] == pytest.approx(geom.throat_radius, rel=1e-12)
+        assert np.all(np.diff(y[n_cyl:]) <= 1e-12)
+
+    def test_contour_arrays_are_contiguous(self):
+        """x and y are separate contiguous buffers, not strided views of one (N, 2) array."""
+        geom = size_chamber_from_thrust(2000, 2e6)
+        x, y = generate_chamber_contour(geom)
+        assert x.flags.c_contiguous and y.flags.c_contiguous
+        assert not np.shares_memory(x, y)
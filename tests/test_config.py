@@ -8,9 +8,14 @@ import numpy as np
 import pytest
 
 from resa_pro.core.config import (
+    _HAS_H5PY,
     DesignState,
     ProjectMeta,
+    load_arrays_hdf5,
+    load_design_hdf5,
     load_design_json,
+    save_arrays_hdf5,
+    save_design_hdf5,
     save_design_json,
 )
 
@@ -59,3 +64,254 @@ class TestJsonPersistence:
         with open(path) as f:
             data = json.load(f)
         assert len(data["nozzle"]["contour_x"]) == 10
+
+    def test_ndarray_serialization(self, tmp_path):
+        """Raw numpy arrays and scalars should round-trip without tolist()."""
+        state = DesignState()
+        x = np.linspace(0, 1, 25)
+        state.chamber = {"contour_x": x, "n_points": np.int64(25), "r": np.float64(0.5)}
+        path = tmp_path / "test_ndarray.json"
+        save_design_json(state, path)
+
+        loaded = load_design_json(path)
+        np.testing.assert_allclose(loaded.chamber["contour_x"], x)
+        assert loaded.chamber["n_points"] == 25
+        assert loaded.chamber["r"] == pytest.approx(0.5)
+
+    def test_contour_decoded_lazily(self, tmp_path):
+        state = DesignState()
+        x = np.linspace(0, 1, 25)
+        state.chamber = {"contour_x": x, "contour_y": 0.1 + x}
+        path = tmp_path / "test_contour.json"
+        save_design_json(state, path)
+
+        loaded = load_design_json(path)
+        assert isinstance(loaded.chamber["contour_x"], list)
+        assert loaded.contour("nozzle") is None
+
+        cx, cy = loaded.contour("chamber")
+        np.testing.assert_allclose(cx, x)
+        np.testing.assert_allclose(cy, 0.1 + x)
+        assert loaded.contour("chamber")[0] is cx
+
+        # Replacing the section invalidates the cached arrays
+        loaded.chamber = {"contour_x": [0.0, 1.0], "contour_y": [1.0, 1.0]}
+        assert len(loaded.contour("chamber")[0]) == 2
+
+    def test_non_contiguous_arrays(self, tmp_path):
+        x = np.linspace(0, 1, 10)
+        state = DesignState(
+            chamber={"contour_x": x[::-1], "every_other": x[::2], "h": np.float16(0.5)}
+        )
+        path = tmp_path / "views.json"
+        save_design_json(state, path)
+
+        loaded = load_design_json(path)
+        np.testing.assert_allclose(loaded.chamber["contour_x"], x[::-1])
+        np.testing.assert_allclose(loaded.chamber["every_other"], x[::2])
+        assert loaded.chamber["h"] == 0.5
+
+    def test_save_does_not_copy_state(self, tmp_path, monkeypatch):
+        import resa_pro.core.config as config
+
+        class NoCopy(np.ndarray):
+            def __deepcopy__(self, memo):
+                raise AssertionError("state was deep-copied")
+
+        monkeypatch.setattr(config, "_HAS_H5PY", False)
+        x = np.linspace(0, 1, 5).view(NoCopy)
+        state = DesignState(chamber={"contour_x": x}, _array_data={"x": x})
+        path = tmp_path / "shallow.json"
+        save_design_json(state, path)
+
+        data = json.loads(path.read_text())
+        assert "_array_data" not in data
+        assert data["chamber"]["contour_x"] == pytest.approx(x.tolist())
+
+    def test_stdlib_json_fallback(self, tmp_path, monkeypatch):
+        """Without orjson the stdlib encoder should produce the same document."""
+        import resa_pro.core.config as config
+
+        state = DesignState(chamber={"contour_x": np.linspace(0, 1, 5), "n": np.int64(5)})
+        orjson_path = tmp_path / "orjson.json"
+        save_design_json(state, orjson_path)
+
+        monkeypatch.setattr(config, "_HAS_ORJSON", False)
+        stdlib_path = tmp_path / "stdlib.json"
+        save_design_json(state, stdlib_path)
+
+        expected = json.loads(orjson_path.read_text())
+        actual = json.loads(stdlib_path.read_text())
+        expected.pop("meta")
+        actual.pop("meta")
+        assert actual == expected
+        loaded = load_design_json(stdlib_path)
+        assert loaded.chamber["n"] == 5
+
+    def test_orjson_and_stdlib_load_agree(self, tmp_path, monkeypatch):
+        import resa_pro.core.config as config
+
+        state = DesignState(
+            meta=ProjectMeta(name="Parse", author="Ünïcode"),
+            nozzle={"contour_x": np.linspace(0, 1, 50), "length": 0.1, "bell": True, "n": None},
+        )
+        path = tmp_path / "parse.json"
+        save_design_json(state, path)
+
+        fast = load_design_json(path)
+        monkeypatch.setattr(config, "_HAS_ORJSON", False)
+        slow = load_design_json(path)
+        assert fast == slow
+        assert type(fast.nozzle["contour_x"]) is list
+
+    def test_stdlib_encoder_handles_numpy(self):
+        import io
+
+        from resa_pro.core.config import _NumpyEncoder
+
+        data = {
+            "grid": np.arange(6.0).reshape(2, 3),
+            "nested": [np.arange(2), {"x": np.float32(0.5)}],
+            "label": "not an array",
+        }
+        expected = {
+            "grid": [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]],
+            "nested": [[0, 1], {"x": 0.5}],
+            "label": "not an array",
+        }
+        assert json.loads(json.dumps(data, indent=2, cls=_NumpyEncoder)) == expected
+        buf = io.StringIO()
+        json.dump(data, buf, indent=2, cls=_NumpyEncoder)
+        assert json.loads(buf.getvalue()) == expected
+
+
+@pytest.mark.skipif(not _HAS_H5PY, reason="h5py not installed")
+class TestArraysHDF5:
+    def test_large_arrays_chunked_and_compressed(self, tmp_path):
+        import h5py
+
+        arrays = {
+            "x": np.linspace(0, 1, 100_000),
+            "grid": np.ones((400, 300)),
+            "small": np.arange(10.0),
+            "scalar": np.float64(3.0),
+        }
+        path = tmp_path / "arrays.h5"
+        save_arrays_hdf5(arrays, path, chunk_bytes=1 << 16)
+
+        with h5py.File(path, "r") as f:
+            assert f["x"].compression == "lzf"
+            assert f["x"].shuffle
+            assert f["x"].chunks == (8192,)
+            assert f["grid"].chunks == (27, 300)
+            assert "small" not in f and "scalar" not in f
+            assert set(f["_packed/0"].dtype.names) == {"small", "scalar"}
+
+        loaded = load_arrays_hdf5(path)
+        for key, arr in arrays.items():
+            np.testing.assert_array_equal(loaded[key], arr)
+
+    def test_many_small_arrays_packed(self, tmp_path):
+        import h5py
+
+        arrays = {f"station_{i}": np.full(30, float(i)) for i in range(600)}
+        path = tmp_path / "packed.h5"
+        save_arrays_hdf5(arrays, path)
+
+        with h5py.File(path, "r") as f:
+            assert list(f.keys()) == ["_packed"]
+            assert len(f["_packed"]) == 3
+        loaded = load_arrays_hdf5(path)
+        assert loaded.keys() == arrays.keys()
+        for key, arr in arrays.items():
+            np.testing.assert_array_equal(loaded[key], arr)
+
+    def test_unpacked_small_arrays(self, tmp_path):
+        import h5py
+
+        path = tmp_path / "unpacked.h5"
+        save_arrays_hdf5({"a": np.arange(3.0), "b": np.arange(4)}, path, pack_small=False)
+        with h5py.File(path, "r") as f:
+            assert set(f.keys()) == {"a", "b"}
+            assert f["a"].chunks is None
+        np.testing.assert_array_equal(load_arrays_hdf5(path)["b"], np.arange(4))
+
+    def test_reserved_packed_name_rejected(self, tmp_path):
+        path = tmp_path / "reserved.h5"
+        with pytest.raises(ValueError, match="reserved"):
+            save_arrays_hdf5({"_packed": np.arange(3.0), "a": np.arange(2.0)}, path)
+        assert not path.exists()
+
+    def test_foreign_packed_dataset_loaded_as_array(self, tmp_path):
+        import h5py
+
+        path = tmp_path / "foreign.h5"
+        with h5py.File(path, "w") as f:
+            f.create_dataset("_packed", data=np.arange(3.0))
+        np.testing.assert_array_equal(load_arrays_hdf5(path)["_packed"], np.arange(3.0))
+
+    def test_uncompressed(self, tmp_path):
+        import h5py
+
+        path = tmp_path / "plain.h5"
+        save_arrays_hdf5({"x": np.zeros(100_000)}, path, compression=None, shuffle=False)
+        with h5py.File(path, "r") as f:
+            assert f["x"].compression is None
+
+
+@pytest.mark.skipif(not _HAS_H5PY, reason="h5py not installed")
+class TestDesignHDF5:
+    def test_save_and_load_single_file(self, tmp_path):
+        state = DesignState(
+            meta=ProjectMeta(name="Single"),
+            chamber={"contour_x": np.linspace(0, 1, 5), "contour_y": np.ones(5), "L_star": 1.2},
+            _array_data={"T_wall": np.linspace(300, 900, 100_000), "n": np.int64(3)},
+        )
+        path = tmp_path / "engine.resa"
+        save_design_hdf5(state, path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["engine.resa"]
+        loaded = load_design_hdf5(path)
+        assert loaded.meta.name == "Single"
+        assert loaded.chamber["L_star"] == 1.2
+        np.testing.assert_allclose(loaded.contour("chamber")[0], np.linspace(0, 1, 5))
+        np.testing.assert_array_equal(loaded._array_data["T_wall"], state._array_data["T_wall"])
+        assert loaded._array_data["n"] == 3
+
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "engine.resa"
+        save_design_hdf5(DesignState(thrust=1000.0), path)
+
+        bad = DesignState(thrust=2000.0, _array_data={"obj": np.array([object()])})
+        with pytest.raises(TypeError):
+            save_design_hdf5(bad, path)
+
+        assert load_design_hdf5(path).thrust == 1000.0
+        assert [p.name for p in tmp_path.iterdir()] == ["engine.resa"]
+
+
+@pytest.mark.skipif(not _HAS_H5PY, reason="h5py not installed")
+class TestCompanionHDF5:
+    def test_arrays_round_trip(self, tmp_path):
+        path = tmp_path / "engine.json"
+        save_design_json(DesignState(_array_data={"T": np.arange(5.0)}), path)
+
+        assert json.loads(path.read_text())["has_array_data"] is True
+        np.testing.assert_array_equal(load_design_json(path)._array_data["T"], np.arange(5.0))
+
+    def test_stale_companion_ignored(self, tmp_path):
+        path = tmp_path / "engine.json"
+        save_arrays_hdf5({"old": np.zeros(3)}, path.with_suffix(".h5"))
+        save_design_json(DesignState(), path)
+
+        assert json.loads(path.read_text())["has_array_data"] is False
+        assert load_design_json(path)._array_data == {}
+
+    def test_legacy_file_checks_for_companion(self, tmp_path):
+        path = tmp_path / "legacy.json"
+        save_design_json(DesignState(_array_data={"T": np.arange(3.0)}), path)
+        data = json.loads(path.read_text())
+        del data["has_array_data"]
+        path.write_text(json.dumps(data))
+
+        np.testing.assert_array_equal(load_design_json(path)._array_data["T"], np.arange(3.0))
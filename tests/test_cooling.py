@@ -36,6 +36,16 @@ class TestCoolingChannel:
         ch = CoolingChannel(width=1e-3, height=2e-3, n_channels=40)
         assert ch.total_flow_area == pytest.approx(40 * 2e-6, rel=1e-6)
 
+    def test_immutable_with_cached_properties(self):
+        import dataclasses
+
+        ch = CoolingChannel(width=1e-3, height=2e-3)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ch.width = 2e-3
+        assert ch.hydraulic_diameter is ch.hydraulic_diameter
+        # Cached values do not take part in equality
+        assert ch == CoolingChannel(width=1e-3, height=2e-3)
+
 
 class TestSizeChannels:
     """Test automatic channel count sizing."""
@@ -100,6 +110,16 @@ class TestPressureDrop:
         dp2 = channel_pressure_drop(0.1, 2e-3, 800, 20.0, 60000)
         assert dp2 > dp1
 
+    def test_array_matches_scalar(self):
+        length = np.array([0.05, 0.1, 0.1])
+        velocity = np.array([5.0, 10.0, 0.5])
+        Re = np.array([15000.0, 30000.0, 1500.0])  # last one laminar
+        dp = channel_pressure_drop(length, 2e-3, 800, velocity, Re)
+        for i in range(3):
+            assert dp[i] == pytest.approx(
+                channel_pressure_drop(length[i], 2e-3, 800, velocity[i], Re[i]), rel=1e-14
+            )
+
 
 class TestRegenCoolingAnalysis:
     """Test the full regen cooling analysis."""
@@ -152,6 +172,83 @@ class TestRegenCoolingAnalysis:
         )
         assert result.coolant_outlet_temperature > 293.0
 
+    def test_stations_march_counter_flow(self):
+        x, y = self._make_contour()
+        result = analyze_regen_cooling(
+            contour_x=x, contour_y=y,
+            throat_radius=0.015, pc=2e6, c_star=1550, Tc=3100,
+            gamma=1.21, molar_mass=0.026,
+            coolant_mass_flow=0.2, coolant_inlet_temp=293.0,
+            coolant_cp=2440.0, coolant_rho=789.0,
+            coolant_mu=1.2e-3, coolant_k=0.17,
+            wall_conductivity=350.0,
+        )
+        stations = result.stations
+        assert np.all(np.diff(stations.x) < 0)
+        assert stations.dp[0] == 0.0
+        for st in stations:
+            assert st.channel == size_channels(st.radius)
+        assert result.total_pressure_drop == pytest.approx(stations.dp.sum())
+        assert result.coolant_outlet_temperature == stations[-1].T_coolant
+
+    def test_station_views_match_columns(self):
+        x, y = self._make_contour()
+        result = analyze_regen_cooling(
+            contour_x=x, contour_y=y,
+            throat_radius=0.015, pc=2e6, c_star=1550, Tc=3100,
+            gamma=1.21, molar_mass=0.026,
+            coolant_mass_flow=0.2, coolant_inlet_temp=293.0,
+            coolant_cp=2440.0, coolant_rho=789.0,
+            coolant_mu=1.2e-3, coolant_k=0.17,
+            wall_conductivity=350.0,
+        )
+        stations = result.stations
+        assert stations.n_channels.dtype == np.int32
+        st = stations[10]
+        assert st.T_wg == stations.T_wg[10]
+        assert st.h_c == stations.h_c[10]
+        assert st.k_wall == 350.0
+        assert result.max_wall_temperature == stations.T_wg.max()
+        with pytest.raises(IndexError):
+            stations[len(stations)]
+
+        every_tenth = stations[::10]
+        assert len(every_tenth) == len(range(0, len(stations), 10))
+        np.testing.assert_array_equal(every_tenth.T_wg, stations.T_wg[::10])
+        assert every_tenth[1] == stations[10]
+        tail = stations[-5:]
+        assert len(tail) == 5
+        assert tail[-1] == stations[-1]
+        assert tail.k_wall == stations.k_wall
+
+    def test_zero_coolant_flow_keeps_inlet_temperature(self):
+        x, y = self._make_contour()
+        result = analyze_regen_cooling(
+            contour_x=x, contour_y=y,
+            throat_radius=0.015, pc=2e6, c_star=1550, Tc=3100,
+            gamma=1.21, molar_mass=0.026,
+            coolant_mass_flow=0.0, coolant_inlet_temp=293.0,
+            coolant_cp=2440.0, coolant_rho=789.0,
+            coolant_mu=1.2e-3, coolant_k=0.17,
+            wall_conductivity=350.0,
+        )
+        assert result.coolant_outlet_temperature == 293.0
+        assert np.all(result.stations.T_coolant == 293.0)
+
+    def test_heat_load_matches_coolant_temperature_rise(self):
+        x, y = self._make_contour()
+        result = analyze_regen_cooling(
+            contour_x=x, contour_y=y,
+            throat_radius=0.015, pc=2e6, c_star=1550, Tc=3100,
+            gamma=1.21, molar_mass=0.026,
+            coolant_mass_flow=0.2, coolant_inlet_temp=293.0,
+            coolant_cp=2440.0, coolant_rho=789.0,
+            coolant_mu=1.2e-3, coolant_k=0.17,
+            wall_conductivity=350.0,
+        )
+        dT = result.coolant_outlet_temperature - 293.0
+        assert result.total_heat_load == pytest.approx(0.2 * 2440.0 * dT, rel=1e-9)
+
     def test_higher_wall_k_lower_wall_temp(self):
         """Higher wall conductivity → lower gas-side wall temperature."""
         x, y = self._make_contour()
@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from resa_pro.core.feed_system import (
@@ -9,6 +10,7 @@ from resa_pro.core.feed_system import (
     TankDesign,
     compute_pressure_budget,
     feed_line_pressure_drop,
+    feed_line_pressure_drop_batch,
     size_pressurant_blowdown,
     size_pressurant_regulated,
     size_tank,
@@ -145,6 +147,30 @@ class TestFeedLine:
         r2 = feed_line_pressure_drop(0.5, 800, 1e-3, 0.012, 1.0, K_minor=10.0)
         assert r2.minor_dp > r1.minor_dp
 
+    def test_batch_matches_scalar(self):
+        d = np.array([0.002, 0.006, 0.012, 0.025])[:, None]
+        L = np.array([0.5, 2.0])
+        batch = feed_line_pressure_drop_batch(0.5, 800, 1e-3, d, L, height_change=1.0)
+        assert batch.total_dp.shape == (4, 2)
+
+        for i in range(4):
+            for j in range(2):
+                ref = feed_line_pressure_drop(0.5, 800, 1e-3, d[i, 0], L[j], height_change=1.0)
+                got = batch[i, j]
+                assert got.total_dp == pytest.approx(ref.total_dp, rel=1e-12)
+                assert got.reynolds == pytest.approx(ref.reynolds, rel=1e-12)
+                assert got.length == L[j]
+
+    def test_batch_laminar_and_zero_flow(self):
+        batch = feed_line_pressure_drop_batch(
+            np.array([0.0, 1e-4]), 800, 1e-3, 0.012, 1.0, K_minor=0.0
+        )
+        assert len(batch) == 2
+        assert batch.total_dp[0] == 0.0
+        assert batch.reynolds[1] < 2300
+        ref = feed_line_pressure_drop(1e-4, 800, 1e-3, 0.012, 1.0, K_minor=0.0)
+        assert batch[1].friction_dp == pytest.approx(ref.friction_dp, rel=1e-12)
+
 
 class TestPressureBudget:
     """Test system-level pressure budget."""
@@ -0,0 +1,158 @@
+"""Tests for the CoolProp fluid property interface."""
+
+import CoolProp.CoolProp as CP
+import numpy as np
+import pytest
+
+from resa_pro.core.fluids import (
+    Fluid,
+    FluidPropertyError,
+    get_fluid,
+    get_propellant_info,
+    list_propellants,
+)
+
+
+@pytest.fixture(scope="module")
+def fluid():
+    return Fluid("NitrousOxide")
+
+
+class TestFluidScalarLookups:
+    """Scalar lookups read the cached state and must match PropsSI."""
+
+    T, P = 300.0, 5e6
+
+    @pytest.mark.parametrize(
+        "method, key",
+        [
+            ("density", "D"),
+            ("specific_heat_cp", "C"),
+            ("enthalpy", "H"),
+            ("entropy", "S"),
+            ("speed_of_sound", "A"),
+        ],
+    )
+    def test_matches_propssi(self, fluid, method, key):
+        expected = CP.PropsSI(key, "T", self.T, "P", self.P, "NitrousOxide")
+        assert getattr(fluid, method)(self.T, self.P) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize(
+        "method, key", [("viscosity", "V"), ("thermal_conductivity", "L")]
+    )
+    def test_transport_matches_propssi(self, method, key):
+        # CoolProp has no transport models for N2O; use water
+        water = Fluid("Water")
+        expected = CP.PropsSI(key, "T", self.T, "P", self.P, "Water")
+        assert getattr(water, method)(self.T, self.P) == pytest.approx(expected, rel=1e-12)
+
+    def test_gamma(self, fluid):
+        cp = CP.PropsSI("C", "T", self.T, "P", self.P, "NitrousOxide")
+        cv = CP.PropsSI("O", "T", self.T, "P", self.P, "NitrousOxide")
+        assert fluid.gamma(self.T, self.P) == pytest.approx(cp / cv, rel=1e-12)
+
+    def test_saturation_round_trip(self, fluid):
+        p_sat = fluid.saturation_pressure(280.0)
+        assert p_sat == pytest.approx(CP.PropsSI("P", "T", 280.0, "Q", 0, "NitrousOxide"))
+        assert fluid.saturation_temperature(p_sat) == pytest.approx(280.0, rel=1e-9)
+
+    def test_quality(self, fluid):
+        assert 0.0 < fluid.quality(3e6, 2e5) < 1.0
+        assert fluid.quality(5e6, 5e5) == -1.0
+
+    def test_invalid_state_raises(self, fluid):
+        with pytest.raises(FluidPropertyError):
+            fluid.saturation_pressure(fluid.T_critical + 50.0)
+
+
+class TestFluidLookupCache:
+    def test_repeat_lookup_hits_cache(self, fluid):
+        from resa_pro.core.fluids import _cached_property
+
+        Fluid.clear_cache()
+        rho = fluid.density(290.0, 4e6)
+        # A second Fluid of the same name shares the memoised results
+        assert Fluid("NitrousOxide").density(290.0, 4e6) == rho
+        info = _cached_property.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+        Fluid.clear_cache()
+        assert _cached_property.cache_info().currsize == 0
+
+    def test_failures_not_cached(self, fluid):
+        from resa_pro.core.fluids import _cached_property
+
+        Fluid.clear_cache()
+        for _ in range(2):
+            with pytest.raises(FluidPropertyError):
+                fluid.saturation_pressure(fluid.T_critical + 50.0)
+        assert _cached_property.cache_info().currsize == 0
+
+
+class TestSharedState:
+    def test_instances_share_interned_state(self, fluid):
+        other = Fluid("NitrousOxide")
+        assert other._state is fluid._state
+        assert other.T_critical == fluid.T_critical
+        assert other.molar_mass == pytest.approx(0.0440128, rel=1e-4)
+
+    def test_fresh_state_is_independent(self):
+        water = Fluid("Water")
+        private = water.fresh()
+        assert private._state is not water._state
+        assert private.T_critical == water.T_critical
+        water.props_at_TP(300.0, 5e6)
+        private.props_at_TP(350.0, 2e6)
+        assert water._state.T() == 300.0
+        assert private._state.T() == 350.0
+
+    def test_unknown_fluid_raises(self):
+        with pytest.raises(FluidPropertyError):
+            Fluid("NotAFluid")
+
+
+class TestPropsArray:
+    def test_matches_pointwise_bundle(self):
+        water = Fluid("Water")
+        T = np.array([300.0, 350.0, 450.0])[:, None]
+        P = np.array([1e5, 5e6])
+        props = water.props_at_TP_array(T, P)
+
+        assert props["rho"].shape == (3, 2)
+        assert props["phase"].dtype == np.int32
+        for i in range(3):
+            for j in range(2):
+                ref = water.props_at_TP(T[i, 0], P[j])
+                for key, val in ref.items():
+                    assert props[key][i, j] == pytest.approx(val, rel=1e-12)
+
+    def test_invalid_point_raises(self):
+        with pytest.raises(FluidPropertyError):
+            Fluid("Water").props_at_TP_array(np.array([300.0, -10.0]), 1e5)
+
+    def test_density_matches_vector_propssi(self, fluid):
+        T = np.linspace(250.0, 400.0, 7)[:, None]
+        P = np.array([2e6, 8e6])
+        rho = fluid.density_array(T, P)
+        TT, PP = np.broadcast_arrays(T, P)
+        expected = CP.PropsSI("D", "T", TT.ravel(), "P", PP.ravel(), "NitrousOxide")
+        assert rho.shape == (7, 2)
+        np.testing.assert_allclose(rho.ravel(), expected, rtol=1e-12)
+
+    def test_density_invalid_point_raises(self, fluid):
+        with pytest.raises(FluidPropertyError):
+            fluid.density_array(np.array([300.0, -10.0]), 5e6)
+
+
+class TestPropellantDatabase:
+    def test_lookup_is_case_insensitive(self):
+        assert get_propellant_info("N2O") is get_propellant_info("n2o")
+        assert get_propellant_info("Ethanol")["coolprop_name"] == "Ethanol"
+
+    def test_missing_propellant(self):
+        with pytest.raises(KeyError, match="not found"):
+            get_propellant_info("unobtanium")
+
+    def test_get_fluid_uses_coolprop_name(self):
+        assert "lox" in list_propellants()
+        assert get_fluid("LOX").name == "Oxygen"
@@ -1,6 +1,7 @@
 """Tests for the 3D geometry generation module."""
 
 import os
+import struct
 import tempfile
 
 import numpy as np
@@ -11,6 +12,7 @@ from resa_pro.geometry3d.engine import (
     combine_contours,
     export_stl_ascii,
     export_stl_binary,
+    revolve_and_write_stl_binary,
     revolve_contour,
 )
 
@@ -137,6 +139,24 @@ class TestSTLExport:
         finally:
             os.unlink(path)
 
+    def test_binary_stl_record_layout(self, tmp_path):
+        """Each 50-byte record holds normal, v0, v1, v2 as float32 + uint16."""
+        mesh = self._make_mesh()
+        path = tmp_path / "layout.stl"
+        export_stl_binary(mesh, str(path))
+        data = path.read_bytes()
+        i = 5
+        record = data[84 + 50 * i : 84 + 50 * (i + 1)]
+        expected = struct.pack(
+            "<12fH",
+            *mesh.normals[i],
+            *mesh.vertices[mesh.faces[i, 0]],
+            *mesh.vertices[mesh.faces[i, 1]],
+            *mesh.vertices[mesh.faces[i, 2]],
+            0,
+        )
+        assert record == expected
+
     def test_ascii_stl_creates_file(self):
         mesh = self._make_mesh()
         with tempfile.NamedTemporaryFile(suffix=".stl", delete=False, mode="w") as f:
@@ -151,3 +171,20 @@ class TestSTLExport:
             assert content.count("facet normal") == mesh.n_faces
         finally:
             os.unlink(path)
+
+    def test_streamed_binary_matches_mesh_export(self, tmp_path):
+        """Streaming revolve + write should match export_stl_binary byte for byte."""
+        x = np.linspace(0, 0.1, 25)
+        y = np.linspace(0.03, 0.015, 25)
+        mesh = revolve_contour(x, y, n_circumferential=12)
+        ref_path = tmp_path / "ref.stl"
+        export_stl_binary(mesh, str(ref_path))
+
+        out_path = tmp_path / "streamed.stl"
+        with open(out_path, "wb") as fh:
+            n_vertices, n_faces = revolve_and_write_stl_binary(
+                x, y, fh, n_circumferential=12, tile_faces=50
+            )
+        assert n_vertices == mesh.n_vertices
+        assert n_faces == mesh.n_faces
+        assert out_path.read_bytes() == ref_path.read_bytes()
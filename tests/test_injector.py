@@ -2,13 +2,16 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from resa_pro.core.injector import (
     InjectorDesign,
     check_chugging_stability,
     design_injector,
+    design_injector_batch,
     injection_velocity,
+    make_injector_sizer,
     orifice_area_from_flow,
     orifice_mass_flow,
     stability_margin,
@@ -55,6 +58,28 @@ class TestOrificeEquations:
         v2 = injection_velocity(0.65, 4e5, 800)
         assert v2 > v1
 
+    def test_array_inputs_broadcast(self):
+        dp = np.array([1e5, 4e5, 9e5])
+        rho = np.array([[800.0], [1000.0]])
+        mdot = orifice_mass_flow(0.65, 1e-6, dp, rho)
+        v = injection_velocity(0.65, dp, rho)
+        assert mdot.shape == v.shape == (2, 3)
+        assert mdot[1, 2] == orifice_mass_flow(0.65, 1e-6, 9e5, 1000.0)
+        assert v[0, 1] == injection_velocity(0.65, 4e5, 800.0)
+        np.testing.assert_allclose(orifice_area_from_flow(mdot, 0.65, dp, rho), 1e-6, rtol=1e-14)
+        assert type(orifice_mass_flow(0.65, 1e-6, 1e5, 1000)) is float
+
+    @pytest.mark.parametrize(
+        "dp", [0.0, -1e5, np.float64(-1.0), np.array(0.0), np.array([1e5, 0.0]), [2e5, -1e5]]
+    )
+    def test_non_positive_dp_rejected(self, dp):
+        with pytest.raises(ValueError, match="Pressure drop"):
+            orifice_mass_flow(0.65, 1e-6, dp, 1000.0)
+        with pytest.raises(ValueError, match="Pressure drop"):
+            orifice_area_from_flow(0.1, 0.65, dp, 1000.0)
+        with pytest.raises(ValueError, match="Pressure drop"):
+            injection_velocity(0.65, dp, 1000.0)
+
 
 class TestInjectorDesign:
     """Test the design_injector function."""
@@ -123,6 +148,52 @@ class TestInjectorDesign:
         assert result.momentum_ratio > 0
 
 
+class TestInjectorBatch:
+    """Test vectorised injector sizing."""
+
+    def test_matches_scalar(self):
+        mass_flows = np.array([0.5, 1.0, 2.5])
+        batch = design_injector_batch(mass_flows, 4.0, 2e6, 1220.0, 789.0)
+        assert len(batch) == 3
+        for i, mdot in enumerate(mass_flows):
+            assert batch.design(i) == design_injector(mdot, 4.0, 2e6, 1220.0, 789.0)
+
+    def test_broadcast_and_fixed_counts(self):
+        batch = design_injector_batch(
+            1.0, np.array([2.0, 4.0, 6.0]), np.array([[1e6], [2e6]]), 1220.0, 789.0,
+            n_elements_ox=12, element_diameter_fuel=1.0e-3,
+        )
+        assert batch.mass_flow_oxidizer.shape == (2, 3)
+        assert np.all(batch.n_elements_ox == 12)
+        assert np.all(batch.diameter_fuel == 1.0e-3)
+        np.testing.assert_allclose(batch.mass_flow_oxidizer + batch.mass_flow_fuel, 1.0)
+
+
+class TestInjectorSizer:
+    """Test the pre-bound scalar sizer."""
+
+    @pytest.mark.parametrize(
+        "ox_opts", [{}, {"n_elements_ox": 7}, {"element_diameter_ox": 1.2e-3}]
+    )
+    @pytest.mark.parametrize(
+        "fuel_opts", [{}, {"n_elements_fuel": 9}, {"element_diameter_fuel": 0.8e-3}]
+    )
+    def test_matches_batch(self, ox_opts, fuel_opts):
+        opts = dict(ox_opts, **fuel_opts, dp_fraction_ox=0.25, cd_fuel=0.7)
+        sizer = make_injector_sizer(**opts)
+        mass_flows = np.array([0.3, 1.0, 2.5])
+        batch = design_injector_batch(mass_flows, 3.5, 2e6, 1220.0, 789.0, **opts)
+        for i, mdot in enumerate(mass_flows):
+            assert sizer(float(mdot), 3.5, 2e6, 1220.0, 789.0) == batch.design(i)
+
+    def test_picklable(self):
+        import pickle
+
+        sizer = make_injector_sizer(n_elements_ox=12, element_diameter_fuel=1e-3)
+        restored = pickle.loads(pickle.dumps(sizer))
+        assert restored(1.0, 4.0, 2e6, 1220.0, 789.0) == sizer(1.0, 4.0, 2e6, 1220.0, 789.0)
+
+
 class TestStability:
     """Test stability checking functions."""
 
@@ -1,5 +1,6 @@
 """Tests for the materials module."""
 
+import numpy as np
 import pytest
 
 from resa_pro.core.materials import Material, get_material_info, list_materials
@@ -16,6 +17,9 @@ class TestMaterialsDatabase:
         assert info["name"] == "C10100 OFE Copper"
         assert info["density"] > 0
 
+    def test_lookup_is_case_insensitive(self):
+        assert get_material_info("COPPER_C10100") is get_material_info("copper_c10100")
+
     def test_missing_material(self):
         with pytest.raises(KeyError):
             get_material_info("unobtanium")
@@ -43,6 +47,36 @@ class TestMaterialClass:
         k = mat.thermal_conductivity(293)
         assert 12 < k < 15  # ~13.4 W/(m·K)
 
+    def test_tables_shared_and_read_only(self):
+        a = Material("ss316")
+        b = Material("SS316")
+        assert a._k_T is b._k_T and a._cp_vals is b._cp_vals
+        assert a._k_vals.dtype == np.float64 and a._k_vals.flags.c_contiguous
+        with pytest.raises(ValueError):
+            a._k_vals[0] = 0.0
+
+    def test_array_queries_match_scalar(self):
+        mat = Material("inconel_718")
+        T = np.array([100.0, 293.0, 650.0, 5000.0])  # last one extrapolated
+        for getter in (mat.thermal_conductivity, mat.specific_heat, mat.thermal_diffusivity):
+            values = getter(T)
+            assert values.shape == T.shape
+            for t, v in zip(T, values):
+                assert v == pytest.approx(getter(float(t)), rel=1e-14)
+
+    def test_extrapolates_end_segment(self):
+        mat = Material("copper_c10100")
+        T, k = mat._k_T, mat._k_vals
+        slope = (k[-1] - k[-2]) / (T[-1] - T[-2])
+        assert mat.thermal_conductivity(T[-1] + 100.0) == pytest.approx(k[-1] + 100.0 * slope)
+
+    def test_diffusivity_matches_property_ratio(self):
+        for material_id in list_materials():
+            mat = Material(material_id)
+            for T in (150.0, 293.0, 420.0, 987.6, 4000.0):
+                expected = mat.thermal_conductivity(T) / (mat.density * mat.specific_heat(T))
+                assert mat.thermal_diffusivity(T) == pytest.approx(expected, rel=1e-12)
+
     def test_repr(self):
         mat = Material("inconel_718")
         assert "Inconel 718" in repr(mat)
@@ -35,6 +35,38 @@ class TestPrandtlMeyer:
             M_inv = mach_from_prandtl_meyer(nu, 1.4)
             assert M_inv == pytest.approx(M, rel=1e-6)
 
+    @pytest.mark.parametrize("gamma", [1.1, 1.2, 1.4, 1.67])
+    def test_inversion_tight_near_sonic_and_hypersonic(self, gamma):
+        for M in [1.0001, 1.01, 1.3, 8.0, 40.0]:
+            M_inv = mach_from_prandtl_meyer(prandtl_meyer(M, gamma), gamma)
+            assert M_inv == pytest.approx(M, rel=1e-10)
+
+    def test_inversion_out_of_range(self):
+        assert mach_from_prandtl_meyer(0.0, 1.4) == 1.0
+        with pytest.raises(ValueError):
+            mach_from_prandtl_meyer(prandtl_meyer(60.0, 1.4), 1.4)
+
+    def test_array_inversion_matches_scalar(self):
+        from resa_pro.core.moc import _mach_from_prandtl_meyer_array
+
+        nu = np.array([0.0, 1e-6, 0.05, 0.4, 1.0, 1.6])
+        M = _mach_from_prandtl_meyer_array(nu, 1.25)
+        for n, m in zip(nu, M):
+            assert m == pytest.approx(mach_from_prandtl_meyer(n, 1.25), rel=1e-13)
+        with pytest.raises(ValueError):
+            _mach_from_prandtl_meyer_array(np.array([0.1, 3.0]), 1.25)
+
+    def test_inversion_callable_from_kernel(self):
+        from resa_pro.utils.jit import njit
+
+        @njit
+        def turn(M, dtheta, gamma):
+            return mach_from_prandtl_meyer(prandtl_meyer(M, gamma) + dtheta, gamma)
+
+        assert turn(2.0, 0.1, 1.2) == pytest.approx(
+            mach_from_prandtl_meyer(prandtl_meyer(2.0, 1.2) + 0.1, 1.2), rel=1e-14
+        )
+
 
 class TestMachAngle:
     """Test Mach angle calculation."""
@@ -46,6 +78,48 @@ class TestMachAngle:
         assert mach_angle(2.0) == pytest.approx(math.radians(30), rel=1e-3)
 
 
+class TestInteriorPoint:
+    def test_compatibility_relations(self):
+        from resa_pro.core.moc import MOCPoint, _solve_interior_point
+
+        gamma = 1.3
+        p1 = MOCPoint(x=0.0, y=0.02, M=2.0, theta=0.2, nu=prandtl_meyer(2.0, gamma))
+        p2 = MOCPoint(x=0.0, y=0.0, M=1.8, theta=0.0, nu=prandtl_meyer(1.8, gamma))
+        p3 = _solve_interior_point(p1, p2, gamma)
+
+        assert p3.theta + p3.nu == pytest.approx(p1.theta + p1.nu, rel=1e-14)
+        assert p3.theta - p3.nu == pytest.approx(p2.theta - p2.nu, rel=1e-14)
+        assert prandtl_meyer(p3.M, gamma) == pytest.approx(p3.nu, rel=1e-12)
+        assert p3.x > 0.0 and 0.0 < p3.y < 0.02
+
+    def test_kernel_over_mesh_columns(self):
+        from resa_pro.core.moc import MOCPOINT_DTYPE, _interior_point
+        from resa_pro.utils.jit import njit
+
+        @njit
+        def sweep(a, b, gamma):
+            out = np.empty(a.size, dtype=a.dtype)
+            for i in range(a.size):
+                x, y, M, theta, nu = _interior_point(
+                    a["x"][i], a["y"][i], a["M"][i], a["theta"][i], a["nu"][i],
+                    b["x"][i], b["y"][i], b["M"][i], b["theta"][i], b["nu"][i],
+                    gamma,
+                )
+                out["x"][i] = x
+                out["y"][i] = y
+                out["M"][i] = M
+                out["theta"][i] = theta
+                out["nu"][i] = nu
+            return out
+
+        mesh = compute_moc_nozzle(0.015, 5.0, 1.3, num_char_lines=8).mesh_points
+        a = np.ascontiguousarray(mesh[8:], dtype=MOCPOINT_DTYPE)
+        b = np.ascontiguousarray(mesh[:8], dtype=MOCPOINT_DTYPE)
+        out = sweep(a, b, 1.3)
+        np.testing.assert_allclose(out["theta"] + out["nu"], a["theta"] + a["nu"], rtol=1e-14)
+        np.testing.assert_allclose(out["theta"] - out["nu"], b["theta"] - b["nu"], atol=1e-14)
+
+
 class TestMOCSolver:
     """Test MOC nozzle solver."""
 
@@ -75,3 +149,38 @@ class TestMOCSolver:
         r10 = compute_moc_nozzle(0.015, 5.0, 1.4, num_char_lines=10)
         r20 = compute_moc_nozzle(0.015, 5.0, 1.4, num_char_lines=20)
         assert len(r20.wall_x) >= len(r10.wall_x)
+
+    def test_wall_monotonic_and_mesh_consistent(self):
+        result = compute_moc_nozzle(0.015, 10.0, 1.2, num_char_lines=40)
+        assert np.all(np.diff(result.wall_x) >= 0.015 * 0.001 * (1 - 1e-9))
+        assert len(result.mesh_points) == 80
+        axis, wall = result.mesh_points[:40], result.mesh_points[40:]
+        for pt in axis:
+            assert pt.y == 0.0 and pt.theta == 0.0
+            assert pt.M == pytest.approx(mach_from_prandtl_meyer(pt.nu, 1.2), rel=1e-13)
+        assert [pt.x for pt in wall] == result.wall_x[1:].tolist()
+        assert wall[-1].theta == 0.0
+
+    def test_min_spacing_matches_recurrence(self):
+        from resa_pro.core.moc import _enforce_min_spacing
+
+        rng = np.random.default_rng(4)
+        x = np.concatenate(([0.0], np.cumsum(rng.normal(0.01, 0.02, 200))))
+        expected = [x[0]]
+        for xi in x[1:].tolist():
+            expected.append(max(xi, expected[-1] + 1.5e-5))
+        out = _enforce_min_spacing(x, 1.5e-5)
+        np.testing.assert_allclose(out, expected, rtol=1e-14)
+        kept = out == x
+        assert kept.sum() > 50
+        assert np.array_equal(out[kept], np.array(expected)[kept])
+
+    def test_mesh_points_columnar(self):
+        from resa_pro.core.moc import MOCPOINT_DTYPE
+
+        result = compute_moc_nozzle(0.015, 5.0, 1.4, num_char_lines=10)
+        mesh = result.mesh_points
+        assert mesh.dtype == MOCPOINT_DTYPE
+        np.testing.assert_array_equal(mesh.x[10:], result.wall_x[1:])
+        np.testing.assert_array_equal(mesh["y"][:10], 0.0)
+        assert mesh[3].M == mesh.M[3]
@@ -7,6 +7,8 @@ import pytest
 
 from resa_pro.core.nozzle import (
     NozzleMethod,
+    _arc_points,
+    _bezier2,
     check_flow_separation,
     compute_nozzle_efficiency,
     conical_nozzle,
@@ -90,6 +92,35 @@ class TestParabolicNozzle:
         for i in range(len(contour.y) // 4, len(contour.y) - 1):
             assert contour.y[i + 1] >= contour.y[i] - 1e-8
 
+    def test_bezier_matches_bernstein_form(self):
+        t = np.linspace(0, 1, 50)
+        out = np.empty_like(t)
+        _bezier2(t, 0.01, 0.04, 0.1, out=out)
+        expected = (1 - t) ** 2 * 0.01 + 2 * (1 - t) * t * 0.04 + t**2 * 0.1
+        np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+    def test_arc_points_in_place(self):
+        theta = np.linspace(math.pi / 2, math.pi / 4, 20)
+        x = np.empty(25)
+        y = np.empty(25)
+        _arc_points(theta, 0.006, 0.021, x[:20], y[:20])
+        np.testing.assert_array_equal(x[:20], 0.006 * np.cos(theta))
+        np.testing.assert_array_equal(y[:20], 0.021 - 0.006 * np.sin(theta))
+
+    def test_arc_joins_parabola(self):
+        contour = parabolic_nozzle(0.015, 10, num_points=80)
+        assert contour.x[0] == pytest.approx(0.0, abs=1e-18)
+        assert contour.y[0] == pytest.approx(0.015, rel=1e-15)
+        # The shared junction point ends the arc at the initial wall angle
+        j = 80 // 4 - 1
+        slope = (contour.y[j] - contour.y[j - 1]) / (contour.x[j] - contour.x[j - 1])
+        assert math.atan(slope) == pytest.approx(contour.theta_initial, rel=0.05)
+
+    def test_exit_point(self):
+        contour = parabolic_nozzle(0.015, 10, fractional_length=0.8, num_points=101)
+        assert len(contour.x) == 100  # arc/parabola junction is shared
+        assert contour.y[-1] == pytest.approx(contour.exit_radius, rel=1e-12)
+
 
 class TestNozzleEfficiency:
     """Test nozzle efficiency calculations."""
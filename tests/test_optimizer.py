@@ -98,6 +98,19 @@ class TestDesignOptimizer:
         assert result.best.variables["x"] == pytest.approx(3.0, abs=0.1)
         assert result.best.variables["y"] == pytest.approx(2.0, abs=0.1)
 
+    def test_nelder_mead_respects_bounds(self):
+        opt = DesignOptimizer()
+        # The unconstrained optimum x = 3 lies outside the bounds
+        opt.add_variable(DesignVariable("x", -10.0, 2.0))
+        opt.add_variable(DesignVariable("y", -10.0, 10.0))
+        opt.add_objective(Objective("f", "f", direction="minimize"))
+
+        result = opt.optimize(_quadratic_eval, method="nelder-mead", max_iter=200)
+
+        assert all(-10.0 <= p.variables["x"] <= 2.0 for p in result.all_points)
+        assert result.best.variables["x"] == pytest.approx(2.0, abs=1e-3)
+        assert result.best.raw_result["x_val"] == result.best.variables["x"]
+
     def test_differential_evolution(self):
         opt = DesignOptimizer()
         opt.add_variable(DesignVariable("x", -10.0, 10.0))
@@ -111,6 +124,83 @@ class TestDesignOptimizer:
         assert result.best is not None
         assert result.best.objectives["f"] < 0.5
 
+    def test_differential_evolution_parallel(self):
+        opt = DesignOptimizer()
+        opt.add_variable(DesignVariable("x", -10.0, 10.0))
+        opt.add_variable(DesignVariable("y", -10.0, 10.0))
+        opt.add_objective(Objective("f", "f", direction="minimize"))
+
+        result = opt.optimize(
+            _quadratic_eval, method="differential_evolution", max_iter=50, seed=42, workers=2
+        )
+
+        assert result.best is not None
+        assert result.best.objectives["f"] < 0.5
+        assert result.n_evaluations == len(result.all_points) > 0
+
+    def test_parallel_de_after_parallel_kernel_exits(self, tmp_path):
+        """A worker pool started after a threaded Numba kernel must not hang at exit."""
+        import os
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        from resa_pro.utils.jit import _HAS_NUMBA
+
+        if not _HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        script = tmp_path / "run_de.py"
+        script.write_text(
+            "import numpy as np\n"
+            "from resa_pro.cli.optimize_cmd import _default_engine_eval\n"
+            "from resa_pro.optimization.optimizer import (\n"
+            "    DesignOptimizer, DesignVariable, Objective,\n"
+            ")\n"
+            "from resa_pro.utils.jit import njit, prange\n"
+            "\n"
+            "@njit(parallel=True)\n"
+            "def _double(x):\n"
+            "    out = np.empty_like(x)\n"
+            "    for i in prange(x.size):\n"
+            "        out[i] = 2.0 * x[i]\n"
+            "    return out\n"
+            "\n"
+            "if __name__ == '__main__':\n"
+            "    _double(np.ones(1000))\n"
+            "    opt = DesignOptimizer()\n"
+            "    opt.add_variable(DesignVariable('expansion_ratio', 3.0, 50.0))\n"
+            "    opt.add_objective(Objective('Isp_vac', 'Isp_vac', direction='maximize'))\n"
+            "    res = opt.optimize(\n"
+            "        _default_engine_eval, method='differential_evolution', max_iter=2,\n"
+            "        seed=1, workers=2,\n"
+            "    )\n"
+            "    print('EVALS=' + str(res.n_evaluations))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1]))
+        out = subprocess.run(
+            [sys.executable, str(script)], capture_output=True, text=True, env=env,
+            timeout=120, check=True,
+        ).stdout
+        assert "EVALS=" in out
+
+    def test_each_point_evaluated_once(self):
+        calls = []
+
+        def counting_eval(params):
+            calls.append(params)
+            return _quadratic_eval(params)
+
+        opt = DesignOptimizer()
+        opt.add_variable(DesignVariable("x", -10.0, 10.0))
+        opt.add_variable(DesignVariable("y", -10.0, 10.0))
+        opt.add_objective(Objective("f", "f", direction="minimize"))
+
+        result = opt.optimize(counting_eval, method="nelder-mead")
+
+        assert len(calls) == result.n_evaluations
+        assert result.best.objectives["f"] == min(p.objectives["f"] for p in result.all_points)
+
     def test_maximization(self):
         """Maximize -f is equivalent to minimizing f."""
         def neg_eval(params):
@@ -214,6 +304,19 @@ class TestDOE:
         for p1, p2 in zip(pts1, pts2):
             assert p1.variables["x"] == pytest.approx(p2.variables["x"])
 
+    def test_sobol_sampling(self):
+        opt = DesignOptimizer()
+        opt.add_variable(DesignVariable("x", 0.0, 10.0))
+        opt.add_variable(DesignVariable("y", 0.0, 10.0))
+        opt.add_objective(Objective("f", "f"))
+
+        points = opt.doe_sobol(_quadratic_eval, n_samples=16, seed=42)
+
+        assert len(points) == 16
+        xs = np.array([p.variables["x"] for p in points])
+        # A base-2 Sobol' set puts exactly one point in each 1/16 stratum
+        assert np.array_equal(np.sort((xs / 10.0 * 16).astype(int)), np.arange(16))
+
 
 class TestOptimizerMethods:
     """Test that different optimizer methods work correctly."""
@@ -2,9 +2,14 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from resa_pro.core.thermal import (
+    HeatFluxDistribution,
+    HeatFluxResult,
+    _mach_from_area_ratio_approx,
+    _mach_from_area_ratio_approx_array,
     adiabatic_wall_temperature,
     bartz_heat_transfer_coefficient,
     compute_heat_flux_distribution,
@@ -12,6 +17,7 @@ from resa_pro.core.thermal import (
     radiative_equilibrium_temperature,
     radiative_heat_rejection,
     wall_temperature_simple,
+    wall_temperature_simple_array,
 )
 from resa_pro.utils.constants import STEFAN_BOLTZMANN
 
@@ -62,6 +68,38 @@ class TestBartzEquation:
         )
         assert h_high > h_low
 
+    def test_optional_inputs(self):
+        """Supplied mu/cp/Mach replace the estimates; sigma can be disabled."""
+        args = (2e6, 1550, 0.03, 3100, 600, 1.21, 0.026, 2.0)
+        M = _mach_from_area_ratio_approx(2.0, 1.21)
+        assert bartz_heat_transfer_coefficient(*args, local_mach=M) == (
+            bartz_heat_transfer_coefficient(*args)
+        )
+
+        h = bartz_heat_transfer_coefficient(
+            *args, mu_ref=8e-5, cp_ref=2000.0, sigma_correction=False
+        )
+        expected = (
+            0.026 / 0.03**0.2 * (8e-5**0.2 * 2000.0 / 0.5**0.6)
+            * (2e6 / 1550) ** 0.8 * (1.0 / 2.0) ** 0.9
+        )
+        assert h == pytest.approx(expected, rel=1e-12)
+
+    def test_array_mach_matches_scalar(self):
+        ar = np.array([0.8, 1.0, 1.0005, 1.5, 4.0, 25.0])
+        M = _mach_from_area_ratio_approx_array(ar, 1.21)
+        for a, m in zip(ar, M):
+            assert m == pytest.approx(_mach_from_area_ratio_approx(a, 1.21), rel=1e-12)
+
+    def test_mach_converges_at_large_area_ratio(self):
+        from resa_pro.core.thermo import area_ratio_from_mach
+
+        ar = np.array([1.0005, 2.0, 60.0, 200.0, 1000.0])
+        M = _mach_from_area_ratio_approx_array(ar, 1.21)
+        for a, m in zip(ar, M):
+            assert area_ratio_from_mach(m, 1.21) == pytest.approx(a, rel=1e-10)
+            assert _mach_from_area_ratio_approx(a, 1.21) == pytest.approx(m, rel=1e-12)
+
 
 class TestAdiabaticWallTemperature:
     """Test adiabatic wall temperature calculation."""
@@ -115,6 +153,53 @@ class TestHeatFlux:
         assert len(results) > 0
         # All heat fluxes should be positive
         assert all(r.q_dot > 0 for r in results)
+        assert np.all(results.q_dot > 0)
+
+    def test_heat_flux_distribution_matches_scalar_path(self):
+        """Each station should equal the scalar Bartz/recovery calculation."""
+        x = [0.0, 0.01, 0.02, 0.03]
+        y = [0.02, 0.01, 0.01001, 0.015]  # includes a near-throat station
+        results = compute_heat_flux_distribution(
+            x, y, throat_radius=0.01, pc=2e6, c_star=1550, Tc=3100,
+            gamma=1.21, molar_mass=0.026, T_wall=700.0,
+        )
+        for r, xi, yi in zip(results, x, y):
+            ar = max((yi / 0.01) ** 2, 1.0)
+            M = _mach_from_area_ratio_approx(ar, 1.21) if ar > 1.001 else 1.0
+            T_aw = adiabatic_wall_temperature(3100, 1.21, M)
+            h_g = bartz_heat_transfer_coefficient(
+                2e6, 1550, 0.02, 3100, 700.0, 1.21, 0.026, ar
+            )
+            assert isinstance(r, HeatFluxResult)
+            assert type(r.x) is float and r.x == xi
+            assert r.area_ratio == pytest.approx(ar, rel=1e-12)
+            assert r.T_aw == pytest.approx(T_aw, rel=1e-12)
+            assert r.h_g == pytest.approx(h_g, rel=1e-12)
+            assert r.q_dot == pytest.approx(h_g * (T_aw - 700.0), rel=1e-12)
+            assert r.T_wg == 700.0
+
+    def test_heat_flux_distribution_columns(self):
+        results = compute_heat_flux_distribution(
+            np.linspace(0.0, 0.03, 4), [0.02, 0.01, 0.012, 0.015], throat_radius=0.01,
+            pc=2e6, c_star=1550, Tc=3100, gamma=1.21, molar_mass=0.026,
+        )
+        assert isinstance(results, HeatFluxDistribution)
+        assert results.q_dot.dtype == np.float64 and results.q_dot.shape == (4,)
+        np.testing.assert_array_equal(results.T_wg, 600.0)
+        assert results[-1] == HeatFluxResult(
+            x=0.03, area_ratio=2.25, h_g=results.h_g[3], q_dot=results.q_dot[3],
+            T_aw=results.T_aw[3], T_wg=600.0,
+        )
+        assert int(np.argmax(results.q_dot)) == 1
+        with pytest.raises(IndexError):
+            results[4]
+        assert len(HeatFluxDistribution()) == 0
+
+        tail = results[-2:]
+        assert isinstance(tail, HeatFluxDistribution)
+        np.testing.assert_array_equal(tail.q_dot, results.q_dot[2:])
+        assert tail[1] == results[3]
+        assert list(results[::2]) == [results[0], results[2]]
 
 
 class TestRadiativeCooling:
@@ -151,3 +236,16 @@ class TestWallTemperature:
         assert T_wg < 2800
         assert T_wc > 300
         assert T_wg > T_wc  # gas side hotter than coolant side
+
+    def test_array_matches_scalar(self):
+        h_g = np.array([2000.0, 5000.0, 12000.0])[:, None]
+        T_aw = np.array([2400.0, 2800.0, 3000.0])[:, None]
+        h_c = np.array([8000.0, 20000.0])
+        T_wg, T_wc, q = wall_temperature_simple_array(h_g, T_aw, h_c, 300.0, 0.002, 350.0)
+        assert T_wg.shape == T_wc.shape == q.shape == (3, 2)
+        for i in range(3):
+            for j in range(2):
+                ref = wall_temperature_simple(h_g[i, 0], T_aw[i, 0], h_c[j], 300.0, 0.002, 350.0)
+                assert T_wg[i, j] == pytest.approx(ref[0], rel=1e-12)
+                assert T_wc[i, j] == pytest.approx(ref[1], rel=1e-12)
+                assert q[i, j] == pytest.approx(heat_flux(h_g[i, 0], T_aw[i, 0], ref[0]), rel=1e-12)
@@ -2,15 +2,20 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from resa_pro.core.thermo import (
+    NozzlePerformance,
     area_ratio_from_mach,
     characteristic_velocity,
     compute_nozzle_performance,
+    compute_nozzle_performance_batch,
     exit_pressure_ratio,
     lookup_combustion,
+    lookup_combustion_batch,
     mach_from_area_ratio,
+    mach_from_area_ratio_batch,
     mass_flow_rate,
     pressure_ratio,
     specific_impulse,
@@ -139,6 +144,66 @@ class TestNozzlePerformance:
         perf_50 = compute_nozzle_performance(1.2, 0.025, 3000, 50, 2e6)
         assert perf_50.Isp_vac > perf_10.Isp_vac
 
+    def test_batch_matches_scalar(self):
+        gammas = np.array([1.15, 1.21, 1.3])
+        eps = np.array([2.0, 10.0, 80.0])
+        batch = compute_nozzle_performance_batch(gammas, 0.026, 3100, eps, 2e6)
+        for i in range(3):
+            perf = compute_nozzle_performance(gammas[i], 0.026, 3100, eps[i], 2e6)
+            assert batch.exit_mach[i] == pytest.approx(perf.exit_mach, rel=1e-10)
+            assert batch.Isp_vac[i] == pytest.approx(perf.Isp_vac, rel=1e-10)
+            assert batch.Isp_sl[i] == pytest.approx(perf.Isp_sl, rel=1e-10)
+            assert batch.c_star[i] == pytest.approx(perf.c_star, rel=1e-12)
+
+    def test_batch_performance_accessor(self):
+        batch = compute_nozzle_performance_batch(np.array([1.15, 1.3]), 0.026, 3100, 10.0, 2e6)
+        assert len(batch) == 2
+        perf = batch.performance(1)
+        assert isinstance(perf, NozzlePerformance)
+        assert type(perf.Isp_vac) is float
+        assert perf.Isp_vac == batch.Isp_vac[1]
+        assert perf.ve_vac == batch.ve_vac[1]
+
+    def test_batch_mach_matches_scalar(self):
+        ar = np.array([1.01, 1.5, 10.0, 400.0])
+        M = mach_from_area_ratio_batch(ar, 1.2)
+        for a, m in zip(ar, M):
+            assert m == pytest.approx(mach_from_area_ratio(a, 1.2), rel=1e-10)
+
+    def test_batch_mach_warm_start(self):
+        ar = np.linspace(2.0, 40.0, 20)
+        cold = mach_from_area_ratio_batch(ar, 1.2)
+        # Seed each point with its neighbour's solution, as a sweep would
+        warm = mach_from_area_ratio_batch(ar, 1.2, initial=np.roll(cold, 1))
+        np.testing.assert_allclose(warm, cold, rtol=1e-12)
+
+    def test_scalar_newton_matches_area_relation(self):
+        for ar in (1.0001, 1.5, 10.0, 400.0, 5000.0):
+            M = mach_from_area_ratio(ar, 1.25)
+            assert M > 1.0
+            assert area_ratio_from_mach(M, 1.25) == pytest.approx(ar, rel=1e-10)
+        assert mach_from_area_ratio(1.0, 1.25) == 1.0
+
+    def test_subsonic_newton_matches_area_relation(self):
+        for ar in (1.0001, 1.6875, 10.0, 1e4):
+            M = mach_from_area_ratio(ar, 1.25, supersonic=False)
+            assert 0.0 < M < 1.0
+            assert area_ratio_from_mach(M, 1.25) == pytest.approx(ar, rel=1e-12)
+        assert mach_from_area_ratio(1.0, 1.25, supersonic=False) == 1.0
+
+    def test_subsonic_falls_back_next_to_throat(self):
+        from resa_pro.core.thermo import _solve_subsonic_mach
+
+        ar = 1.0 + 1e-10
+        assert math.isnan(_solve_subsonic_mach(ar, 1.21))
+        M = mach_from_area_ratio(ar, 1.21, supersonic=False)
+        assert M < 1.0
+        assert area_ratio_from_mach(M, 1.21) == pytest.approx(ar, rel=1e-12)
+
+    def test_batch_mach_rejects_subsonic_area_ratio(self):
+        with pytest.raises(ValueError):
+            mach_from_area_ratio_batch(np.array([0.9, 2.0]), 1.2)
+
 
 class TestCombustionLookup:
     """Test combustion data lookup."""
@@ -156,3 +221,31 @@ class TestCombustionLookup:
     def test_lookup_missing_raises(self):
         with pytest.raises(KeyError):
             lookup_combustion("xenon", "lithium")
+
+    def test_batch_lookup_matches_scalar(self):
+        mrs = np.array([2.0, 3.7, 4.0, 4.26, 9.0])
+        batch = lookup_combustion_batch("n2o", "ethanol", mrs)
+        for i, mr in enumerate(mrs):
+            comb = lookup_combustion("n2o", "ethanol", mixture_ratio=mr)
+            assert batch["mixture_ratio"][i] == comb.mixture_ratio
+            assert batch["c_star"][i] == comb.c_star
+            assert batch["gamma"][i] == comb.gamma
+
+    def test_lookup_case_insensitive(self):
+        assert lookup_combustion("N2O", "Ethanol", 4.0) == lookup_combustion("n2o", "ethanol", 4.0)
+
+    def test_lookup_tie_keeps_first_entry(self):
+        # 3.5 is equidistant from the 3.0 and 4.0 entries
+        assert lookup_combustion("n2o", "ethanol", mixture_ratio=3.5).mixture_ratio == 3.0
+        batch = lookup_combustion_batch("n2o", "ethanol", np.array([3.5]))
+        assert batch["mixture_ratio"][0] == 3.0
+
+    def test_lookup_matches_nearest_entry_search(self):
+        from resa_pro.core.thermo import _COMBUSTION_TABLE
+
+        for ox, fuel in {(d.oxidizer, d.fuel) for d in _COMBUSTION_TABLE}:
+            entries = [d for d in _COMBUSTION_TABLE if (d.oxidizer, d.fuel) == (ox, fuel)]
+            assert lookup_combustion(ox, fuel) == max(entries, key=lambda d: d.c_star)
+            for mr in np.linspace(0.0, 8.0, 161).tolist():
+                nearest = min(entries, key=lambda d: abs(d.mixture_ratio - mr))
+                assert lookup_combustion(ox, fuel, mr) is nearest
@@ -57,6 +57,22 @@ class TestUncertainParameter:
 
         assert np.all(samples > 0)  # lognormal is always positive
 
+    @pytest.mark.parametrize(
+        "param",
+        [
+            UncertainParameter("x", 10.0, Distribution.NORMAL, std=1.0),
+            UncertainParameter("x", 5.0, Distribution.UNIFORM, lower=0.0, upper=10.0),
+            UncertainParameter("x", 5.0, Distribution.TRIANGULAR, lower=0.0, upper=10.0, mode=3.0),
+            UncertainParameter("x", 10.0, Distribution.LOGNORMAL, std=2.0),
+        ],
+    )
+    def test_ppf_matches_sampling_distribution(self, param):
+        """Inverse-CDF samples have the same mean as direct sampling."""
+        u = (np.arange(20000) + 0.5) / 20000
+        direct = param.sample(np.random.default_rng(0), 200000)
+        assert np.mean(param.ppf(u)) == pytest.approx(np.mean(direct), rel=0.01)
+        assert np.all(np.diff(param.ppf(u)) >= 0)  # monotone
+
 
 class TestOutputStatistics:
     """Test statistics computation."""
@@ -88,6 +104,18 @@ class TestOutputStatistics:
         assert stats.ci_95_lower < -1.5
         assert stats.ci_95_upper > 1.5
 
+    def test_percentiles_match_numpy(self):
+        data = np.random.default_rng(1).exponential(size=501)
+        stats = OutputStatistics.from_samples("test", data)
+
+        assert stats.median == pytest.approx(np.median(data))
+        assert stats.p05 == pytest.approx(np.percentile(data, 5))
+        assert stats.p25 == pytest.approx(np.percentile(data, 25))
+        assert stats.p75 == pytest.approx(np.percentile(data, 75))
+        assert stats.p95 == pytest.approx(np.percentile(data, 95))
+        assert stats.ci_95_lower == pytest.approx(np.percentile(data, 2.5))
+        assert stats.ci_95_upper == pytest.approx(np.percentile(data, 97.5))
+
 
 class TestUncertaintyAnalysis:
     """Test the Monte Carlo UQ engine."""
@@ -181,3 +209,126 @@ class TestUncertaintyAnalysis:
 
         assert "y" in result.output_statistics
         assert "y2" in result.output_statistics
+
+    def test_batch_func_matches_scalar(self):
+        def linear_batch(params):
+            return {"y": 2.0 * params["x"] + 3.0 * params["z"], "y2": params["x"] ** 2}
+
+        uq = UncertaintyAnalysis()
+        uq.add_parameter(UncertainParameter("x", 5.0, Distribution.NORMAL, std=1.0))
+        uq.add_parameter(UncertainParameter("z", 3.0, Distribution.NORMAL, std=0.5))
+        uq.add_output("y")
+        uq.add_output("y2")
+
+        scalar = uq.run(_linear_eval, n_samples=300, seed=7)
+        batch = uq.run(n_samples=300, seed=7, batch_func=linear_batch)
+
+        for key in ("y", "y2"):
+            assert batch.output_statistics[key].mean == pytest.approx(
+                scalar.output_statistics[key].mean
+            )
+            assert batch.output_statistics[key].std == pytest.approx(
+                scalar.output_statistics[key].std
+            )
+        assert batch.correlation_matrix["x"]["y"] == pytest.approx(
+            scalar.correlation_matrix["x"]["y"]
+        )
+
+    def test_batch_func_nonfinite_counted_as_failed(self):
+        def batch(params):
+            x = params["x"]
+            return {"y": np.where(x > 6.0, np.nan, x)}
+
+        uq = UncertaintyAnalysis()
+        uq.add_parameter(UncertainParameter("x", 5.0, Distribution.NORMAL, std=2.0))
+        uq.add_output("y")
+
+        result = uq.run(n_samples=500, seed=42, batch_func=batch)
+        assert result.n_failed > 0
+        assert result.output_statistics["y"].max_val <= 6.0
+
+    def test_run_requires_an_evaluator(self):
+        uq = UncertaintyAnalysis()
+        uq.add_parameter(UncertainParameter("x", 5.0, Distribution.NORMAL, std=1.0))
+        uq.add_output("y")
+        with pytest.raises(ValueError):
+            uq.run(n_samples=10)
+
+    @pytest.mark.parametrize("sampling", ["lhs", "sobol"])
+    def test_stratified_sampling(self, sampling):
+        uq = UncertaintyAnalysis()
+        uq.add_parameter(UncertainParameter("x", 5.0, Distribution.NORMAL, std=1.0))
+        uq.add_parameter(UncertainParameter("z", 3.0, Distribution.NORMAL, std=0.5))
+        uq.add_output("y")
+
+        result = uq.run(_linear_eval, n_samples=256, seed=42, sampling=sampling)
+
+        assert result.n_samples == 256
+        # Stratified points pin the mean far tighter than iid at this N
+        assert result.output_statistics["y"].mean == pytest.approx(19.0, abs=0.05)
+        assert result.output_statistics["y"].std == pytest.approx(2.5, rel=0.05)
+
+    def test_unknown_sampling_raises(self):
+        uq = UncertaintyAnalysis()
+        uq.add_parameter(UncertainParameter("x", 5.0, Distribution.NORMAL, std=1.0))
+        uq.add_output("y")
+        with pytest.raises(ValueError):
+            uq.run(_linear_eval, n_samples=10, sampling="grid")
+
+    def test_parallel_workers_match_serial(self):
+        uq = UncertaintyAnalysis()
+        uq.add_parameter(UncertainParameter("x", 5.0, Distribution.NORMAL, std=1.0))
+        uq.add_parameter(UncertainParameter("z", 3.0, Distribution.NORMAL, std=0.5))
+        uq.add_output("y")
+
+        serial = uq.run(_linear_eval, n_samples=200, seed=3)
+        parallel = uq.run(_linear_eval, n_samples=200, seed=3, workers=2)
+
+        np.testing.assert_array_equal(
+            parallel.output_statistics["y"].samples, serial.output_statistics["y"].samples
+        )
+
+    def test_workers_after_parallel_kernel_exits(self, tmp_path):
+        """A worker pool started after a threaded Numba kernel must not hang at exit."""
+        import os
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        from resa_pro.utils.jit import _HAS_NUMBA
+
+        if not _HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        script = tmp_path / "run_uq.py"
+        script.write_text(
+            "import numpy as np\n"
+            "from resa_pro.cli.optimize_cmd import _default_engine_eval\n"
+            "from resa_pro.optimization.uq import (\n"
+            "    Distribution, UncertainParameter, UncertaintyAnalysis,\n"
+            ")\n"
+            "from resa_pro.utils.jit import njit, prange\n"
+            "\n"
+            "@njit(parallel=True)\n"
+            "def _double(x):\n"
+            "    out = np.empty_like(x)\n"
+            "    for i in prange(x.size):\n"
+            "        out[i] = 2.0 * x[i]\n"
+            "    return out\n"
+            "\n"
+            "if __name__ == '__main__':\n"
+            "    _double(np.ones(1000))\n"
+            "    uq = UncertaintyAnalysis()\n"
+            "    uq.add_parameter(\n"
+            "        UncertainParameter('expansion_ratio', 10.0, Distribution.NORMAL, std=1.0)\n"
+            "    )\n"
+            "    uq.add_output('Isp_vac')\n"
+            "    res = uq.run(_default_engine_eval, n_samples=16, seed=1, workers=2)\n"
+            "    print('FAILED=' + str(res.n_failed))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1]))
+        out = subprocess.run(
+            [sys.executable, str(script)], capture_output=True, text=True, env=env,
+            timeout=120, check=True,
+        ).stdout
+        assert "FAILED=0" in out
@@ -74,6 +74,14 @@ class TestInterpolation:
         y = np.array([10, 20, 30], dtype=float)
         assert linear_interp_1d(x, y, 0) == pytest.approx(10.0)
 
+    def test_linear_outside_range(self):
+        x = np.array([0, 1, 2], dtype=float)
+        y = np.array([10, 20, 40], dtype=float)
+        q = np.array([-1.0, 0.5, 3.0])
+        np.testing.assert_allclose(linear_interp_1d(x, y, q), [10.0, 15.0, 40.0])
+        np.testing.assert_allclose(linear_interp_1d(x, y, q, extrapolate=True), [0.0, 15.0, 60.0])
+        assert linear_interp_1d(x, y, 3.0, extrapolate=True) == pytest.approx(60.0)
+
     def test_cubic(self):
         x = np.array([0, 1, 2, 3, 4], dtype=float)
         y = x**2
@@ -126,3 +134,49 @@ class TestValidation:
         result = ValidationResult()
         validate_range("test", 5, 0, 3, result)
         assert not result.is_valid
+
+
+class TestJit:
+    def test_njit_bare_and_with_options(self):
+        from resa_pro.utils.jit import njit
+
+        @njit
+        def add(a, b):
+            return a + b
+
+        @njit(cache=False)
+        def mul(a, b):
+            return a * b
+
+        assert add(2.0, 3.0) == pytest.approx(5.0)
+        assert mul(2.0, 3.0) == pytest.approx(6.0)
+
+    def test_prange_iterates_like_range(self):
+        from resa_pro.utils.jit import prange
+
+        assert list(prange(3)) == [0, 1, 2]
+
+
+class TestFriction:
+    def test_laminar(self):
+        from resa_pro.utils.friction import darcy_friction_factor
+
+        assert darcy_friction_factor(1000.0, 0.01, 1e-6) == pytest.approx(0.064)
+        assert darcy_friction_factor(0.0, 0.01, 1e-6) == pytest.approx(64.0)
+
+    def test_turbulent_swamee_jain(self):
+        from resa_pro.utils.friction import darcy_friction_factor
+
+        # eps/D = 1.5e-4 at Re = 1e5: Colebrook gives f ≈ 0.0187
+        f = darcy_friction_factor(1e5, 0.01, 1.5e-6)
+        assert f == pytest.approx(0.0187, rel=0.02)
+        assert darcy_friction_factor(1e5, 0.01, 1e-4) > f
+
+    def test_array_matches_scalar(self):
+        from resa_pro.utils.friction import darcy_friction_factor, darcy_friction_factor_array
+
+        Re = np.array([0.0, 500.0, 2299.0, 2300.0, 1e4, 1e6])
+        f = darcy_friction_factor_array(Re, 2e-3, 3e-6)
+        for re, fi in zip(Re, f):
+            assert fi == pytest.approx(darcy_friction_factor(re, 2e-3, 3e-6), rel=1e-12)
+        assert isinstance(darcy_friction_factor_array(1e4, 2e-3, 3e-6), float)